@@ -1,17 +1,16 @@
 # -*- coding: utf-8 -*-
 import locale
 import logging
-import readline
-import subprocess
 import time
-import sys
 import os
 from dataclasses import dataclass
 from enum import Enum
 from typing import List, Optional, Sequence, Union
-import spacy
-
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+import motor
+import sanacion
+import via_rapida
+from conjugacion import LEXICO_CONJUGACION
+from modelos import Anticipador, Cascada, ModeloPerezoso
 
 # --- EXCEPCIÓN PARA REINICIO ---
 class ReiniciarAnalisis(Exception):
@@ -22,11 +21,12 @@ class ReiniciarAnalisis(Exception):
 NEGRITA = '\033[1m'
 RESET = '\033[0m'
 
-# Intentamos cargar el modelo de spaCy. Si falla, el programa funcionará en modo manual.
-try:
-    nlp = spacy.load("es_core_news_sm")
-except OSError:
-    nlp = None
+# Modelos de spaCy, del más liviano al más pesado (los que no estén instalados se saltan).
+# Se cargan en segundo plano. Si no hay ninguno, el programa funcionará en modo manual.
+MODELOS_CASCADA = os.environ.get("VENDLER_CASCADA", "es_core_news_sm,es_core_news_md,es_core_news_lg").split(",")
+niveles_nlp = [ModeloPerezoso(nombre.strip(), componentes={sanacion.NOMBRE_COMPONENTE: sanacion.agregar})
+               for nombre in MODELOS_CASCADA]
+modelo_nlp = niveles_nlp[0]
 
 class Respuesta(Enum):
     SI = ["sí", "si", "s"]
@@ -69,60 +69,9 @@ class DatosClause:
     rasgos_obtenidos: bool = False
 
 
-ESTAR = {
-    '1s': "estoy", '2s': "estás", '3s': "está",
-    '1p': "estamos", '2p': "están/estáis", '3p': "están"
-}
-
-ESTAR_PRETERITO = {
-    '1s': "estuve", '2s': "estuviste", '3s': "estuvo",
-    '1p': "estuvimos", '2p': "estuvieron/estuvisteis", '3p': "estuvieron"
-}
-
-ESTAR_SUBJUNTIVO = {
-    '1s': "estuviera", '2s': "estuvieras", '3s': "estuviera",
-    '1p': "estuviéramos", '2p': "estuvieran/estuvierais", '3p': "estuvieran"
-}
-
-HABER = {
-    '1s': "he", '2s': "has", '3s': "ha",
-    '1p': "hemos", '2p': "han/habeis", '3p': "han"
-}
-
-DEJAR = {
-    '1s': "dejara", '2s': "dejaras", '3s': "dejara",
-    '1p': "dejáramos", '2p': "dejaran/dejarais", '3p': "dejaran"
-}
-
-# Diccionario ampliado de irregulares y cambios de raíz (e>i, o>u)
-IRREGULARES = {
-    # Irregulares puros y participios fuertes
-    "abrir": {"pp": "abierto"}, "cubrir": {"pp": "cubierto"},
-    "decir": {"ger": "diciendo", "pp": "dicho"}, "escribir": {"pp": "escrito"},
-    "hacer": {"pp": "hecho"}, "freír": {"pp": "frito"},
-    "imprimir": {"pp": "impreso"}, "morir": {"ger": "muriendo", "pp": "muerto"},
-    "poner": {"pp": "puesto"}, "proveer": {"pp": "provisto"},
-    "romper": {"pp": "roto"}, "satisfacer": {"pp": "satisfecho"},
-    "soltar": {"pp": "suelto"}, "ver": {"pp": "visto"},
-    "volver": {"pp": "vuelto"}, "ir": {"ger": "yendo", "pp": "ido"},
-    "ser": {"ger": "siendo", "pp": "sido"}, "pudrir": {"pp": "podrido"},
-    "leer": {"ger": "leyendo", "pp": "leído"}, "traer": {"ger": "trayendo", "pp": "traído"},
-    "caer": {"ger": "cayendo", "pp": "caído"}, "oír": {"ger": "oyendo", "pp": "oído"},
-    
-    # Cambios vocálicos (e > i) en gerundio
-    "pedir": {"ger": "pidiendo"}, "sentir": {"ger": "sintiendo"},
-    "mentir": {"ger": "mintiendo"}, "seguir": {"ger": "siguiendo"},
-    "conseguir": {"ger": "consiguiendo"}, "perseguir": {"ger": "persiguiendo"},
-    "servir": {"ger": "sirviendo"}, "vestir": {"ger": "vistiendo"},
-    "repetir": {"ger": "repitiendo"}, "elegir": {"ger": "eligiendo"},
-    "corregir": {"ger": "corregiendo"}, "reír": {"ger": "riendo"},
-    "sonreír": {"ger": "sonriendo"}, "venir": {"ger": "viniendo"},
-    "competir": {"ger": "compitiendo"}, "medir": {"ger": "midiendo"},
-    "despedir": {"ger": "despidiendo"}, "impedir": {"ger": "impidiendo"},
-    
-    # Cambios vocálicos (o > u) en gerundio
-    "dormir": {"ger": "durmiendo"}, "poder": {"ger": "pudiendo"}
-}
+def auxiliar(infinitivo: str, tiempo: str, persona_numero: str) -> str:
+    """Auxiliar de una perífrasis (2p: «ustedes/vosotros»), de la instantánea vigente de conjugacion.py."""
+    return LEXICO_CONJUGACION.actual().tabla_perifrasis(infinitivo, tiempo)[persona_numero]
 
 
 def set_spanish_locale():
@@ -145,225 +94,96 @@ def mensaje_reinicio() -> None:
 
 
 def peticion(prompt: str) -> str:
-    import sys
-    readline.set_startup_hook(lambda: readline.insert_text(""))
-    try:
-        if "\n" in prompt or len(prompt) > 60:
-            print(prompt, end="", flush=True)
-            user = input().strip()
-        else:
-            user = input(prompt).strip()
-        
-        # --- COMANDO DE RESCATE ---
-        if user == "...":
-            raise ReiniciarAnalisis()
-            
-        return user.encode('utf-8').decode('utf-8')
-    finally:
-        readline.set_startup_hook()
-        
+    return motor.peticion(PAQUETE, prompt)
+
 
 def respuesta_si_no(pregunta: str) -> bool:
-    while True:
-        try:
-            respuesta = peticion(pregunta).lower()
-            if respuesta in Respuesta.SI.value:
-                return True
-            elif respuesta in Respuesta.NO.value:
-                return False
-            print("\nPor favor, entrega una respuesta válida: «sí (s)» o «no (n)».")
-        except ReiniciarAnalisis:
-            raise
-        except Exception as e:
-            logging.error(f"Error al obtener respuesta: {e}")
+    return motor.respuesta_si_no(PAQUETE, pregunta)
 
 
 def pedir_respuesta_multiple(pregunta: str, opciones: Sequence[Union[str, Sequence[str]]], prompt: str) -> str:
-    while True:
-        try:
-            respuesta = peticion(f"{pregunta} {prompt}").lower()
-            for opcion in opciones:
-                if isinstance(opcion, Sequence) and not isinstance(opcion, str):
-                    if respuesta in opcion:
-                        return opcion[0]
-                elif respuesta == opcion:
-                    return opcion
-            print("\nPor favor, escribe una respuesta válida.")
-        except ReiniciarAnalisis:
-            raise
-        except Exception as e:
-            logging.error(f"Error al obtener respuesta: {e}")
+    return motor.respuesta_multiple(PAQUETE, pregunta, opciones, prompt)
 
 
 # --- FUNCIONES DE ANÁLISIS AUTOMÁTICO ---
 
 def generar_formas_verbales(infinitivo):
-    """Genera gerundio y participio a partir del infinitivo usando reglas y diccionario de excepciones."""
-    inf = infinitivo.lower().strip()
-    
-    # 1. Buscamos en el diccionario de irregulares
-    ger = IRREGULARES.get(inf, {}).get("ger", "")
-    part = IRREGULARES.get(inf, {}).get("pp", "")
-
-    # 2. Generar GERUNDIO si no existe
-    if not ger:
-        # Caso especial: Verbos en -uir (huir -> huyendo), excepto -guir/-quir
-        if inf.endswith("uir") and not inf.endswith(("guir", "quir", "güir")):
-            ger = inf[:-2] + "yendo"
-        
-        # Reglas estándar (ahora sí funcionan como alternativas si no es -uir)
-        elif inf.endswith("ar"): 
-            ger = inf[:-2] + "ando"
-        elif inf.endswith(("er", "ir")): 
-            ger = inf[:-2] + "iendo"
+    """Gerundio y participio del infinitivo según su modelo de conjugación ("", "" si no es un infinitivo)."""
+    return LEXICO_CONJUGACION.actual().formas_no_finitas(infinitivo.lower().strip())
 
-    # 3. Generar PARTICIPIO si no existe
-    if not part:
-        if inf.endswith("ar"): 
-            part = inf[:-2] + "ado"
-        elif inf.endswith(("er", "ir")): 
-            part = inf[:-2] + "ido"
+def analizar_automaticamente(oracion, datos_clausula):
+    """
+    Analiza la cláusula con spaCy y extrae sus datos (ver extraer_datos).
+    «oracion» también puede venir ya analizada (ej: una conllu.OracionConllu): entonces no se usa el modelo.
+    Devuelve: (Éxito, Verbo_Visual, Infinitivo_Limpio)
+    """
+    if isinstance(oracion, str):
+        # Cláusulas cortas con un verbo conocido: sin spaCy
+        rapido = via_rapida.analizar(oracion, datos_clausula, generar_formas_verbales)
+        if rapido is not None:
+            return rapido
+    doc = anticipador_nlp.obtener(oracion) if isinstance(oracion, str) else oracion
+    if doc is None: return False, "", ""
+    return extraer_datos(doc, datos_clausula)
 
-    return ger, part
 
-def analizar_automaticamente(oracion, datos_clausula):
+def confianza_analisis(doc) -> int:
+    """
+    0: no se encontró verbo. 1: hay verbo pero el análisis es dudoso (el verbo no es una
+    raíz VERB/AUX, el lema no parece un infinitivo o no se pudieron generar sus formas).
+    2: confiable. Con menos de 2 la cascada prueba el modelo siguiente.
+    """
+    sanado = sanacion.leer(doc)
+    if sanado is None:
+        return 0
+    verbo = doc[sanado.indice]
+    if verbo.dep_ != "ROOT" or verbo.pos_ not in ("VERB", "AUX"):
+        return 1
+    if not sanado.lema.endswith(("ar", "er", "ir", "ír")):
+        return 1
+    ger, part = generar_formas_verbales(sanado.lema)
+    return 2 if ger and part else 1
+
+
+cascada_nlp = Cascada(niveles_nlp, confianza_analisis)
+anticipador_nlp = Anticipador(cascada_nlp.analizar)
+
+
+def anticipar_analisis(oracion: str) -> None:
+    """Empieza a analizar la cláusula en segundo plano, salvo que la resuelva la vía rápida."""
+    if via_rapida.analizar(oracion, DatosClause(), generar_formas_verbales) is None:
+        anticipador_nlp.anticipar(oracion)
+
+
+def extraer_datos(doc, datos_clausula):
     """
-    Usa spaCy con reglas morfológicas expandidas para cubrir 
-    todas las personas, INCLUYENDO EL VOSOTROS Y PRETÉRITOS FUERTES (estuvisteis -> estar).
+    Usa un Doc ya analizado: el verbo, su lema sanado (pretéritos fuertes, vosotros...),
+    los clíticos y la persona vienen del componente de sanacion.py.
     Devuelve: (Éxito, Verbo_Visual, Infinitivo_Limpio)
     """
-    if not nlp: return False, "", ""
-    
-    doc = nlp(oracion)
-    
-    verbo_token = None
-    
-    # 1. Búsqueda prioritaria
-    for token in doc:
-        if token.dep_ == "ROOT" and token.pos_ in ["VERB", "AUX"]:
-            verbo_token = token
-            break
-            
-    # 2. Búsqueda secundaria
-    if not verbo_token:
-        for token in doc:
-            if token.pos_ in ["VERB", "AUX"]:
-                verbo_token = token
-                break
-    
-    # 3. Búsqueda Agresiva
-    if not verbo_token and len(doc) <= 4:
-        for token in doc:
-            if token.dep_ == "ROOT" and token.pos_ not in ["PRON", "DET", "ADP", "CCONJ"]:
-                verbo_token = token
-                break
-
-    if not verbo_token: return False, "", ""
-
-    # --- Lógica de Clíticos ---
-    idx = verbo_token.i
-    cliticos_encontrados = []
-    
-    for i in range(idx - 1, max(idx - 5, -1), -1):
-        token = doc[i]
-        if token.pos_ == "PRON" and token.text.lower() in ["me", "te", "se", "nos", "os", "le", "les", "lo", "los", "la", "las"]:
-            cliticos_encontrados.insert(0, token.text.lower())
-        else:
-            break
-            
-    # --- SANACIÓN DE LEMAS EXPANDIDA ---
-    lema_limpio = verbo_token.lemma_.lower()
-    texto_verbo = verbo_token.text.lower()
-    
-    # DICCIONARIO DE RAÍCES FUERTES (Pretéritos Irregulares)
-    PRETERITOS_FUERTES = {
-        "estuv": "estar", "tuv": "tener", "anduv": "andar",
-        "pud": "poder", "pus": "poner", "sup": "saber",
-        "hic": "hacer", "hiz": "hacer", "quis": "querer",
-        "vin": "venir", "dij": "decir", "traj": "traer"
-    }
-    
-    lemma_fixed = False
-
-    # 1. Revisar raíces irregulares primero
-    for raiz, infinitivo_real in PRETERITOS_FUERTES.items():
-        if texto_verbo.startswith(raiz):
-            lema_limpio = infinitivo_real
-            lemma_fixed = True
-            break
-    
-    # 2. Si no es irregular fuerte y el lema falla, heurística manual
-    if not lemma_fixed and not lema_limpio.endswith(("ar", "er", "ir", "ír")): 
-        
-        # Singular
-        if texto_verbo.endswith("é"):       lema_limpio = texto_verbo[:-1] + "ar"
-        elif texto_verbo.endswith("aste"):  lema_limpio = texto_verbo[:-4] + "ar"
-        elif texto_verbo.endswith("ó"):     lema_limpio = texto_verbo[:-1] + "ar"
-        elif texto_verbo.endswith("í"):     lema_limpio = texto_verbo[:-1] + "er"
-        elif texto_verbo.endswith("iste"):  lema_limpio = texto_verbo[:-4] + "er"
-            
-        # Plural
-        elif texto_verbo.endswith("amos"):  lema_limpio = texto_verbo[:-4] + "ar"
-        elif texto_verbo.endswith("aron"):  lema_limpio = texto_verbo[:-4] + "ar"
-        elif texto_verbo.endswith("imos"):  lema_limpio = texto_verbo[:-4] + "er"
-        elif texto_verbo.endswith("ieron"): lema_limpio = texto_verbo[:-5] + "er"
-            
-        # VOSOTROS
-        elif texto_verbo.endswith("asteis"): lema_limpio = texto_verbo[:-6] + "ar"
-        elif texto_verbo.endswith("isteis"): lema_limpio = texto_verbo[:-6] + "er"
-
-    suffix = "".join(cliticos_encontrados)
-    datos_clausula.infinitivo = lema_limpio + suffix 
-    
+    sanado = sanacion.leer(doc)
+    if sanado is None: return False, "", ""
+
+    idx = sanado.indice
+    lema_limpio = sanado.lema
+    datos_clausula.infinitivo = lema_limpio + sanado.cliticos
+
     # Generar formas
     ger, part = generar_formas_verbales(lema_limpio)
-    
+
     if not ger or not part:
         return False, "", ""
 
     datos_clausula.gerundio = ger
     datos_clausula.participio = part
-    
-    # --- DETECCIÓN DE PERSONA EXPANDIDA ---
-    person_detected = None
-    
-    if texto_verbo.endswith(("é", "í")):
-        person_detected = "1s"
-    elif texto_verbo.endswith(("aste", "iste", "as", "es")): 
-        person_detected = "2s"
-    elif texto_verbo.endswith("ó"):
-        person_detected = "3s"
-    elif texto_verbo.endswith(("amos", "emos", "imos")):
-        person_detected = "1p"
-    elif texto_verbo.endswith(("asteis", "isteis", "áis", "éis", "ís")):
-        person_detected = "2p"
-    elif texto_verbo.endswith(("aron", "ieron", "an", "en")):
-        person_detected = "3p"
-        
-    if person_detected:
-        datos_clausula.persona_numero = person_detected
-    else:
-        # Fallback a spaCy
-        morph = verbo_token.morph.to_dict()
-        persona = morph.get("Person", "3")
-        numero = morph.get("Number", "Sing")
-        mapper_pn = {("1", "Sing"): "1s", ("2", "Sing"): "2s", ("3", "Sing"): "3s",
-                     ("1", "Plur"): "1p", ("2", "Plur"): "2p", ("3", "Plur"): "3p"}
-        
-        sujeto_txt = doc[:idx].text.lower()
-        if "yo" in sujeto_txt.split(): datos_clausula.persona_numero = "1s"
-        elif "tú" in sujeto_txt.split() or "vos" in sujeto_txt.split(): datos_clausula.persona_numero = "2s"
-        elif "nosotros" in sujeto_txt.split(): datos_clausula.persona_numero = "1p"
-        elif "vosotros" in sujeto_txt.split(): datos_clausula.persona_numero = "2p"
-        elif "ellos" in sujeto_txt.split() or "ellas" in sujeto_txt.split(): datos_clausula.persona_numero = "3p"
-        else: datos_clausula.persona_numero = mapper_pn.get((persona, numero), "3s")
+    datos_clausula.persona_numero = sanado.persona_numero
 
     # División Posicional
     datos_clausula.sujeto = doc[:idx].text.strip()
     datos_clausula.complementos = doc[idx+1:].text.strip()
 
     # Devolvemos True, el verbo visual, Y EL LEMA LIMPIO
-    return True, verbo_token.text, lema_limpio
+    return True, doc[idx].text, lema_limpio
 
 def obtener_info_clausula(oracion: str, datos_clausula: DatosClause) -> DatosClause:
     
@@ -425,52 +245,28 @@ def obtener_info_clausula(oracion: str, datos_clausula: DatosClause) -> DatosCla
 
 
 def construir_perif_gerundio(tiempo: str, datos_clausula: DatosClause) -> str:
-    forma_estar = ESTAR_PRETERITO[datos_clausula.persona_numero] if tiempo == 'preterito' else ESTAR[datos_clausula.persona_numero]
-    return " ".join(parte for parte in [datos_clausula.sujeto, f"{forma_estar} {datos_clausula.gerundio}", datos_clausula.complementos] if parte)
+    forma_estar = auxiliar("estar", tiempo, datos_clausula.persona_numero)
+    return motor.unir_perifrasis(datos_clausula.sujeto, f"{forma_estar} {datos_clausula.gerundio}", datos_clausula.complementos)
 
 def construir_perif_gerundio_subj(datos_clausula: DatosClause) -> str:
-    forma_estar = ESTAR_SUBJUNTIVO[datos_clausula.persona_numero]
-    return " ".join(parte for parte in [datos_clausula.sujeto, f"{forma_estar} {datos_clausula.gerundio}", datos_clausula.complementos] if parte)
+    forma_estar = auxiliar("estar", "subjuntivo_imperfecto", datos_clausula.persona_numero)
+    return motor.unir_perifrasis(datos_clausula.sujeto, f"{forma_estar} {datos_clausula.gerundio}", datos_clausula.complementos)
 
 def construir_perif_participio(datos_clausula: DatosClause) -> str:
-    forma_haber = HABER[datos_clausula.persona_numero]
-    return " ".join(parte for parte in [datos_clausula.sujeto, f"{forma_haber} {datos_clausula.participio}", datos_clausula.complementos] if parte)
+    forma_haber = auxiliar("haber", "presente", datos_clausula.persona_numero)
+    return motor.unir_perifrasis(datos_clausula.sujeto, f"{forma_haber} {datos_clausula.participio}", datos_clausula.complementos)
 
 def construir_perif_infinitivo(datos_clausula: DatosClause) -> str:
-    forma_dejar = DEJAR[datos_clausula.persona_numero]
-    return " ".join(parte for parte in [f"{forma_dejar} de {datos_clausula.infinitivo}", datos_clausula.complementos] if parte)
+    forma_dejar = auxiliar("dejar", "subjuntivo_imperfecto", datos_clausula.persona_numero)
+    return motor.unir_perifrasis(f"{forma_dejar} de {datos_clausula.infinitivo}", datos_clausula.complementos)
 
 
 def determinar_subtipo(pred_es: RasgosPred) -> Optional[str]:
-    if pred_es.estativo:
-        return "ESTADO"
-    elif pred_es.puntual and pred_es.telico:
-        return "LOGRO"
-    elif pred_es.puntual and not pred_es.telico:
-        return "SEMELFACTIVO"    
-    elif not pred_es.puntual and pred_es.telico and pred_es.dinamico:
-        return "REALIZACION_ACTIVA"
-    elif not pred_es.puntual and not pred_es.telico and pred_es.dinamico:
-        return "ACTIVIDAD"
-    elif not pred_es.puntual and pred_es.telico and not pred_es.dinamico:
-        return "REALIZACION"
-    elif not pred_es.puntual and not pred_es.telico and not pred_es.dinamico:
-        return "PROCESO"
-    else:
-        return None
+    return motor.determinar_subtipo(PAQUETE, pred_es)
 
 
 def determinar_aktionsart(pred_es: RasgosPred) -> Optional[Aktionsart]:
-    subtipo = determinar_subtipo(pred_es)
-    if subtipo is None:
-        return None
-    if pred_es.causativo:
-        if subtipo in ["REALIZACION", "REALIZACION_ACTIVA", "ACTIVIDAD"]:
-            return Aktionsart[f"{subtipo}_CAUSATIVA"]
-        else:
-            return Aktionsart[f"{subtipo}_CAUSATIVO"]
-    else:
-        return Aktionsart[subtipo]
+    return motor.determinar_aktionsart(PAQUETE, pred_es)
         
 
 #Pruebas de Aktionsart en funciones específicas
@@ -548,59 +344,11 @@ def prueba_telicidad(datos_clausula: DatosClause) -> bool:
     
 
 def obtener_rasgos_akt(oracion: str, datos_clausula: DatosClause) -> Union[RasgosPred, None]:
-    pred_es = RasgosPred()
     datos_clausula.rasgos_obtenidos = False
+    return motor.obtener_rasgos_akt(PAQUETE, oracion, datos_clausula)
 
-    # 1. Prueba de Causatividad
-    respuesta_causatividad = prueba_causatividad(oracion)
-    if respuesta_causatividad:
-        evento_basico = obtener_evento_basico()
-        if evento_basico == "0":
-            pred_es.causativo = False
-            print(f"\n{NEGRITA}El predicado es [-causativo]{RESET}")
-        else:
-            pred_es.causativo = True
-            print(f"\n{NEGRITA}El predicado es [+causativo]{RESET}")
-            oracion = evento_basico
-    else:
-        pred_es.causativo = False
-        print(f"\n{NEGRITA}El predicado es [-causativo]{RESET}")
-
-    time.sleep(0.5)
-
-    # 2. Limpieza de la cláusula
-    oracion = verificar_limpieza_adjuntos(oracion) 
 
-    time.sleep(0.5)
-
-    # 3. Análisis de información de la cláusula
-    obtener_info_clausula(oracion, datos_clausula)
-
-    time.sleep(0.5)
-
-    # 4. Bloque de pruebas semánticas
-    pred_es.estativo = prueba_estatividad(oracion)
-    print(f"\n{NEGRITA}El predicado es [{'+estativo' if pred_es.estativo else '-estativo'}]{RESET}")
-    time.sleep(0.5)
-
-    if not pred_es.estativo:
-        
-        pred_es.puntual = not prueba_duratividad(datos_clausula)
-        print(f"\n{NEGRITA}El predicado es [{'+puntual' if pred_es.puntual else '-puntual'}]{RESET}")
-        time.sleep(0.5)
-
-        pred_es.telico = prueba_telicidad(datos_clausula)
-        print(f"\n{NEGRITA}El predicado es [{'+télico' if pred_es.telico else '-télico'}]{RESET}")
-        time.sleep(0.5)
-
-        pred_es.dinamico = prueba_dinamicidad(datos_clausula)
-        print(f"\n{NEGRITA}El predicado es [{'+dinámico' if pred_es.dinamico else '-dinámico'}]{RESET}")
-        time.sleep(0.5)
-
-    return pred_es
-
-
-def mostrar_resultado(oracion_original: str, aktionsart: Aktionsart, pred_es: RasgosPred) -> None:
+def mostrar_resultado(oracion_original: str, aktionsart: Aktionsart, pred_es: RasgosPred, datos_clausula: DatosClause) -> None:
     time.sleep(0.5)
     print("\nRESULTADO")
     print(f"\n{NEGRITA}El aktionsart del predicado de «{oracion_original}» es {aktionsart.value.upper()}.{RESET}")
@@ -616,10 +364,8 @@ def mostrar_resultado(oracion_original: str, aktionsart: Aktionsart, pred_es: Ra
 
     if akt_estado:
         rasgos_str.append("[-dinámico]")
-        es_dinamico = False
     else:
         rasgos_str.append(f"[{'+dinámico' if pred_es.dinamico else '-dinámico'}]")
-        es_dinamico = pred_es.dinamico
 
     print("\nEste predicado se clasifica así porque tiene los siguientes rasgos:")
     print(' '.join(rasgos_str))
@@ -628,21 +374,65 @@ def mostrar_resultado(oracion_original: str, aktionsart: Aktionsart, pred_es: Ra
     if respuesta_si_no("\n¿Quieres obtener la estructura lógica de esta cláusula? (s/n): "):
         print("\nEjecutando la opción elegida...")
         time.sleep(1)
-        cargar_ls(aktionsart, oracion_original, es_dinamico)
-
-
-def cargar_ls(aktionsart: Aktionsart, oracion_original: str, es_dinamico: bool) -> None:
-    try:
-        dinamico_str = "dinamico" if es_dinamico else "no_dinamico"
-        cmd = [sys.executable, "-u", "ls.py", aktionsart.value, oracion_original, dinamico_str]
-        subprocess.run(cmd, check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Error al ejecutar ls.py: {e}")
-    except FileNotFoundError:
-        print("No se encontró el archivo ls.py en el directorio actual.")
-
-
-def main() -> None:
+        cargar_ls(aktionsart, oracion_original, pred_es, datos_clausula)
+
+
+def cargar_ls(aktionsart: Aktionsart, oracion_original: str, pred_es: RasgosPred, datos_clausula: DatosClause) -> None:
+    """Continúa en ls.py dentro del mismo proceso, reutilizando lo que ya se obtuvo aquí."""
+    import ls
+    ls.main(aktionsart, oracion_original, pred_es, datos_clausula)
+
+
+def nombre_causativo(subtipo: str) -> str:
+    if subtipo in ["REALIZACION", "REALIZACION_ACTIVA", "ACTIVIDAD"]:
+        return f"{subtipo}_CAUSATIVA"
+    return f"{subtipo}_CAUSATIVO"
+
+
+PAQUETE = motor.registrar(motor.PaqueteIdioma(
+    codigo="es",
+    modelo=modelo_nlp,
+    reinicio=ReiniciarAnalisis,
+    respuestas_si=Respuesta.SI.value,
+    respuestas_no=Respuesta.NO.value,
+    textos={
+        "aviso_si_no": "\nPor favor, entrega una respuesta válida: «sí (s)» o «no (n)».",
+        "aviso_opcion": "\nPor favor, escribe una respuesta válida.",
+        "error_respuesta": "Error al obtener respuesta",
+        "rasgo": "El predicado es [{rasgo}]",
+    },
+    clase_rasgos=RasgosPred,
+    campos_rasgos={rasgo: rasgo for rasgo in motor.RASGOS},
+    etiquetas_rasgos={"causativo": "causativo", "estativo": "estativo", "puntual": "puntual",
+                      "telico": "télico", "dinamico": "dinámico"},
+    clase_aktionsart=Aktionsart,
+    subtipos={subtipo: subtipo for subtipo in ["ESTADO", "LOGRO", "SEMELFACTIVO", "REALIZACION_ACTIVA",
+                                               "ACTIVIDAD", "REALIZACION", "PROCESO"]},
+    nombre_causativo=nombre_causativo,
+    pruebas={
+        "causatividad": prueba_causatividad,
+        "evento_basico": obtener_evento_basico,
+        "limpieza": verificar_limpieza_adjuntos,
+        "info_clausula": obtener_info_clausula,
+        "estatividad": prueba_estatividad,
+        "duratividad": prueba_duratividad,
+        "telicidad": prueba_telicidad,
+        "dinamicidad": prueba_dinamicidad,
+    },
+    clase_datos=DatosClause,
+    extraer_datos=extraer_datos,
+    anticipar=anticipar_analisis,
+))
+
+
+def main(perfil: Optional[str] = None) -> None:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if perfil:
+        for nivel in niveles_nlp:
+            nivel.cambiar_perfil(perfil)
+    # Los modelos más grandes de la cascada se cargan solo si hacen falta
+    modelo_nlp.precargar()
+    LEXICO_CONJUGACION.vigilar()
     set_spanish_locale()
     limpiar_consola()
     print("\nEste programa te ayudará a identificar el aktionsart")
@@ -672,7 +462,7 @@ def main() -> None:
             if aktionsart is None:
                 mensaje_reinicio()
                 continue
-            mostrar_resultado(oracion_original, aktionsart, pred_es)
+            mostrar_resultado(oracion_original, aktionsart, pred_es, datos_clausula)
 
             if not respuesta_si_no("\n¿Quieres identificar el aktionsart de otro predicado? (s/n): "):
                 time.sleep(1)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Informe de la cascada de modelos (aktionsart.cascada_nlp): cuántas cláusulas resuelve
+cada nivel, cuántas pasan al siguiente y cuánto tarda cada uno.
+
+La caché de análisis y la vía rápida se desactivan para que todo pase por los modelos.
+Los niveles se eligen con VENDLER_CASCADA (por defecto es_core_news_sm,md,lg; los que no
+estén instalados se saltan).
+
+Uso:
+    python benchmarks/cascada.py
+    python benchmarks/cascada.py archivo_con_una_clausula_por_linea.txt
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["VENDLER_CACHE"] = ""
+os.environ["VENDLER_CACHE_MEMORIA"] = "0"
+
+import aktionsart  # noqa: E402
+from comparar_via_rapida import CLAUSULAS  # noqa: E402
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding="utf-8") as f:
+            clausulas = [linea.strip() for linea in f if linea.strip()]
+    else:
+        clausulas = CLAUSULAS
+
+    disponibles = aktionsart.cascada_nlp.disponibles()
+    if not disponibles:
+        print("No hay ningún modelo de español instalado.")
+        sys.exit(1)
+    print(f"Niveles instalados: {', '.join(nivel.nombre for nivel in disponibles)}")
+    for nivel in disponibles:
+        nivel.obtener()
+
+    inicio = time.perf_counter()
+    sin_confianza = 0
+    for clausula in clausulas:
+        doc = aktionsart.cascada_nlp.analizar(clausula)
+        if aktionsart.confianza_analisis(doc) < aktionsart.cascada_nlp.suficiente:
+            sin_confianza += 1
+    duracion = time.perf_counter() - inicio
+
+    print(f"\n{len(clausulas)} cláusulas en {duracion:.2f} s ({duracion / len(clausulas) * 1000:.1f} ms por cláusula)")
+    print("-" * 60)
+    for nombre, datos in aktionsart.cascada_nlp.estadisticas().items():
+        if datos["consultas"]:
+            print(f"• {nombre:<18} {datos['consultas']:5d} analizadas  {datos['aceptadas']:5d} aceptadas "
+                  f"({datos['tasa_aceptadas']:.0%})  {datos['ms_promedio']:6.1f} ms")
+    print("-" * 60)
+    print(f"Sin análisis confiable en ningún nivel: {sin_confianza}")
+
+
+if __name__ == "__main__":
+    main()
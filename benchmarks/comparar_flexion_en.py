@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+Compara el motor de flexion_en.py con las reglas que usaba english.py antes
+(sufijos con la heurística CVC y un diccionario de 120 verbos).
+
+1. Exactitud: gerundio y participio de una lista de referencia con los casos
+   difíciles (prefer, commit, panic, die, visit, offer, irregulares que no estaban
+   en el diccionario...). Como el diccionario viejo daba bien sus verbos, la
+   lista solo tiene verbos que no estaban en él.
+2. Velocidad: gerundio y participio de todos los verbos del léxico, con las
+   reglas viejas y con un Inflector nuevo (sin memo).
+3. Vía rápida: cuántas cláusulas de prueba resuelve sin spaCy y en cuánto
+   tiempo. Si está instalado en_core_web_sm, también compara lema, persona y
+   formas con el análisis de spaCy (extract_data) y su tiempo.
+
+Uso:
+    python benchmarks/comparar_flexion_en.py
+    python benchmarks/comparar_flexion_en.py --repeticiones 20
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["VENDLER_CACHE"] = ""
+
+import english  # noqa: E402
+import flexion_en  # noqa: E402
+
+REFERENCIA = [
+    ("prefer", "preferring", "preferred"), ("commit", "committing", "committed"),
+    ("visit", "visiting", "visited"), ("offer", "offering", "offered"),
+    ("admit", "admitting", "admitted"), ("occur", "occurring", "occurred"),
+    ("refer", "referring", "referred"), ("control", "controlling", "controlled"),
+    ("forbid", "forbidding", "forbidden"), ("regret", "regretting", "regretted"),
+    ("equip", "equipping", "equipped"), ("submit", "submitting", "submitted"),
+    ("panic", "panicking", "panicked"), ("picnic", "picnicking", "picnicked"),
+    ("open", "opening", "opened"), ("happen", "happening", "happened"),
+    ("limit", "limiting", "limited"), ("edit", "editing", "edited"),
+    ("travel", "traveling", "traveled"), ("enter", "entering", "entered"),
+    ("lie", "lying", "lain"), ("tie", "tying", "tied"),
+    ("agree", "agreeing", "agreed"), ("free", "freeing", "freed"),
+    ("dye", "dyeing", "dyed"), ("canoe", "canoeing", "canoed"),
+    ("try", "trying", "tried"), ("cry", "crying", "cried"),
+    ("play", "playing", "played"), ("obey", "obeying", "obeyed"),
+    ("fix", "fixing", "fixed"), ("snow", "snowing", "snowed"),
+    ("quit", "quitting", "quit"), ("shop", "shopping", "shopped"),
+    ("plan", "planning", "planned"), ("rain", "raining", "rained"),
+    ("ski", "skiing", "skied"), ("melt", "melting", "melted"),
+    ("swing", "swinging", "swung"), ("shake", "shaking", "shaken"),
+    ("ride", "riding", "ridden"), ("rise", "rising", "risen"),
+    ("freeze", "freezing", "frozen"), ("steal", "stealing", "stolen"),
+    ("tear", "tearing", "torn"), ("bite", "biting", "bitten"),
+    ("hang", "hanging", "hung"), ("shine", "shining", "shone"),
+    ("dig", "digging", "dug"), ("spin", "spinning", "spun"),
+    ("undo", "undoing", "undone"), ("overtake", "overtaking", "overtaken"),
+    ("rebuild", "rebuilding", "rebuilt"), ("mislead", "misleading", "misled"),
+    ("outrun", "outrunning", "outrun"), ("unplug", "unplugging", "unplugged"),
+]
+
+CLAUSULAS = (
+    ["Peter", "The children", "I", "We", "You", "The company", "They", "Ann and Luis", "She"],
+    ["ran", "gave", "built", "were", "told", "knows", "has eaten", "is reading", "melted", "sent",
+     "preferred", "panicked", "walk", "found", "didn't leave"],
+    ["", "a castle", "her sister a book", "in Madrid", "home", "a lot"],
+)
+
+
+# --- REGLAS ANTERIORES ---
+
+def formas_anteriores(lemma: str):
+    """Las reglas de english.generate_english_forms para un verbo fuera del diccionario viejo."""
+    es_cvc = len(lemma) > 2 and lemma[-1] not in "aeiouwyx" and lemma[-2] in "aeiou" and lemma[-3] not in "aeiou"
+    dobla = es_cvc and not lemma.endswith(("er", "en", "el", "it"))
+    if lemma.endswith("ie"):
+        ger = lemma[:-2] + "ying"
+    elif lemma.endswith("e") and not lemma.endswith("ee"):
+        ger = lemma[:-1] + "ing"
+    else:
+        ger = lemma + (lemma[-1] if dobla else "") + "ing"
+    if lemma.endswith("e"):
+        pp = lemma + "d"
+    else:
+        pp = lemma + (lemma[-1] if dobla else "") + "ed"
+    return ger, pp
+
+
+def medir(funcion, verbos) -> float:
+    inicio = time.perf_counter()
+    for verbo in verbos:
+        funcion(verbo)
+    return time.perf_counter() - inicio
+
+
+def clausulas():
+    for partes in itertools.product(*CLAUSULAS):
+        yield " ".join(parte for parte in partes if parte)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticiones", type=int, default=10)
+    args = parser.parse_args()
+
+    with open(flexion_en.LEXICON_INFLECTION.ruta, encoding="utf-8") as f:
+        datos = json.load(f)
+    inflector = flexion_en.Inflector(datos)
+
+    # 1. Exactitud
+    print(f"Exactitud en {len(REFERENCIA)} verbos (gerundio y participio):")
+    for nombre, funcion in (("reglas anteriores", formas_anteriores), ("flexion_en", inflector.non_finite)):
+        errores = [(lemma, funcion(lemma)) for lemma, ger, pp in REFERENCIA if funcion(lemma) != (ger, pp)]
+        print(f"• {nombre:18} {len(REFERENCIA) - len(errores):3}/{len(REFERENCIA)}"
+              + (f"  (ej: {', '.join(f'{lemma}: {ger}/{pp}' for lemma, (ger, pp) in errores[:4])})" if errores else ""))
+
+    # 2. Velocidad
+    verbos = list(inflector.verbs) * args.repeticiones
+    t_viejas = medir(formas_anteriores, verbos)
+    inflector = flexion_en.Inflector(datos)
+    t_motor = medir(inflector.non_finite, verbos[:len(inflector.verbs)])
+    t_memo = medir(inflector.non_finite, verbos)
+    inicio = time.perf_counter()
+    inflector.readings("")
+    t_indice = time.perf_counter() - inicio
+    print(f"\nGerundio y participio de {len(verbos)} verbos ({len(inflector.verbs)} del léxico):")
+    print(f"• Reglas anteriores:      {t_viejas:6.3f} s  ({t_viejas / len(verbos) * 1e6:5.2f} µs por verbo)")
+    print(f"• flexion_en, sin memo:   {t_motor:6.3f} s  ({t_motor / len(inflector.verbs) * 1e6:5.2f} µs por verbo)")
+    print(f"• flexion_en, con memo:   {t_memo:6.3f} s  ({t_memo / len(verbos) * 1e6:5.2f} µs por verbo)")
+    print(f"• Índice inverso: {len(inflector.index('forms', flexion_en.build_form_index))} formas "
+          f"armadas en {t_indice * 1000:.1f} ms")
+
+    # 3. Vía rápida
+    textos = list(clausulas())
+    inicio = time.perf_counter()
+    resueltas = [texto for texto in textos if english.fast_analysis(texto, english.ClauseData()) is not None]
+    t_rapida = time.perf_counter() - inicio
+    print(f"\nVía rápida: {len(resueltas)}/{len(textos)} cláusulas sin spaCy "
+          f"({t_rapida / len(textos) * 1e6:.1f} µs por cláusula)")
+
+    nlp = english.nlp_model.obtener()
+    if nlp is None:
+        print(f"No está instalado {english.nlp_model.nombre}: no se compara con spaCy.")
+        return
+
+    inicio = time.perf_counter()
+    docs = list(nlp.pipe(resueltas, batch_size=256))
+    t_spacy = time.perf_counter() - inicio
+    diferencias = 0
+    for texto, doc in zip(resueltas, docs):
+        rapido, con_spacy = english.ClauseData(), english.ClauseData()
+        english.fast_analysis(texto, rapido)
+        english.extract_data(doc, con_spacy)
+        if rapido != con_spacy:
+            diferencias += 1
+            if diferencias <= 5:
+                print(f"  Diferencia en «{texto}»:\n    vía rápida: {rapido}\n    spaCy:      {con_spacy}")
+    print(f"• spaCy: {t_spacy / len(resueltas) * 1e6:.1f} µs por cláusula; "
+          f"{diferencias} de {len(resueltas)} difieren de la vía rápida")
+
+
+if __name__ == "__main__":
+    main()
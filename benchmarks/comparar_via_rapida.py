@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Compara la vía rápida sin spaCy (via_rapida.py) con el análisis de spaCy.
+
+Para cada cláusula de muestra se mide la latencia de ambos caminos y, cuando la vía
+rápida la resuelve, se comprueba si llena los DatosClause igual que spaCy.
+La caché de análisis se desactiva para medir el parser de verdad.
+
+Uso:
+    python benchmarks/comparar_via_rapida.py
+    python benchmarks/comparar_via_rapida.py --repeticiones 200 --diferencias
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from dataclasses import asdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["VENDLER_CACHE"] = ""
+os.environ["VENDLER_CACHE_MEMORIA"] = "0"
+
+import aktionsart  # noqa: E402
+import via_rapida  # noqa: E402
+
+CLAUSULAS = [
+    "Pedro corrió", "María sabe inglés", "El gato rompió el jarrón", "Juan tosió",
+    "Ana le dio un libro a Pepe", "Los niños construyeron un castillo", "La nieve se derritió",
+    "Vosotros estuvisteis en Madrid", "Nosotros caminamos por el parque", "Tú escribiste una carta",
+    "Ellos leyeron el periódico", "El barco se hundió", "Yo pienso mucho", "Carla duerme",
+    "Los pájaros vuelan", "El agua hierve", "Mi hermano tiene un auto", "Ella pidió ayuda",
+    "El niño creció", "Llueve", "Nevó ayer", "Marta se fue", "Pedro vino temprano",
+    "Los estudiantes aprobaron el examen", "El vaso se rompió", "Yo conozco a Luis",
+    "Ustedes trabajan mucho", "Sofía cantaba", "Yo cantaba", "El sol brilla",
+    "Mi madre cocinó la cena", "El perro ladró", "Los árboles florecen", "Juan llegó tarde",
+    "La puerta se abrió", "Tú sabes la verdad", "El tren salió", "El hielo se derritió",
+    "Ella sonrió", "Ellos construyen casas", "Yo busqué las llaves", "Nosotros vivimos en Chile",
+    "El profesor explicó la lección", "La niña se cayó", "Pablo trajo pan", "Laura oyó un ruido",
+    "El bebé lloró", "Los precios subieron", "El paciente murió", "Yo elijo este",
+    "Ana juega al fútbol", "Él tradujo el libro", "El museo contiene cuadros", "Juan se despertó",
+    "María está corriendo", "Pedro ha comido", "Los invitados se fueron", "El viento sopla fuerte",
+    "Yo sigo aquí", "La empresa mantiene la calidad",
+]
+
+
+def via_spacy(oracion: str):
+    datos = aktionsart.DatosClause()
+    doc = aktionsart.modelo_nlp.analizar(oracion)
+    return aktionsart.extraer_datos(doc, datos), asdict(datos)
+
+
+def via_rapida_(oracion: str):
+    datos = aktionsart.DatosClause()
+    resultado = via_rapida.analizar(oracion, datos, aktionsart.generar_formas_verbales)
+    return resultado, asdict(datos)
+
+
+def latencia(funcion, oracion: str, repeticiones: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion(oracion)
+    return (time.perf_counter() - inicio) / repeticiones
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticiones", type=int, default=50)
+    parser.add_argument("--diferencias", action="store_true", help="muestra cada desacuerdo")
+    args = parser.parse_args()
+
+    if aktionsart.modelo_nlp.obtener() is None:
+        print("No está instalado es_core_news_sm: no hay con qué comparar.")
+        sys.exit(1)
+    via_rapida.tabla()
+
+    resueltas, coincidencias = 0, 0
+    t_rapida, t_spacy = [], []
+    for oracion in CLAUSULAS:
+        rapido, datos_rapidos = via_rapida_(oracion)
+        referencia, datos_spacy = via_spacy(oracion)
+        t_spacy.append(latencia(via_spacy, oracion, args.repeticiones))
+        t_rapida.append(latencia(via_rapida_, oracion, args.repeticiones))
+        if rapido is None:
+            continue
+        resueltas += 1
+        if (rapido, datos_rapidos) == (referencia, datos_spacy):
+            coincidencias += 1
+        elif args.diferencias:
+            print(f"«{oracion}»\n  rápida: {rapido} {datos_rapidos}\n  spaCy:  {referencia} {datos_spacy}")
+
+    total = len(CLAUSULAS)
+    print(f"\nCláusulas: {total}")
+    print(f"• Resueltas sin spaCy:   {resueltas} ({resueltas / total:.0%})")
+    print(f"• Coinciden con spaCy:   {coincidencias} de {resueltas} ({coincidencias / max(resueltas, 1):.0%})")
+    print(f"• Latencia mediana vía rápida: {statistics.median(t_rapida) * 1e6:8.1f} µs")
+    print(f"• Latencia mediana spaCy:      {statistics.median(t_spacy) * 1e6:8.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
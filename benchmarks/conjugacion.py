@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Mide el motor de conjugacion.py con una lista grande de verbos.
+
+A los verbos del léxico se les agregan prefijos (re-, des-, pre-, contra-...)
+hasta completar --verbos infinitivos distintos; los que no están en los datos se
+conjugan por su modelo (retener como tener, desenvolver como volver) o como
+regulares. Con un Conjugador nuevo (sin memo) se mide:
+    • gerundio y participio de cada verbo (lo que usa aktionsart)
+    • los siete tiempos completos
+    • una segunda pasada, ya memorizada
+
+Antes se comprueba la tabla REFERENCIA: formas esperadas de los verbos con
+excepciones ortográficas o de raíz (cocer, prever, delinquir, argüir, reunir...);
+se listan las que el motor no da igual.
+
+Uso:
+    python benchmarks/conjugacion.py
+    python benchmarks/conjugacion.py --verbos 50000
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import conjugacion  # noqa: E402
+
+PREFIJOS = ["", "re", "des", "pre", "contra", "entre", "sobre", "co", "sub", "inter", "trans",
+            "super", "anti", "auto", "ex", "im", "dis", "per", "pro", "con"]
+
+# (infinitivo, tiempo, formas esperadas); gerundio y participio van como tiempos de una forma
+REFERENCIA = [
+    ("cocer", "presente", "cuezo cueces cuece cocemos cocéis cuecen"),
+    ("cocer", "subjuntivo_presente", "cueza cuezas cueza cozamos cozáis cuezan"),
+    ("escocer", "presente", "escuezo escueces escuece escocemos escocéis escuecen"),
+    ("mecer", "presente", "mezo meces mece mecemos mecéis mecen"),
+    ("conocer", "presente", "conozco conoces conoce conocemos conocéis conocen"),
+    ("lucir", "subjuntivo_presente", "luzca luzcas luzca luzcamos luzcáis luzcan"),
+    ("vencer", "presente", "venzo vences vence vencemos vencéis vencen"),
+    ("prever", "presente", "preveo prevés prevé prevemos prevéis prevén"),
+    ("prever", "preterito", "preví previste previó previmos previsteis previeron"),
+    ("prever", "subjuntivo_presente", "prevea preveas prevea preveamos preveáis prevean"),
+    ("prever", "participio", "previsto"),
+    ("entrever", "presente", "entreveo entrevés entrevé entrevemos entrevéis entrevén"),
+    ("delinquir", "presente", "delinco delinques delinque delinquimos delinquís delinquen"),
+    ("delinquir", "subjuntivo_presente", "delinca delincas delinca delincamos delincáis delincan"),
+    ("argüir", "presente", "arguyo arguyes arguye argüimos argüís arguyen"),
+    ("argüir", "preterito", "argüí argüiste arguyó argüimos argüisteis arguyeron"),
+    ("argüir", "gerundio", "arguyendo"),
+    ("construir", "preterito", "construí construiste construyó construimos construisteis construyeron"),
+    ("acertar", "presente", "acierto aciertas acierta acertamos acertáis aciertan"),
+    ("sembrar", "subjuntivo_presente", "siembre siembres siembre sembremos sembréis siembren"),
+    ("fregar", "subjuntivo_presente", "friegue friegues friegue freguemos freguéis frieguen"),
+    ("volcar", "subjuntivo_presente", "vuelque vuelques vuelque volquemos volquéis vuelquen"),
+    ("consolar", "presente", "consuelo consuelas consuela consolamos consoláis consuelan"),
+    ("tostar", "presente", "tuesto tuestas tuesta tostamos tostáis tuestan"),
+    ("poblar", "presente", "pueblo pueblas puebla poblamos pobláis pueblan"),
+    ("colar", "presente", "cuelo cuelas cuela colamos coláis cuelan"),
+    ("degollar", "presente", "degüello degüellas degüella degollamos degolláis degüellan"),
+    ("reforzar", "subjuntivo_presente", "refuerce refuerces refuerce reforcemos reforcéis refuercen"),
+    ("trocar", "presente", "trueco truecas trueca trocamos trocáis truecan"),
+    ("avergonzar", "presente", "avergüenzo avergüenzas avergüenza avergonzamos avergonzáis avergüenzan"),
+    ("reunir", "presente", "reúno reúnes reúne reunimos reunís reúnen"),
+    ("reunir", "subjuntivo_presente", "reúna reúnas reúna reunamos reunáis reúnan"),
+    ("aislar", "presente", "aíslo aíslas aísla aislamos aisláis aíslan"),
+    ("prohibir", "presente", "prohíbo prohíbes prohíbe prohibimos prohibís prohíben"),
+    ("discernir", "preterito", "discerní discerniste discernió discernimos discernisteis discernieron"),
+    ("discernir", "gerundio", "discerniendo"),
+    ("sentir", "preterito", "sentí sentiste sintió sentimos sentisteis sintieron"),
+    ("reñir", "preterito", "reñí reñiste riñó reñimos reñisteis riñeron"),
+    ("gruñir", "gerundio", "gruñendo"),
+    ("erguir", "preterito", "erguí erguiste irguió erguimos erguisteis irguieron"),
+    ("soltar", "participio", "suelto"),
+    ("corregir", "gerundio", "corrigiendo"),
+    ("contener", "preterito", "contuve contuviste contuvo contuvimos contuvisteis contuvieron"),
+]
+
+
+def lista_verbos(conjugador: conjugacion.Conjugador, cantidad: int):
+    verbos = []
+    vistos = set()
+    for prefijo, verbo in itertools.product(PREFIJOS, conjugador.verbos):
+        if prefijo + verbo not in vistos:
+            vistos.add(prefijo + verbo)
+            verbos.append(prefijo + verbo)
+            if len(verbos) == cantidad:
+                break
+    return verbos
+
+
+def comprobar_referencia(conjugador: conjugacion.Conjugador):
+    """(infinitivo, tiempo, esperadas, obtenidas) de cada fila de REFERENCIA que no coincide."""
+    errores = []
+    for infinitivo, tiempo, esperadas in REFERENCIA:
+        if tiempo in ("gerundio", "participio"):
+            obtenidas = conjugador.formas_no_finitas(infinitivo)[tiempo == "participio"]
+        else:
+            obtenidas = " ".join(conjugador.conjugar(infinitivo)[tiempo])
+        if obtenidas != esperadas:
+            errores.append((infinitivo, tiempo, esperadas, obtenidas))
+    return errores
+
+
+def medir(funcion, verbos) -> float:
+    inicio = time.perf_counter()
+    for verbo in verbos:
+        funcion(verbo)
+    return time.perf_counter() - inicio
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--verbos", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with open(conjugacion.LEXICO_CONJUGACION.ruta, encoding="utf-8") as f:
+        datos = json.load(f)
+
+    inicio = time.perf_counter()
+    conjugador = conjugacion.Conjugador(datos)
+    t_carga = time.perf_counter() - inicio
+    errores = comprobar_referencia(conjugacion.Conjugador(datos))
+    print(f"Referencia: {len(REFERENCIA) - len(errores)}/{len(REFERENCIA)} filas coinciden")
+    for infinitivo, tiempo, esperadas, obtenidas in errores:
+        print(f"  {infinitivo} ({tiempo}): se esperaba «{esperadas}», da «{obtenidas}»")
+
+    verbos = lista_verbos(conjugador, args.verbos)
+    print(f"{len(verbos)} verbos ({len(conjugador.verbos)} del léxico); instantánea armada en {t_carga * 1000:.1f} ms")
+
+    t_no_finitas = medir(conjugador.formas_no_finitas, verbos)
+    t_tiempos = medir(conjugador.conjugar, verbos)
+    t_memo = medir(conjugador.formas_no_finitas, verbos) + medir(conjugador.conjugar, verbos)
+
+    formas = len(verbos) * len(conjugacion.TIEMPOS) * len(conjugacion.PERSONAS)
+    print(f"• Gerundio y participio:  {t_no_finitas:6.3f} s  ({t_no_finitas / len(verbos) * 1e6:5.1f} µs por verbo)")
+    print(f"• Siete tiempos ({formas} formas): {t_tiempos:6.3f} s  ({t_tiempos / len(verbos) * 1e6:5.1f} µs por verbo)")
+    print(f"• Segunda pasada (memo):  {t_memo:6.3f} s")
+
+    for verbo in ("retener", "desenvolver", "contradecir", "reelegir", "prevenir"):
+        print(f"  {verbo}: {' '.join(conjugador.conjugar(verbo)['presente'])} | "
+              f"{', '.join(conjugador.formas_no_finitas(verbo))}")
+
+
+if __name__ == "__main__":
+    main()
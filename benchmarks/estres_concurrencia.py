@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Prueba de estrés del estado compartido: muchos análisis automáticos concurrentes.
+
+1. Analiza cada cláusula de muestra una vez, en un solo hilo (resultado de referencia).
+2. Repite los mismos análisis desde muchos hilos a la vez con el mismo modelo compartido
+   y comprueba que cada resultado coincide con la referencia.
+3. Martilla la caché de traducciones (CacheSegmentada) con claves repetidas desde
+   todos los hilos y comprueba que cada clave quedó con un único valor.
+
+Por defecto se desactiva la caché de análisis, para que todos los análisis pasen
+de verdad por el parser; --con-cache la deja activa (y muestra sus estadísticas).
+
+Uso:
+    python benchmarks/estres_concurrencia.py
+    python benchmarks/estres_concurrencia.py --hilos 32 --repeticiones 100
+    python benchmarks/estres_concurrencia.py --con-cache
+
+Termina con código 1 si algún resultado concurrente difiere de la referencia.
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cache import CacheSegmentada  # noqa: E402
+
+CLAUSULAS = [
+    "Pedro corrió hasta su casa", "María sabe inglés", "El gato rompió el jarrón",
+    "Ana le dio un libro a Pepe", "Los niños construyeron un castillo", "Juan tosió",
+    "Nosotros caminamos por el parque", "Vosotros estuvisteis en Madrid",
+    "La nieve se derritió", "Ellos leyeron el periódico", "Tú escribiste una carta",
+    "El barco se hundió",
+]
+
+
+def analizar(oracion: str):
+    import aktionsart
+    datos = aktionsart.DatosClause()
+    resultado = aktionsart.analizar_automaticamente(oracion, datos)
+    return resultado, asdict(datos)
+
+
+def estres_analisis(hilos: int, repeticiones: int) -> int:
+    referencia = {oracion: analizar(oracion) for oracion in CLAUSULAS}
+    trabajos = CLAUSULAS * repeticiones
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=hilos) as ejecutor:
+        resultados = list(ejecutor.map(analizar, trabajos))
+    duracion = time.perf_counter() - inicio
+
+    diferencias = 0
+    for oracion, resultado in zip(trabajos, resultados):
+        if resultado != referencia[oracion]:
+            diferencias += 1
+            if diferencias <= 5:
+                print(f"  Diferencia en «{oracion}»:\n    {resultado}\n    {referencia[oracion]}")
+    print(f"Análisis: {len(trabajos)} en {duracion:.2f} s con {hilos} hilos "
+          f"({len(trabajos) / duracion:.0f}/s), {diferencias} diferencias")
+    return diferencias
+
+
+def estres_cache(hilos: int, repeticiones: int) -> int:
+    cache = CacheSegmentada()
+    claves = [f"palabra{i}" for i in range(200)]
+    calculos = {clave: 0 for clave in claves}
+    candado_calculos = threading.Lock()
+
+    def traducir_lento(clave):
+        with candado_calculos:
+            calculos[clave] += 1
+            n = calculos[clave]
+        time.sleep(0.0005)
+        # Cada cálculo devuelve un valor distinto: solo el primero guardado debe sobrevivir
+        return f"{clave}#{n}"
+
+    def trabajo(indice):
+        clave = claves[indice % len(claves)]
+        return clave, cache.obtener_o_calcular(clave, lambda: traducir_lento(clave))
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=hilos) as ejecutor:
+        resultados = list(ejecutor.map(trabajo, range(len(claves) * repeticiones)))
+    duracion = time.perf_counter() - inicio
+
+    vistos = {}
+    diferencias = 0
+    for clave, valor in resultados:
+        if vistos.setdefault(clave, valor) != valor or cache.obtener(clave) != valor:
+            diferencias += 1
+    if len(cache) != len(claves):
+        diferencias += 1
+    print(f"Caché: {len(resultados)} consultas en {duracion:.2f} s, "
+          f"{sum(calculos.values())} cálculos, {diferencias} diferencias")
+    return diferencias
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hilos", type=int, default=16)
+    parser.add_argument("--repeticiones", type=int, default=50)
+    parser.add_argument("--con-cache", action="store_true", help="no desactiva la caché de análisis")
+    args = parser.parse_args()
+
+    if not args.con_cache:
+        os.environ["VENDLER_CACHE"] = ""
+        os.environ["VENDLER_CACHE_MEMORIA"] = "0"
+    import aktionsart
+    import modelos
+
+    if aktionsart.modelo_nlp.obtener() is None:
+        print("No está instalado es_core_news_sm: solo se prueba la caché.")
+        diferencias = 0
+    else:
+        diferencias = estres_analisis(args.hilos, args.repeticiones)
+        if args.con_cache:
+            print(f"Caché de análisis: {modelos.CACHE_ANALISIS.estadisticas()}")
+    diferencias += estres_cache(args.hilos, args.repeticiones)
+
+    if diferencias:
+        print("\nRESULTADOS NO DETERMINISTAS")
+        sys.exit(1)
+    print("\nOK: todos los resultados concurrentes coinciden con la referencia.")
+
+
+if __name__ == "__main__":
+    main()
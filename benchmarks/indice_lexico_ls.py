@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+Mide cuánto cuesta averiguar las clases de un verbo en los léxicos de ls.py a
+medida que crecen.
+
+A cada lista de datos/verbos_ls.json se le agregan verbos inventados hasta
+multiplicar su tamaño por --factores, y para cada tamaño se buscan todas las
+clases de un mismo conjunto de verbos (del léxico, agregados y ausentes) de
+tres maneras:
+    • listas: «verbo in lista» en cada lista (como cuando eran literales de Python)
+    • categorías: buscar_verbo sobre los frozenset de cada léxico, categoría por categoría
+    • índice: LexicoLS.clases, el índice inverso verbo -> clases
+
+Uso:
+    python benchmarks/indice_lexico_ls.py
+    python benchmarks/indice_lexico_ls.py --factores 1 10 100 1000 --consultas 20000
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ls  # noqa: E402
+
+
+def agrandar(datos: dict, factor: int) -> dict:
+    """Copia de los datos con cada lista (o diccionario) factor veces más grande."""
+    contador = itertools.count()
+
+    def crecer(verbos):
+        extra = [f"verbo{next(contador):07d}ar" for _ in range(len(verbos) * (factor - 1))]
+        if isinstance(verbos, dict):
+            return {**verbos, **{verbo: "something" for verbo in extra}}
+        return list(verbos) + extra
+
+    nuevos = {"PRIORIDAD_CLASES": datos["PRIORIDAD_CLASES"]}
+    for nombre in ls.NOMBRES_LEXICO:
+        contenido = datos[nombre]
+        if isinstance(contenido, dict) and all(isinstance(v, (list, dict)) for v in contenido.values()):
+            nuevos[nombre] = {categoria: crecer(verbos) for categoria, verbos in contenido.items()}
+        else:
+            nuevos[nombre] = crecer(contenido)
+    return nuevos
+
+
+def grupos_en_listas(datos: dict):
+    """(clase, lista) de cada lista de los datos, en el orden del archivo."""
+    for nombre in ls.NOMBRES_LEXICO:
+        contenido = datos[nombre]
+        if isinstance(contenido, dict) and all(isinstance(v, (list, dict)) for v in contenido.values()):
+            for categoria, verbos in contenido.items():
+                yield f"{ls.nombre_clase(nombre)}:{categoria}", list(verbos)
+        else:
+            yield ls.nombre_clase(nombre), list(contenido)
+
+
+def buscar_verbo(verbo, diccionario):
+    # La búsqueda por categorías que usaba ls.py
+    for categoria, verbos in diccionario.items():
+        if verbo in verbos:
+            return categoria
+    return None
+
+
+def medir(funcion, consultas) -> float:
+    inicio = time.perf_counter()
+    for verbo in consultas:
+        funcion(verbo)
+    return time.perf_counter() - inicio
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--factores", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--consultas", type=int, default=20_000)
+    args = parser.parse_args()
+
+    with open(ls.LEXICO_LS.ruta, encoding="utf-8") as f:
+        datos = json.load(f)
+
+    print(f"{'factor':>7} {'verbos':>9} {'armado':>9} {'listas':>10} {'categorías':>11} {'índice':>9}   (µs por consulta)")
+    for factor in args.factores:
+        grandes = agrandar(datos, factor)
+        inicio = time.perf_counter()
+        lexico = ls.construir_lexico_ls(grandes)
+        t_armado = time.perf_counter() - inicio
+
+        azar = random.Random(factor)
+        conocidos = sorted(lexico.clases)
+        consultas = [azar.choice(conocidos) if azar.random() < 0.8 else f"ausente{i}" for i in range(args.consultas)]
+
+        listas = list(grupos_en_listas(grandes))
+        # Léxicos con categorías: buscar_verbo; los de una sola clase: «in» en su frozenset
+        categorias = [(isinstance(grandes[nombre], dict) and all(
+            isinstance(v, (list, dict)) for v in grandes[nombre].values()), getattr(lexico, nombre.lower()))
+            for nombre in ls.NOMBRES_LEXICO]
+
+        # Recorrer las listas es lento con léxicos grandes: se mide con menos consultas
+        pocas = consultas[:max(100, len(consultas) // factor)]
+        t_listas = medir(lambda verbo: [clase for clase, verbos in listas if verbo in verbos], pocas)
+        t_categorias = medir(lambda verbo: [
+            buscar_verbo(verbo, contenido) if con_categorias else verbo in contenido
+            for con_categorias, contenido in categorias], consultas)
+        t_indice = medir(lambda verbo: lexico.clases.get(verbo, ()), consultas)
+
+        por_consulta = [t_listas / len(pocas) * 1e6] + [t / len(consultas) * 1e6 for t in (t_categorias, t_indice)]
+        print(f"{factor:>7} {len(lexico.clases):>9} {t_armado * 1000:>7.1f}ms "
+              f"{por_consulta[0]:>10.2f} {por_consulta[1]:>11.2f} {por_consulta[2]:>9.3f}")
+
+    lexico = ls.LEXICO_LS.actual()
+    print("\nVerbos en varias clases (la primera gana):")
+    for verbo in ("pedir", "exigir", "desalojar", "hurtar", "arrancar"):
+        print(f"  {verbo}: {', '.join(lexico.clases.get(verbo, ()))}")
+
+
+if __name__ == "__main__":
+    main()
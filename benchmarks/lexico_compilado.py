@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Compara un léxico grande como diccionario de Python (cargado de JSON) con el
+mismo léxico compilado por lexico_compilado.py y abierto con mmap.
+
+El léxico es el índice inverso de formas del español (conjugacion.py) para los
+verbos del léxico con prefijos (re-, des-, pre-, contra-...) hasta pasar
+--formas entradas. Para cada versión se mide:
+    • lo que tarda en abrirse (json.load + diccionario / mmap)
+    • la memoria de Python que ocupa (tracemalloc) después de abrirse y de
+      --consultas búsquedas
+    • el tiempo de una búsqueda (formas del léxico y palabras ausentes)
+
+Uso:
+    python benchmarks/lexico_compilado.py
+    python benchmarks/lexico_compilado.py --formas 300000
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["VENDLER_COMPILADOS"] = "0"
+
+import conjugacion  # noqa: E402
+import lexico_compilado  # noqa: E402
+
+PREFIJOS = ["", "re", "des", "pre", "contra", "entre", "sobre", "co", "sub", "inter", "trans",
+            "super", "anti", "auto", "ex", "im", "dis", "per", "pro", "con"]
+
+
+def pares_grandes(conjugador: conjugacion.Conjugador, cantidad: int):
+    """(forma, lecturas codificadas) de los verbos con prefijos hasta juntar cantidad formas."""
+    indice = {}
+    for prefijo, verbo in itertools.product(PREFIJOS, conjugador.verbos):
+        infinitivo = prefijo + verbo
+        for tiempo, formas in conjugador.conjugar(infinitivo).items():
+            for persona, forma in zip(conjugacion.PERSONAS, formas):
+                indice.setdefault(forma, []).append(" ".join((infinitivo, persona, tiempo)))
+        if len(indice) >= cantidad:
+            break
+    return {forma: "\t".join(lecturas) for forma, lecturas in indice.items()}
+
+
+def medir_memoria(funcion):
+    """(resultado, segundos, bytes de Python que siguen ocupados)."""
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = funcion()
+    segundos = time.perf_counter() - inicio
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return resultado, segundos, memoria
+
+
+def medir_busquedas(tabla, consultas) -> float:
+    inicio = time.perf_counter()
+    for forma in consultas:
+        valor = tabla.get(forma)
+        if valor is not None:
+            conjugacion.decodificar_lecturas(valor)
+    return (time.perf_counter() - inicio) / len(consultas) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--formas", type=int, default=100_000)
+    parser.add_argument("--consultas", type=int, default=50_000)
+    args = parser.parse_args()
+
+    conjugador = conjugacion.LEXICO_CONJUGACION.actual()
+    pares = pares_grandes(conjugador, args.formas)
+    azar = random.Random(0)
+    formas = list(pares)
+    consultas = [azar.choice(formas) if azar.random() < 0.8 else f"zz{i}" for i in range(args.consultas)]
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta_json = os.path.join(carpeta, "formas.json")
+        ruta_vlex = os.path.join(carpeta, "formas.vlex")
+        with open(ruta_json, "w", encoding="utf-8") as f:
+            json.dump(pares, f, ensure_ascii=False)
+        inicio = time.perf_counter()
+        lexico_compilado.compilar(ruta_vlex, pares.items(), 0)
+        t_compilar = time.perf_counter() - inicio
+        del pares
+
+        def cargar_json():
+            with open(ruta_json, encoding="utf-8") as f:
+                return json.load(f)
+
+        # Los tiempos de apertura se toman con tracemalloc activo (ambos por igual)
+        diccionario, t_json, m_json = medir_memoria(cargar_json)
+        compilada, t_mmap, m_mmap = medir_memoria(lambda: lexico_compilado.TablaCompilada(ruta_vlex))
+        _, _, m_consultas = medir_memoria(lambda: medir_busquedas(compilada, consultas))
+
+        print(f"{len(diccionario)} formas; compiladas en {t_compilar:.2f} s "
+              f"({os.path.getsize(ruta_vlex) / 2**20:.1f} MiB; JSON: {os.path.getsize(ruta_json) / 2**20:.1f} MiB)")
+        print(f"\n{'':12} {'apertura':>10} {'memoria':>12} {'búsqueda':>12}")
+        print(f"{'diccionario':12} {t_json * 1000:>8.1f}ms {m_json / 2**20:>9.1f}MiB "
+              f"{medir_busquedas(diccionario, consultas):>10.2f}µs")
+        print(f"{'compilado':12} {t_mmap * 1000:>8.3f}ms {m_mmap / 2**10:>9.1f}KiB "
+              f"{medir_busquedas(compilada, consultas):>10.2f}µs")
+        print(f"\nMemoria de Python retenida tras {len(consultas)} búsquedas en el compilado: {m_consultas / 2**10:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Compara la extracción con patrones compilados (patrones.py: Matcher y
+DependencyMatcher) con el recorrido a mano de los Doc (extraer_con_bucles).
+
+Se arman cláusulas combinando sujetos, verbos y complementos, se analizan una vez
+con nlp.pipe y se repiten hasta completar --clausulas; así se mide solo la
+extracción, no el parser. Antes de medir se comprueba que ambos caminos dan la
+misma Extraccion en cada Doc, y también con los patrones sobre el mismo Doc
+restaurado como lo hace la caché de modelos.py (Vocab propio, sin atributos léxicos).
+
+Uso:
+    python benchmarks/patrones_extraccion.py
+    python benchmarks/patrones_extraccion.py --clausulas 100000 --idioma en
+
+Termina con código 1 si algún resultado difiere.
+"""
+import argparse
+import itertools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["VENDLER_CACHE"] = ""
+
+import motor  # noqa: E402
+import patrones  # noqa: E402
+
+PIEZAS = {
+    "es": (
+        ["Pedro", "Los niños", "Yo", "Nosotros", "Vosotros", "La empresa", "Tú", "Ana y Luis", ""],
+        ["corrió", "se lo dio", "construyeron", "estuvisteis", "me lo dijeron", "sabe",
+         "ha comido", "está leyendo", "le regaló", "se derritió"],
+        ["", "un castillo", "a su hermana", "en Madrid", "el libro a Pepe", "hasta la casa", "mucho"],
+    ),
+    "en": (
+        ["Peter", "The children", "I", "We", "You", "The company", "They", "Ann and Luis", ""],
+        ["ran", "gave", "built", "were", "told", "knows", "has eaten", "is reading", "melted", "sent"],
+        ["", "a castle", "her sister a book", "in Madrid", "the book to Pepe", "home", "a lot"],
+    ),
+}
+
+
+def clausulas_base(idioma: str):
+    sujetos, verbos, complementos = PIEZAS[idioma]
+    for sujeto, verbo, complemento in itertools.product(sujetos, verbos, complementos):
+        yield " ".join(parte for parte in (sujeto, verbo, complemento) if parte)
+
+
+def restaurar(doc):
+    """El Doc serializado y vuelto a armar como en ModeloPerezoso._restaurar."""
+    from spacy.tokens import Doc
+    from spacy.vocab import Vocab
+    return Doc(Vocab()).from_bytes(doc.to_bytes(exclude=["tensor", "user_data"]), exclude=["user_data"])
+
+
+def medir(funcion, docs) -> float:
+    inicio = time.perf_counter()
+    for doc in docs:
+        funcion(doc)
+    return time.perf_counter() - inicio
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--idioma", choices=sorted(motor.MODULOS_IDIOMA), default="es")
+    parser.add_argument("--clausulas", type=int, default=100_000)
+    args = parser.parse_args()
+
+    paquete = motor.obtener_paquete(args.idioma)
+    nlp = paquete.modelo.obtener()
+    if nlp is None:
+        print(f"No está instalado {paquete.modelo.nombre}.")
+        sys.exit(1)
+
+    textos = list(clausulas_base(args.idioma))
+    inicio = time.perf_counter()
+    base = list(nlp.pipe(textos, batch_size=256))
+    print(f"{len(base)} cláusulas distintas analizadas en {time.perf_counter() - inicio:.1f} s")
+
+    compilados = patrones.patrones(args.idioma, nlp.vocab)
+    diferencias = 0
+    for doc in base:
+        con_bucles = patrones.extraer_con_bucles(doc, args.idioma)
+        for camino, con_patrones in (("patrones", compilados.extraer(doc)),
+                                     ("restaurado", compilados.extraer(restaurar(doc)))):
+            if con_patrones != con_bucles:
+                diferencias += 1
+                if diferencias <= 5:
+                    print(f"  Diferencia en «{doc.text}»:\n    {camino}: {con_patrones}\n    bucles:   {con_bucles}")
+
+    docs = list(itertools.islice(itertools.cycle(base), args.clausulas))
+    t_patrones = medir(compilados.extraer, docs)
+    t_bucles = medir(lambda doc: patrones.extraer_con_bucles(doc, args.idioma), docs)
+
+    print(f"\nExtracción de {len(docs)} cláusulas ({args.idioma}), {diferencias} diferencias")
+    print(f"• Patrones compilados: {t_patrones:7.2f} s  ({t_patrones / len(docs) * 1e6:6.1f} µs por cláusula)")
+    print(f"• Bucles en Python:    {t_bucles:7.2f} s  ({t_bucles / len(docs) * 1e6:6.1f} µs por cláusula)")
+    sys.exit(1 if diferencias else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Mide el tiempo hasta la primera pregunta (time-to-first-prompt) de cada punto de entrada.
+
+Cada programa se lanza como un proceso nuevo y se cronometra hasta que su salida
+contiene el texto de la primera pregunta. Se toma la mediana de varias ejecuciones.
+
+Uso:
+    python benchmarks/tiempo_inicio.py                 # compara con la línea base guardada
+    python benchmarks/tiempo_inicio.py --guardar       # guarda los tiempos actuales como línea base
+    python benchmarks/tiempo_inicio.py --limite 1.5    # cambia el presupuesto absoluto (segundos)
+
+Termina con código 1 si algún programa supera el presupuesto absoluto o si empeora
+más que la tolerancia respecto de la línea base.
+"""
+import argparse
+import json
+import os
+import select
+import statistics
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUTA_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tiempo_inicio.json")
+
+# Programa y texto que indica que ya apareció la primera pregunta
+PUNTOS_DE_ENTRADA = {
+    "main.py": "selecciona una opción",
+    "aktionsart.py": "Cláusula: ",
+    "ls.py": "Escribe el número correspondiente",
+    "english.py": "Clause: ",
+}
+
+
+def medir(script: str, marca: str, espera_max: float) -> float:
+    """Devuelve los segundos que tarda «script» en mostrar «marca» (o espera_max si no la muestra)."""
+    entorno = dict(os.environ, TERM="dumb", PYTHONIOENCODING="utf-8")
+    inicio = time.perf_counter()
+    proceso = subprocess.Popen(
+        [sys.executable, "-u", script], cwd=RAIZ, env=entorno,
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+    )
+    salida = b""
+    objetivo = marca.encode("utf-8")
+    try:
+        while objetivo not in salida:
+            restante = espera_max - (time.perf_counter() - inicio)
+            if restante <= 0:
+                return espera_max
+            listos, _, _ = select.select([proceso.stdout], [], [], restante)
+            if not listos:
+                continue
+            datos = os.read(proceso.stdout.fileno(), 4096)
+            if not datos:
+                return espera_max
+            salida += datos
+        return time.perf_counter() - inicio
+    finally:
+        proceso.kill()
+        proceso.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--limite", type=float, default=1.0, help="presupuesto absoluto por programa, en segundos")
+    parser.add_argument("--tolerancia", type=float, default=0.25, help="empeoramiento relativo admitido frente a la línea base")
+    parser.add_argument("--guardar", action="store_true", help="guarda los resultados como nueva línea base")
+    args = parser.parse_args()
+
+    base = {}
+    if os.path.exists(RUTA_BASE) and not args.guardar:
+        with open(RUTA_BASE, encoding="utf-8") as f:
+            base = json.load(f)
+
+    resultados = {}
+    fallos = []
+    print(f"{'Programa':<16}{'mediana':>10}{'base':>10}")
+    print("-" * 36)
+    for script, marca in PUNTOS_DE_ENTRADA.items():
+        tiempos = [medir(script, marca, espera_max=args.limite * 10) for _ in range(args.repeticiones)]
+        mediana = statistics.median(tiempos)
+        resultados[script] = round(mediana, 4)
+
+        referencia = base.get(script)
+        texto_base = f"{referencia * 1000:8.1f}ms" if referencia else f"{'—':>10}"
+        print(f"{script:<16}{mediana * 1000:8.1f}ms{texto_base}")
+
+        if mediana > args.limite:
+            fallos.append(f"{script}: {mediana:.3f} s supera el presupuesto de {args.limite:.3f} s")
+        if referencia and mediana > referencia * (1 + args.tolerancia):
+            fallos.append(f"{script}: {mediana:.3f} s es más lento que la línea base ({referencia:.3f} s)")
+
+    if args.guardar:
+        with open(RUTA_BASE, "w", encoding="utf-8") as f:
+            json.dump(resultados, f, indent=2)
+        print(f"\nLínea base guardada en {RUTA_BASE}")
+
+    if fallos:
+        print("\nREGRESIÓN:")
+        for fallo in fallos:
+            print(f"• {fallo}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+Cachés que se pueden compartir entre hilos.
+
+CacheSegmentada reparte las claves en varios segmentos, cada uno con su propio
+candado, para que sesiones concurrentes no se bloqueen entre sí al consultar
+claves distintas.
+
+CacheDosNiveles guarda bytes en una LRU en memoria y en un archivo SQLite, de
+modo que lo calculado sobrevive entre sesiones (la usa modelos.py para no volver
+a analizar cláusulas ya vistas).
+"""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class CacheSegmentada:
+    """Diccionario protegido por candados: la clave decide qué segmento (y qué candado) usa."""
+
+    def __init__(self, segmentos: int = 16):
+        self._segmentos: List[Tuple[threading.Lock, Dict[Hashable, Any]]] = [
+            (threading.Lock(), {}) for _ in range(segmentos)
+        ]
+
+    def _segmento(self, clave: Hashable) -> Tuple[threading.Lock, Dict[Hashable, Any]]:
+        return self._segmentos[hash(clave) % len(self._segmentos)]
+
+    def obtener(self, clave: Hashable, defecto: Optional[Any] = None) -> Any:
+        candado, datos = self._segmento(clave)
+        with candado:
+            return datos.get(clave, defecto)
+
+    def guardar(self, clave: Hashable, valor: Any) -> Any:
+        """Guarda el valor si la clave aún no existe y devuelve el que quedó guardado (gana el primero)."""
+        candado, datos = self._segmento(clave)
+        with candado:
+            return datos.setdefault(clave, valor)
+
+    def obtener_o_calcular(self, clave: Hashable, calcular: Callable[[], Any]) -> Any:
+        """
+        Devuelve el valor guardado o lo calcula. El cálculo (ej: una consulta a Google)
+        se hace fuera del candado; si dos hilos calculan a la vez, ambos reciben el primero
+        que se guardó. Si calcular() devuelve None no se guarda nada.
+        """
+        candado, datos = self._segmento(clave)
+        with candado:
+            if clave in datos:
+                return datos[clave]
+        valor = calcular()
+        if valor is None:
+            return None
+        return self.guardar(clave, valor)
+
+    def __contains__(self, clave: Hashable) -> bool:
+        candado, datos = self._segmento(clave)
+        with candado:
+            return clave in datos
+
+    def __len__(self) -> int:
+        total = 0
+        for candado, datos in self._segmentos:
+            with candado:
+                total += len(datos)
+        return total
+
+    def limpiar(self) -> None:
+        for candado, datos in self._segmentos:
+            with candado:
+                datos.clear()
+
+
+class CacheLRU:
+    """Caché en memoria de tamaño fijo: al llenarse se descarta lo usado hace más tiempo."""
+
+    def __init__(self, maximo: int = 512):
+        self.maximo = maximo
+        self._datos: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._candado = threading.Lock()
+
+    def obtener(self, clave: Hashable) -> Optional[Any]:
+        with self._candado:
+            if clave not in self._datos:
+                return None
+            self._datos.move_to_end(clave)
+            return self._datos[clave]
+
+    def guardar(self, clave: Hashable, valor: Any) -> None:
+        if self.maximo <= 0:
+            return
+        with self._candado:
+            self._datos[clave] = valor
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.maximo:
+                self._datos.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._datos)
+
+    def limpiar(self) -> None:
+        with self._candado:
+            self._datos.clear()
+
+
+class AlmacenSQLite:
+    """
+    Tabla clave -> bytes en un archivo SQLite, con límite de filas: al pasarse del
+    máximo se borran las que llevan más tiempo sin usarse. La conexión se abre la
+    primera vez que se usa en cada proceso (una conexión no debe cruzar un fork).
+    """
+
+    # Cada cuántas escrituras se revisa el límite de filas
+    REVISAR_LIMITE_CADA = 100
+
+    def __init__(self, ruta: str, maximo: int = 20000):
+        self.ruta = ruta
+        self.maximo = maximo
+        self._escrituras = 0
+        self._conexion = None
+        self._pid = None
+        self._candado = threading.Lock()
+
+    def _conectar(self):
+        if self._conexion is None or self._pid != os.getpid():
+            import sqlite3
+            carpeta = os.path.dirname(self.ruta)
+            if carpeta:
+                os.makedirs(carpeta, exist_ok=True)
+            self._conexion = sqlite3.connect(self.ruta, timeout=5, check_same_thread=False)
+            self._conexion.execute("PRAGMA journal_mode=WAL")
+            self._conexion.execute(
+                "CREATE TABLE IF NOT EXISTS cache (clave TEXT PRIMARY KEY, valor BLOB, usado REAL)"
+            )
+            self._conexion.execute("CREATE INDEX IF NOT EXISTS cache_usado ON cache (usado)")
+            self._pid = os.getpid()
+        return self._conexion
+
+    def obtener(self, clave: str) -> Optional[bytes]:
+        with self._candado:
+            conexion = self._conectar()
+            fila = conexion.execute("SELECT valor FROM cache WHERE clave = ?", (clave,)).fetchone()
+            if fila is None:
+                return None
+            with conexion:
+                conexion.execute("UPDATE cache SET usado = ? WHERE clave = ?", (time.time(), clave))
+            return fila[0]
+
+    def guardar(self, clave: str, valor: bytes) -> None:
+        with self._candado:
+            conexion = self._conectar()
+            with conexion:
+                conexion.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?)", (clave, valor, time.time()))
+                self._escrituras += 1
+                if self._escrituras % self.REVISAR_LIMITE_CADA == 0:
+                    self.recortar()
+
+    def recortar(self) -> None:
+        """Borra las filas menos usadas que sobran del máximo (se llama con el candado tomado)."""
+        self._conectar().execute(
+            "DELETE FROM cache WHERE clave IN "
+            "(SELECT clave FROM cache ORDER BY usado DESC LIMIT -1 OFFSET ?)", (self.maximo,)
+        )
+
+    def __len__(self) -> int:
+        with self._candado:
+            return self._conectar().execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def limpiar(self) -> None:
+        with self._candado:
+            conexion = self._conectar()
+            with conexion:
+                conexion.execute("DELETE FROM cache")
+
+
+class CacheDosNiveles:
+    """
+    LRU en memoria delante de un AlmacenSQLite. Lo que se encuentra en disco se sube a
+    memoria. Si el disco falla (ej: carpeta sin permisos) se sigue solo con la memoria.
+    """
+
+    def __init__(self, memoria: CacheLRU, disco: Optional[AlmacenSQLite] = None):
+        self.memoria = memoria
+        self.disco = disco
+        self._contadores = {"memoria": 0, "disco": 0, "fallos": 0}
+        self._candado = threading.Lock()
+
+    def _contar(self, nombre: str) -> None:
+        with self._candado:
+            self._contadores[nombre] += 1
+
+    def _desactivar_disco(self, disco: AlmacenSQLite, e: Exception) -> None:
+        logging.warning(f"Caché en disco desactivada ({disco.ruta}): {e}")
+        self.disco = None
+
+    def obtener(self, clave: str) -> Optional[bytes]:
+        valor = self.memoria.obtener(clave)
+        if valor is not None:
+            self._contar("memoria")
+            return valor
+        disco = self.disco
+        if disco is not None:
+            try:
+                valor = disco.obtener(clave)
+            except Exception as e:
+                self._desactivar_disco(disco, e)
+            if valor is not None:
+                self.memoria.guardar(clave, valor)
+                self._contar("disco")
+                return valor
+        self._contar("fallos")
+        return None
+
+    def guardar(self, clave: str, valor: bytes) -> None:
+        self.memoria.guardar(clave, valor)
+        disco = self.disco
+        if disco is not None:
+            try:
+                disco.guardar(clave, valor)
+            except Exception as e:
+                self._desactivar_disco(disco, e)
+
+    def estadisticas(self) -> Dict[str, Any]:
+        with self._candado:
+            datos: Dict[str, Any] = dict(self._contadores)
+        consultas = datos["memoria"] + datos["disco"] + datos["fallos"]
+        datos["consultas"] = consultas
+        datos["tasa_aciertos"] = (datos["memoria"] + datos["disco"]) / consultas if consultas else 0.0
+        datos["en_memoria"] = len(self.memoria)
+        return datos
+
+    def limpiar(self) -> None:
+        self.memoria.limpiar()
+        if self.disco is not None:
+            self.disco.limpiar()
@@ -0,0 +1,455 @@
+# -*- coding: utf-8 -*-
+"""
+Conjugación del español a partir de datos/flexion_es.json.
+
+Cada verbo se conjuga con las terminaciones de su clase (-ar, -er, -ir) y con su
+modelo: cambio de raíz (pensar, contar, pedir), acento (enviar, continuar), raíz
+del futuro (tendr-, har-) y las filas irregulares del verbo del que deriva
+(contener y mantener se conjugan como tener, con su prefijo). Un infinitivo que
+no está en los datos pero termina como un modelo («modelos»: -tener, -poner,
+-volver, -seguir...) toma ese modelo; cualquier otro se conjuga como regular.
+Las excepciones a las reglas ortográficas también están en los datos: «sin_zc»
+(cocer -> cuezo, mecer -> mezo, no -zco) y «sin_cierre» (discernir -> discernió,
+no *discirnió); los derivados de paradigmas monosílabos se acentúan (prever -> prevé).
+
+Tiempos: presente, pretérito, imperfecto, futuro y condicional de indicativo,
+presente e imperfecto (-ra y -se) de subjuntivo; además gerundio y participio.
+
+El Conjugador es la instantánea del léxico: guarda los modelos y las
+conjugaciones ya calculadas, y los índices que otros módulos arman a partir de
+él (indice), así que todo se rehace cuando se edita el archivo. Uno de ellos es
+el índice inverso de las formas de los verbos del léxico: lecturas(forma) da
+todas las (infinitivo, persona, tiempo) posibles de una palabra en una consulta.
+Si está compilado (lexico_compilado.py, tabla «formas_es»), se consulta en el
+archivo en lugar de armarlo en memoria.
+"""
+import re
+import threading
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import lexico_compilado
+from lexicos import LexicoVigilado
+
+PERSONAS = ("1s", "2s", "3s", "1p", "2p", "3p")
+
+# --- TERMINACIONES POR CLASE ---
+PRESENTE = {
+    "ar": ("o", "as", "a", "amos", "áis", "an"),
+    "er": ("o", "es", "e", "emos", "éis", "en"),
+    "ir": ("o", "es", "e", "imos", "ís", "en"),
+}
+PRETERITO = {
+    "ar": ("é", "aste", "ó", "amos", "asteis", "aron"),
+    "er": ("í", "iste", "ió", "imos", "isteis", "ieron"),
+    "ir": ("í", "iste", "ió", "imos", "isteis", "ieron"),
+}
+IMPERFECTO = {
+    "ar": ("aba", "abas", "aba", "ábamos", "abais", "aban"),
+    "er": ("ía", "ías", "ía", "íamos", "íais", "ían"),
+    "ir": ("ía", "ías", "ía", "íamos", "íais", "ían"),
+}
+SUBJUNTIVO_PRESENTE = {
+    "ar": ("e", "es", "e", "emos", "éis", "en"),
+    "er": ("a", "as", "a", "amos", "áis", "an"),
+    "ir": ("a", "as", "a", "amos", "áis", "an"),
+}
+FUTURO = ("é", "ás", "á", "emos", "éis", "án")
+CONDICIONAL = ("ía", "ías", "ía", "íamos", "íais", "ían")
+PRETERITO_FUERTE = ("e", "iste", "o", "imos", "isteis", "ieron")
+# Sobre la raíz de la 3p del pretérito sin «ron» (estuvie-, deja-)
+SUBJUNTIVO_IMPERFECTO = ("ra", "ras", "ra", "ramos", "rais", "ran")
+SUBJUNTIVO_IMPERFECTO_SE = ("se", "ses", "se", "semos", "seis", "sen")
+
+TIEMPOS_INDICATIVO = ("presente", "preterito", "imperfecto", "futuro", "condicional")
+TIEMPOS = TIEMPOS_INDICATIVO + ("subjuntivo_presente", "subjuntivo_imperfecto", "subjuntivo_imperfecto_se")
+NO_FINITAS = ("infinitivo", "gerundio", "participio")
+
+# Personas en las que cambia la raíz (presente: yo, tú, él, ellos; pretérito -ir: él, ellos)
+PERSONAS_DIPTONGO = (0, 1, 2, 5)
+PERSONAS_PRETERITO_IR = (2, 5)
+# Nosotros y vosotros del subjuntivo: sin diptongo ni acento (pensemos, enviemos; -ir: sintamos)
+PERSONAS_RAIZ_LLANA = (3, 4)
+
+VOCALES = "aeiouáéíóú"
+ACENTUAR = str.maketrans("aeiou", "áéíóú")
+SIN_TILDE = str.maketrans("áéíóú", "aeiou")
+
+# Vocal de la raíz que se cierra en las -ir con cambio (sintió, pidiendo, durmamos)
+CIERRE_IR = {"e": "i", "o": "u"}
+
+
+class Lectura(NamedTuple):
+    infinitivo: str
+    persona: str    # "1s" ... "3p"; "" en las formas no finitas
+    tiempo: str     # uno de TIEMPOS o de NO_FINITAS
+
+
+class ModeloVerbal(NamedTuple):
+    clase: str                  # "ar", "er" o "ir"
+    paradigma: Optional[str]    # verbo cuyas filas irregulares se toman (tener para contener)
+    prefijo: str                # lo que se antepone a esas filas ("con")
+    cambio: Optional[str]       # "e>ie", "o>ue"...
+    acento: Optional[str]       # "í" o "ú"
+    raiz_futuro: Optional[str]  # "tendr", "contendr"
+    cierra: bool                # -ir que cierra la vocal (sintió, durmiendo); no discernir, concernir
+    zco: bool                   # vocal + -cer/-cir hace -zco (conozco); no cocer (cuezo) ni mecer (mezo)
+
+
+# --- REGLAS ---
+
+def cambiar_ultima(raiz: str, vocal: str, nueva: str) -> str:
+    posicion = raiz.rfind(vocal)
+    return raiz if posicion < 0 else raiz[:posicion] + nueva + raiz[posicion + 1:]
+
+
+def diptongar(raiz: str, vieja: str, nueva: str) -> str:
+    """Raíz con el diptongo (pens -> piens); tras g lleva diéresis (degoll -> degüell, avergonz -> avergüenz)."""
+    posicion = raiz.rfind(vieja)
+    if nueva.startswith("u") and raiz[posicion - 1:posicion] == "g":
+        nueva = "ü" + nueva[1:]
+    return cambiar_ultima(raiz, vieja, nueva)
+
+
+def cerrar_raiz(raiz: str, cambio: Optional[str]) -> str:
+    """Raíz de una -ir con la vocal cerrada (sent -> sint, dorm -> durm); igual si no corresponde."""
+    vieja = cambio.split(">")[0] if cambio else ""
+    return cambiar_ultima(raiz, vieja, CIERRE_IR[vieja]) if vieja in CIERRE_IR else raiz
+
+
+def raiz_cerrada(raiz: str, modelo: ModeloVerbal) -> str:
+    """La raíz cerrada si el modelo cierra la vocal (solo -ir); igual si no."""
+    return cerrar_raiz(raiz, modelo.cambio) if modelo.clase == "ir" and modelo.cierra else raiz
+
+
+def silabas(forma: str) -> int:
+    # Dos vocales fuertes seguidas van en sílabas distintas (ve-o); las demás forman diptongo (vio)
+    grupos = re.findall(r"[aeiouü]+", forma)
+    return sum(1 + sum(a in "aeo" and b in "aeo" for a, b in zip(grupo, grupo[1:])) for grupo in grupos)
+
+
+def con_prefijo(prefijo: str, forma: str) -> str:
+    """
+    Forma de un paradigma con el prefijo del derivado. Un monosílabo sin tilde pasa a ser
+    aguda y la lleva si termina en vocal, n o s (ve -> prevé, vio -> previó, veis -> prevéis).
+    """
+    if not prefijo or forma.translate(SIN_TILDE) != forma or silabas(forma) != 1 or forma[-1] not in "aeiouns":
+        return prefijo + forma
+    vocales = [i for i, letra in enumerate(forma) if letra in "aeiou"]
+    fuertes = [i for i in vocales if forma[i] in "aeo"]
+    i = (fuertes or vocales)[-1]
+    return prefijo + forma[:i] + forma[i].translate(ACENTUAR) + forma[i + 1:]
+
+
+def conjugar_indicativo(infinitivo: str, modelo: ModeloVerbal) -> Dict[str, List[str]]:
+    """Formas regulares (con cambios de raíz y ortográficos) de los cinco tiempos del indicativo."""
+    clase = modelo.clase
+    raiz = infinitivo[:-2]
+    futuro = modelo.raiz_futuro or infinitivo.replace("í", "i")
+
+    presente = [raiz + t for t in PRESENTE[clase]]
+    preterito = [raiz + t for t in PRETERITO[clase]]
+    imperfecto = [raiz + t for t in IMPERFECTO[clase]]
+
+    # Cambios de raíz (e>ie, o>ue, e>i, u>ue, i>ie)
+    if modelo.cambio:
+        vieja, nueva = modelo.cambio.split(">")
+        for p in PERSONAS_DIPTONGO:
+            presente[p] = diptongar(raiz, vieja, nueva) + PRESENTE[clase][p]
+        if clase == "ir" and modelo.cierra and vieja in CIERRE_IR:
+            for p in PERSONAS_PRETERITO_IR:
+                preterito[p] = cerrar_raiz(raiz, modelo.cambio) + PRETERITO[clase][p]
+    raiz_presente = presente[0][:-1]
+
+    # Acento en la raíz: envío, continúo, reúno, aíslo, prohíbo
+    acento = modelo.acento
+    if acento:
+        for p in PERSONAS_DIPTONGO:
+            presente[p] = cambiar_ultima(raiz, acento.translate(SIN_TILDE), acento) + PRESENTE[clase][p]
+        raiz_presente = presente[0][:-1]
+
+    # Ortografía de la primera persona del presente
+    if infinitivo.endswith(("ger", "gir")):
+        presente[0] = raiz_presente[:-1] + "jo"
+    elif infinitivo.endswith("guir"):
+        presente[0] = raiz_presente[:-2] + "go"
+    elif infinitivo.endswith("quir"):
+        presente[0] = raiz_presente[:-2] + "co"
+    elif infinitivo.endswith(("cer", "cir")):
+        if modelo.zco and raiz_presente[-2] in VOCALES:
+            presente[0] = raiz_presente[:-1] + "zco"
+        else:
+            presente[0] = raiz_presente[:-1] + "zo"
+
+    # Verbos en -uir (construir, argüir): construyo, construyó, arguyo (sin diéresis ante y)
+    if clase == "ir" and raiz.endswith(("u", "ü")) and not raiz.endswith(("gu", "qu")):
+        raiz_y = raiz[:-1] + "uy"
+        for p in PERSONAS_DIPTONGO:
+            presente[p] = raiz_y + PRESENTE[clase][p]
+        preterito[2], preterito[5] = raiz_y + "ó", raiz_y + "eron"
+    # Raíz terminada en vocal (leer, creer, poseer): leyó, leíste
+    elif clase != "ar" and raiz[-1:] in ("a", "e", "o"):
+        preterito = [raiz + t for t in ("í", "íste", "yó", "ímos", "ísteis", "yeron")]
+    # Raíz en ñ o ll (gruñir, reñir, bullir, tañer): la i de -ió, -ieron se pierde
+    elif clase != "ar" and raiz.endswith(("ñ", "ll")):
+        preterito[2], preterito[5] = preterito[2][:-2] + "ó", preterito[5][:-5] + "eron"
+
+    # Pretérito en -ducir (conduje, tradujo)
+    if infinitivo.endswith("ducir"):
+        preterito = [raiz[:-1] + "j" + t for t in PRETERITO_FUERTE]
+        preterito[5] = raiz[:-1] + "jeron"
+
+    # Ortografía de la primera persona del pretérito (busqué, llegué, empecé, averigüé)
+    if infinitivo.endswith("car"):
+        preterito[0] = raiz[:-1] + "qué"
+    elif infinitivo.endswith("guar"):
+        preterito[0] = raiz[:-1] + "üé"
+    elif infinitivo.endswith("gar"):
+        preterito[0] = raiz + "ué"
+    elif infinitivo.endswith("zar"):
+        preterito[0] = raiz[:-1] + "cé"
+
+    return {
+        "presente": presente,
+        "preterito": preterito,
+        "imperfecto": imperfecto,
+        "futuro": [futuro + t for t in FUTURO],
+        "condicional": [futuro + t for t in CONDICIONAL],
+    }
+
+
+def ortografia_subjuntivo(raiz: str, clase: str) -> str:
+    """Raíz lista para las terminaciones del subjuntivo (busque, llegue, empiece, averigüe; sigamos, elijamos, torzamos)."""
+    if clase == "ar":
+        if raiz.endswith("gu"):
+            return raiz[:-1] + "ü"
+        if raiz.endswith("c"):
+            return raiz[:-1] + "qu"
+        if raiz.endswith("g"):
+            return raiz + "u"
+        if raiz.endswith("z"):
+            return raiz[:-1] + "c"
+        return raiz
+    if raiz.endswith("gu"):
+        return raiz[:-1]
+    if raiz.endswith("g"):
+        return raiz[:-1] + "j"
+    if raiz.endswith("c"):
+        return raiz[:-1] + "z"
+    return raiz
+
+
+def subjuntivo_presente(infinitivo: str, modelo: ModeloVerbal, presente: List[str]) -> List[str]:
+    """Sobre la raíz de «yo» del presente (tengo -> tenga, conozco -> conozca, pienso -> piense)."""
+    terminaciones = SUBJUNTIVO_PRESENTE[modelo.clase]
+    raiz = infinitivo[:-2]
+    fuerte = presente[0][:-1] if presente[0].endswith("o") else raiz
+    if modelo.clase == "ar":
+        fuerte = ortografia_subjuntivo(fuerte, "ar")
+    formas = [fuerte + t for t in terminaciones]
+    if modelo.cambio or modelo.acento:
+        llana = raiz_cerrada(raiz, modelo)
+        llana = ortografia_subjuntivo(llana, modelo.clase)
+        for p in PERSONAS_RAIZ_LLANA:
+            formas[p] = llana + terminaciones[p]
+    return formas
+
+
+def subjuntivo_imperfecto(preterito: List[str], terminaciones: Tuple[str, ...] = SUBJUNTIVO_IMPERFECTO) -> List[str]:
+    """Sobre la 3p del pretérito: estuvieron -> estuviera, estuviéramos (o estuviese, estuviésemos)."""
+    raiz = preterito[5][:-3]
+    formas = [raiz + t for t in terminaciones]
+    formas[3] = raiz[:-1] + raiz[-1:].translate(ACENTUAR) + terminaciones[3]
+    return formas
+
+
+# Versión de las reglas con que se arma el índice (entra en la huella de los compilados):
+# se sube al cambiar una regla que cambie las formas o las lecturas
+VERSION_INDICE = 1
+
+
+def construir_indice_formas(conjugador: "Conjugador") -> Dict[str, Tuple[Lectura, ...]]:
+    """Forma -> sus lecturas, para todos los verbos del léxico (en orden: verbo, tiempo, persona)."""
+    indice: Dict[str, List[Lectura]] = {}
+    for verbo in conjugador.verbos:
+        for tiempo, formas in conjugador.conjugar(verbo).items():
+            for persona, forma in zip(PERSONAS, formas):
+                indice.setdefault(forma, []).append(Lectura(verbo, persona, tiempo))
+        for tiempo, forma in zip(NO_FINITAS, (verbo, *conjugador.formas_no_finitas(verbo))):
+            indice.setdefault(forma, []).append(Lectura(verbo, "", tiempo))
+    for forma, (verbo, persona) in conjugador.datos["formas_sueltas"].items():
+        indice.setdefault(forma, []).append(Lectura(verbo, persona, "presente"))
+    return {forma: tuple(lecturas) for forma, lecturas in indice.items()}
+
+
+def pares_formas(datos: dict) -> Iterator[Tuple[str, str]]:
+    """(forma, lecturas) del índice inverso de estos datos, para lexico_compilado.py."""
+    for forma, lecturas in construir_indice_formas(Conjugador(datos)).items():
+        yield forma, "\t".join(" ".join(lectura) for lectura in lecturas)
+
+
+def decodificar_lecturas(valor: str) -> Tuple[Lectura, ...]:
+    return tuple(Lectura(*lectura.split(" ")) for lectura in valor.split("\t"))
+
+
+# --- INSTANTÁNEA DEL LÉXICO ---
+
+class Conjugador:
+    """Los modelos de datos/flexion_es.json y las conjugaciones ya calculadas."""
+
+    def __init__(self, datos: dict):
+        self.datos = datos
+        self.cambios = {verbo: cambio for cambio, verbos in datos["cambios_raiz"].items() for verbo in verbos}
+        self.acentos = {verbo: vocal for vocal, verbos in datos["acentos"].items() for verbo in verbos}
+        self.raices_futuro = dict(datos["raices_futuro"])
+        self.paradigmas = {
+            verbo: {tiempo: tuple(formas.split()) for tiempo, formas in tiempos.items()}
+            for verbo, tiempos in datos["paradigmas"].items()
+        }
+        self.derivados = {derivado: base for base, derivados in datos["derivados"].items() for derivado in derivados}
+        # El sufijo más largo gana (volver antes que ver, si lo hubiera)
+        self.modelos = sorted(datos["modelos"].items(), key=lambda par: -len(par[0]))
+        self.fuera_de_modelo = frozenset(datos["fuera_de_modelo"])
+        self.sin_cierre = frozenset(datos["sin_cierre"])
+        self.sin_zc = frozenset(datos["sin_zc"])
+        self.gerundios = dict(datos["gerundios"])
+        self.participios = dict(datos["participios"])
+        self.sufijos_participio = sorted(datos["sufijos_participio"].items(), key=lambda par: -len(par[0]))
+        self.verbos = tuple(sorted(
+            set(datos["verbos"]) | set(self.paradigmas) | set(self.derivados) | set(self.cambios) | set(self.acentos)))
+
+        self._modelos: Dict[str, Optional[ModeloVerbal]] = {}
+        self._conjugaciones: Dict[str, Dict[str, Tuple[str, ...]]] = {}
+        self._no_finitas: Dict[str, Tuple[str, str]] = {}
+        self._indices: Dict[str, Any] = {}
+        self._candado = threading.RLock()
+        self._formas_compiladas = lexico_compilado.abrir("formas_es", datos, decodificar_lecturas, VERSION_INDICE)
+
+    # --- Modelos ---
+
+    def modelo(self, infinitivo: str) -> Optional[ModeloVerbal]:
+        """Modelo del verbo; None si no parece un infinitivo."""
+        if infinitivo in self._modelos:
+            return self._modelos[infinitivo]
+        modelo = self._modelos[infinitivo] = self._buscar_modelo(infinitivo)
+        return modelo
+
+    def _buscar_modelo(self, infinitivo: str) -> Optional[ModeloVerbal]:
+        if not infinitivo.endswith(("ar", "er", "ir", "ír")) or (len(infinitivo) < 3 and infinitivo not in self.paradigmas):
+            return None
+        base, prefijo = infinitivo, ""
+        if infinitivo in self.derivados:
+            base = self.derivados[infinitivo]
+            prefijo = infinitivo[:len(infinitivo) - len(base)]
+        elif infinitivo not in self.paradigmas and infinitivo not in self.fuera_de_modelo:
+            for sufijo, verbo_modelo in self.modelos:
+                if infinitivo.endswith(sufijo) and infinitivo != sufijo:
+                    # -tener toma las filas de tener; -solver solo el cambio de raíz de resolver
+                    base = verbo_modelo
+                    if verbo_modelo == sufijo:
+                        prefijo = infinitivo[:-len(sufijo)]
+                    break
+
+        paradigma = base if base in self.paradigmas and prefijo + base == infinitivo else None
+        raiz_futuro = self.raices_futuro.get(infinitivo)
+        if raiz_futuro is None and paradigma in self.raices_futuro:
+            raiz_futuro = prefijo + self.raices_futuro[paradigma]
+        return ModeloVerbal(
+            clase=infinitivo[-2:].replace("í", "i"),
+            paradigma=paradigma,
+            prefijo=prefijo,
+            cambio=self.cambios.get(infinitivo, self.cambios.get(base)),
+            acento=self.acentos.get(infinitivo, self.acentos.get(base)),
+            raiz_futuro=raiz_futuro,
+            cierra=infinitivo not in self.sin_cierre and base not in self.sin_cierre,
+            zco=infinitivo not in self.sin_zc and base not in self.sin_zc,
+        )
+
+    # --- Formas ---
+
+    def conjugar(self, infinitivo: str) -> Optional[Dict[str, Tuple[str, ...]]]:
+        """Tiempo -> las seis formas (en el orden de PERSONAS). None si no es un infinitivo."""
+        conjugacion = self._conjugaciones.get(infinitivo)
+        if conjugacion is None:
+            modelo = self.modelo(infinitivo)
+            if modelo is None:
+                return None
+            conjugacion = self._conjugaciones[infinitivo] = self._conjugar(infinitivo, modelo)
+        return conjugacion
+
+    def _conjugar(self, infinitivo: str, modelo: ModeloVerbal) -> Dict[str, Tuple[str, ...]]:
+        tiempos = conjugar_indicativo(infinitivo, modelo)
+        for tiempo, formas in self.paradigmas.get(modelo.paradigma, {}).items():
+            tiempos[tiempo] = [con_prefijo(modelo.prefijo, forma) for forma in formas]
+        if "subjuntivo_presente" not in tiempos:
+            tiempos["subjuntivo_presente"] = subjuntivo_presente(infinitivo, modelo, tiempos["presente"])
+        if "subjuntivo_imperfecto" not in tiempos:
+            tiempos["subjuntivo_imperfecto"] = subjuntivo_imperfecto(tiempos["preterito"])
+        if "subjuntivo_imperfecto_se" not in tiempos:
+            tiempos["subjuntivo_imperfecto_se"] = subjuntivo_imperfecto(tiempos["preterito"], SUBJUNTIVO_IMPERFECTO_SE)
+        return {tiempo: tuple(tiempos[tiempo]) for tiempo in TIEMPOS}
+
+    def formas_no_finitas(self, infinitivo: str) -> Tuple[str, str]:
+        """(gerundio, participio); ("", "") si no es un infinitivo."""
+        formas = self._no_finitas.get(infinitivo)
+        if formas is None:
+            modelo = self.modelo(infinitivo)
+            formas = ("", "") if modelo is None else (
+                self._gerundio(infinitivo, modelo), self._participio(infinitivo, modelo))
+            self._no_finitas[infinitivo] = formas
+        return formas
+
+    def _gerundio(self, infinitivo: str, modelo: ModeloVerbal) -> str:
+        if infinitivo in self.gerundios:
+            return self.gerundios[infinitivo]
+        if modelo.paradigma in self.gerundios:
+            return modelo.prefijo + self.gerundios[modelo.paradigma]
+        raiz = infinitivo[:-2]
+        if modelo.clase == "ar":
+            return raiz + "ando"
+        raiz = raiz_cerrada(raiz, modelo)
+        if raiz.endswith("ü"):
+            return raiz[:-1] + "uyendo"
+        if raiz[-1:] in VOCALES and not raiz.endswith(("gu", "qu")):
+            return raiz + "yendo"
+        if raiz.endswith(("ñ", "ll")):
+            return raiz + "endo"
+        return raiz + "iendo"
+
+    def _participio(self, infinitivo: str, modelo: ModeloVerbal) -> str:
+        if infinitivo in self.participios:
+            return self.participios[infinitivo]
+        if modelo.paradigma in self.participios:
+            return modelo.prefijo + self.participios[modelo.paradigma]
+        for sufijo, terminacion in self.sufijos_participio:
+            if infinitivo.endswith(sufijo):
+                return infinitivo[:-len(sufijo)] + terminacion
+        raiz = infinitivo[:-2]
+        if modelo.clase == "ar":
+            return raiz + "ado"
+        return raiz + ("ído" if raiz[-1:] in "aeo" and raiz else "ido")
+
+    def tabla_perifrasis(self, infinitivo: str, tiempo: str) -> Dict[str, str]:
+        """Persona -> forma, como las tablas de aktionsart (ESTAR, HABER...); 2p lleva «ustedes/vosotros»."""
+        formas = self.conjugar(infinitivo)[tiempo]
+        tabla = dict(zip(PERSONAS, formas))
+        tabla["2p"] = f"{formas[5]}/{formas[4]}"
+        return tabla
+
+    def lecturas(self, forma: str) -> Tuple[Lectura, ...]:
+        """Todas las lecturas de una forma (en minúsculas) de un verbo del léxico; () si no hay."""
+        if self._formas_compiladas is not None:
+            return self._formas_compiladas.get(forma, ())
+        return self.indice("formas", construir_indice_formas).get(forma, ())
+
+    def indice(self, nombre: str, construir: Callable[["Conjugador"], Any]) -> Any:
+        """Un índice armado a partir de esta instantánea (una sola vez; se rehace al recargar el léxico)."""
+        valor = self._indices.get(nombre)
+        if valor is None:
+            with self._candado:
+                valor = self._indices.get(nombre)
+                if valor is None:
+                    valor = self._indices[nombre] = construir(self)
+        return valor
+
+
+LEXICO_CONJUGACION = LexicoVigilado("flexion_es.json", Conjugador)
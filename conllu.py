@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+Lectura de oraciones ya analizadas en formato CoNLL-U (Universal Dependencies).
+
+OracionConllu imita la parte de un Doc de spaCy que usan los extractores
+(aktionsart.extraer_datos y english.extract_data): se recorre, se indexa y se
+corta igual, y cada palabra tiene text, i, pos_, dep_, lemma_, morph.to_dict() y
+head. Así una oración con análisis de referencia se procesa sin pasar por el
+modelo.
+
+Las contracciones (líneas con rango, ej: «1-2 del») se separan en sus palabras
+sintácticas, como hace UD; el texto de un tramo usa la forma de superficie
+cuando el tramo cubre la contracción entera.
+
+Uso como script (muestra lo que extraería el analizador):
+    python conllu.py corpus.conllu
+"""
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class Morfologia:
+    def __init__(self, rasgos: str):
+        self._rasgos: Dict[str, str] = {}
+        if rasgos and rasgos != "_":
+            for par in rasgos.split("|"):
+                clave, _, valor = par.partition("=")
+                self._rasgos[clave] = valor
+
+    def to_dict(self) -> Dict[str, str]:
+        return dict(self._rasgos)
+
+    def get(self, clave: str) -> List[str]:
+        return [self._rasgos[clave]] if clave in self._rasgos else []
+
+    def __str__(self) -> str:
+        return "|".join(f"{clave}={valor}" for clave, valor in self._rasgos.items())
+
+
+class PalabraConllu:
+    def __init__(self, oracion: "OracionConllu", i: int, campos: List[str]):
+        self.doc = oracion
+        self.i = i
+        self.text = campos[1]
+        self.lemma_ = campos[2] if campos[2] != "_" else campos[1]
+        self.pos_ = campos[3]
+        self.tag_ = campos[4] if campos[4] != "_" else ""
+        self.morph = Morfologia(campos[5])
+        self._cabeza = int(campos[6]) - 1 if campos[6].isdigit() and campos[6] != "0" else i
+        # spaCy llama ROOT a la raíz; UD la llama root
+        self.dep_ = "ROOT" if campos[7] == "root" else campos[7]
+        self.whitespace_ = "" if "SpaceAfter=No" in campos[9] else " "
+
+    @property
+    def head(self) -> "PalabraConllu":
+        return self.doc[self._cabeza]
+
+    @property
+    def text_with_ws(self) -> str:
+        return self.text + self.whitespace_
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __str__(self) -> str:
+        return self.text
+
+    __repr__ = __str__
+
+
+class TramoConllu:
+    """Equivalente a un Span de spaCy: palabras consecutivas de la oración."""
+
+    def __init__(self, oracion: "OracionConllu", inicio: int, fin: int):
+        self.doc = oracion
+        self.start = inicio
+        self.end = fin
+
+    def __iter__(self) -> Iterator[PalabraConllu]:
+        return iter(self.doc.palabras[self.start:self.end])
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __getitem__(self, indice):
+        return self.doc.palabras[self.start:self.end][indice]
+
+    @property
+    def text(self) -> str:
+        return self.doc.texto_entre(self.start, self.end)
+
+
+class OracionConllu:
+    def __init__(self, lineas: Iterable[str]):
+        self.metadatos: Dict[str, str] = {}
+        self.palabras: List[PalabraConllu] = []
+        # primera palabra de la contracción -> (última palabra, forma de superficie, espacio después)
+        self.contracciones: Dict[int, Tuple[int, str, str]] = {}
+
+        for linea in lineas:
+            linea = linea.rstrip("\n")
+            if not linea.strip():
+                continue
+            if linea.startswith("#"):
+                clave, _, valor = linea[1:].partition("=")
+                self.metadatos[clave.strip()] = valor.strip()
+                continue
+            campos = linea.split("\t")
+            if len(campos) != 10:
+                raise ValueError(f"Línea CoNLL-U con {len(campos)} columnas (se esperaban 10): {linea!r}")
+            identificador = campos[0]
+            if "." in identificador:
+                # Nodos vacíos (análisis mejorado): no son palabras de la oración
+                continue
+            if "-" in identificador:
+                primera, ultima = (int(n) - 1 for n in identificador.split("-"))
+                espacio = "" if "SpaceAfter=No" in campos[9] else " "
+                self.contracciones[primera] = (ultima, campos[1], espacio)
+                continue
+            self.palabras.append(PalabraConllu(self, len(self.palabras), campos))
+
+    def __iter__(self) -> Iterator[PalabraConllu]:
+        return iter(self.palabras)
+
+    def __len__(self) -> int:
+        return len(self.palabras)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            inicio, fin, _ = indice.indices(len(self.palabras))
+            return TramoConllu(self, inicio, max(inicio, fin))
+        return self.palabras[indice]
+
+    def texto_entre(self, inicio: int, fin: int) -> str:
+        partes = []
+        i = inicio
+        while i < fin:
+            contraccion = self.contracciones.get(i)
+            if contraccion and contraccion[0] < fin:
+                ultima, forma, espacio = contraccion
+                partes.append(forma + espacio)
+                i = ultima + 1
+            else:
+                partes.append(self.palabras[i].text_with_ws)
+                i += 1
+        return "".join(partes).strip()
+
+    @property
+    def text(self) -> str:
+        return self.metadatos.get("text") or self.texto_entre(0, len(self.palabras))
+
+    @property
+    def ident(self) -> Optional[str]:
+        return self.metadatos.get("sent_id")
+
+
+def leer_conllu(entrada: Iterable[str]) -> Iterator[Tuple[OracionConllu, int]]:
+    """Lee oraciones una a una (en flujo). Devuelve (oración, número de su primera línea)."""
+    bloque: List[str] = []
+    inicio = 1
+    for numero, linea in enumerate(entrada, start=1):
+        if linea.strip():
+            if not bloque:
+                inicio = numero
+            bloque.append(linea)
+        elif bloque:
+            yield OracionConllu(bloque), inicio
+            bloque = []
+    if bloque:
+        yield OracionConllu(bloque), inicio
+
+
+def main() -> None:
+    import aktionsart
+    if len(sys.argv) < 2:
+        print("Uso: python conllu.py archivo.conllu")
+        return
+    with open(sys.argv[1], encoding="utf-8") as f:
+        for oracion, _ in leer_conllu(f):
+            datos = aktionsart.DatosClause()
+            exito, verbo, infinitivo = aktionsart.analizar_automaticamente(oracion, datos)
+            print(f"«{oracion.text}» -> {verbo or '?'} ({infinitivo or '?'}) {datos if exito else ''}")
+
+
+if __name__ == "__main__":
+    main()
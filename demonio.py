@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""
+Modo demonio de Vendler.
+
+El demonio importa los programas y carga los modelos de spaCy una sola vez.
+Cada conexión se atiende en un proceso hijo (fork) que hereda todo ya cargado
+y conecta su entrada y salida estándar al socket, así que las preguntas de
+peticion() llegan al cliente tal cual y las respuestas vuelven por el mismo
+canal.
+
+Uso:
+    python demonio.py servir            # inicia el demonio (un hijo por conexión)
+    python demonio.py servir --trabajadores 8   # pre-fork: 8 trabajadores fijos
+    python demonio.py [programa]        # cliente: aktionsart (por defecto), ls, english, info o menu
+
+El cliente solo usa la biblioteca estándar: no importa spaCy ni deep_translator.
+"""
+import gc
+import logging
+import os
+import select
+import signal
+import socket
+import sys
+import tempfile
+
+from trabajadores import PiscinaPrefork, congelar_memoria, informe_memoria, preparar_carga
+
+RUTA_SOCKET = os.environ.get(
+    "VENDLER_SOCKET",
+    os.path.join(tempfile.gettempdir(), f"vendler-{os.getuid() if hasattr(os, 'getuid') else 0}.sock")
+)
+
+PROGRAMAS = {
+    "aktionsart": "aktionsart",
+    "ls": "ls",
+    "english": "english",
+    "info": "info",
+    "menu": "main",
+}
+
+
+# --- SERVIDOR ---
+
+def precargar_programas() -> None:
+    """
+    Importa todos los programas, espera a que los modelos queden en memoria y deja
+    vigilados los léxicos: cada hijo nuevo hereda la última versión cargada.
+    """
+    import importlib
+    for nombre_modulo in PROGRAMAS.values():
+        importlib.import_module(nombre_modulo)
+
+    import motor
+    motor.precargar_modelos()
+    for paquete in motor.PAQUETES.values():
+        paquete.modelo.obtener()
+
+    import conjugacion
+    import flexion_en
+    vigilar_lexicos()
+    # Los índices inversos de formas (sanacion.py, english.py) se arman antes del fork, una sola vez
+    conjugacion.LEXICO_CONJUGACION.actual().lecturas("")
+    flexion_en.LEXICON_INFLECTION.actual().readings("")
+
+
+def vigilar_lexicos() -> None:
+    """Inicia en este proceso los hilos que recargan los léxicos (no sobreviven a fork)."""
+    import conjugacion
+    import flexion_en
+    import ls
+    conjugacion.LEXICO_CONJUGACION.vigilar()
+    flexion_en.LEXICON_INFLECTION.vigilar()
+    ls.LEXICO_LS.vigilar()
+
+
+def crear_socket_servidor() -> socket.socket:
+    if os.path.exists(RUTA_SOCKET):
+        prueba = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            prueba.connect(RUTA_SOCKET)
+            raise RuntimeError(f"Ya hay un demonio escuchando en {RUTA_SOCKET}.")
+        except (ConnectionRefusedError, FileNotFoundError):
+            # Socket huérfano de una ejecución anterior
+            os.unlink(RUTA_SOCKET)
+        finally:
+            prueba.close()
+
+    servidor = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # El socket se crea ya sin permisos para otros usuarios (un chmod posterior deja un hueco)
+    umask_anterior = os.umask(0o177)
+    try:
+        servidor.bind(RUTA_SOCKET)
+    finally:
+        os.umask(umask_anterior)
+    os.chmod(RUTA_SOCKET, 0o600)
+    servidor.listen()
+    return servidor
+
+
+def leer_cabecera(conexion: socket.socket) -> str:
+    """Lee la primera línea byte a byte, para no consumir las respuestas que vienen detrás."""
+    datos = bytearray()
+    while True:
+        byte = conexion.recv(1)
+        if not byte or byte == b"\n":
+            return datos.decode("utf-8", errors="replace").strip()
+        datos += byte
+
+
+def ejecutar_sesion(conexion: socket.socket) -> int:
+    """Conecta la E/S estándar al socket, corre el programa pedido y deja la E/S como estaba."""
+    import importlib
+
+    cabecera = leer_cabecera(conexion).split()
+    programa = cabecera[0] if cabecera else "aktionsart"
+    if len(cabecera) > 1:
+        os.environ["TERM"] = cabecera[1]
+
+    originales = [os.dup(fd) for fd in (0, 1, 2)]
+    std_originales = (sys.stdin, sys.stdout, sys.stderr)
+    for fd in (0, 1, 2):
+        os.dup2(conexion.fileno(), fd)
+    sys.stdin = open(0, "r", encoding="utf-8", closefd=False)
+    sys.stdout = open(1, "w", encoding="utf-8", buffering=1, closefd=False)
+    sys.stderr = open(2, "w", encoding="utf-8", buffering=1, closefd=False)
+
+    codigo = 0
+    try:
+        if programa not in PROGRAMAS:
+            print(f"Programa desconocido: «{programa}». Opciones: {', '.join(PROGRAMAS)}.")
+            codigo = 1
+        else:
+            importlib.import_module(PROGRAMAS[programa]).main()
+    except (SystemExit, EOFError, BrokenPipeError):
+        pass
+    except Exception as e:
+        logging.error(f"Error en la sesión: {e}")
+        codigo = 1
+    finally:
+        try:
+            sys.stdout.flush()
+        except OSError:
+            pass
+        for fd, copia in zip((0, 1, 2), originales):
+            os.dup2(copia, fd)
+            os.close(copia)
+        sys.stdin, sys.stdout, sys.stderr = std_originales
+    return codigo
+
+
+def atender(conexion: socket.socket) -> None:
+    """Se ejecuta en un hijo creado para una sola conexión."""
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    gc.enable()
+    os._exit(ejecutar_sesion(conexion))
+
+
+def bucle_trabajador(servidor: socket.socket) -> None:
+    """Se ejecuta en cada trabajador pre-fork: atiende conexiones una tras otra."""
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    # Un trabajador vive mucho: vigila los léxicos por su cuenta, aunque el programa no llame a vigilar()
+    vigilar_lexicos()
+    while True:
+        conexion, _ = servidor.accept()
+        try:
+            ejecutar_sesion(conexion)
+        finally:
+            conexion.close()
+
+
+def servir(trabajadores: int = 0) -> None:
+    """
+    Con trabajadores=0 se crea un hijo por conexión; con trabajadores>0 se crean de antemano
+    esa cantidad de procesos que comparten el socket y la memoria ya cargada.
+    """
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    logging.info("Cargando programas y modelos...")
+    preparar_carga()
+    precargar_programas()
+    servidor = crear_socket_servidor()
+
+    if trabajadores > 0:
+        servir_prefork(servidor, trabajadores)
+        return
+
+    congelar_memoria()
+    # Los hijos terminados se recogen solos
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    logging.info(f"Demonio listo en {RUTA_SOCKET}")
+
+    try:
+        while True:
+            conexion, _ = servidor.accept()
+            pid = os.fork()
+            if pid == 0:
+                servidor.close()
+                atender(conexion)
+            conexion.close()
+    except KeyboardInterrupt:
+        logging.info("Deteniendo el demonio.")
+    finally:
+        servidor.close()
+        if os.path.exists(RUTA_SOCKET):
+            os.unlink(RUTA_SOCKET)
+
+
+def servir_prefork(servidor: socket.socket, trabajadores: int) -> None:
+    piscina = PiscinaPrefork(trabajadores, lambda: bucle_trabajador(servidor))
+
+    def informar(*_):
+        logging.info("Memoria por proceso (padre primero):\n" + informe_memoria([os.getpid()] + piscina.pids))
+
+    piscina.iniciar()
+    signal.signal(signal.SIGUSR1, informar)
+    signal.signal(signal.SIGTERM, lambda *_: piscina.detener())
+    logging.info(f"Demonio listo en {RUTA_SOCKET} con {trabajadores} trabajadores "
+                 f"(kill -USR1 {os.getpid()} para ver la memoria de cada uno)")
+    informar()
+
+    try:
+        piscina.vigilar()
+    except KeyboardInterrupt:
+        logging.info("Deteniendo el demonio.")
+    finally:
+        piscina.detener()
+        servidor.close()
+        if os.path.exists(RUTA_SOCKET):
+            os.unlink(RUTA_SOCKET)
+
+
+# --- CLIENTE ---
+
+def cliente(programa: str) -> int:
+    conexion = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conexion.connect(RUTA_SOCKET)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"El demonio de Vendler no está activo en {RUTA_SOCKET}.")
+        print("Inícialo con: python demonio.py servir")
+        return 1
+
+    conexion.sendall(f"{programa} {os.environ.get('TERM', 'dumb')}\n".encode("utf-8"))
+    entradas = [conexion, sys.stdin]
+    try:
+        while True:
+            listos, _, _ = select.select(entradas, [], [])
+            if conexion in listos:
+                try:
+                    datos = conexion.recv(4096)
+                except ConnectionResetError:
+                    break
+                if not datos:
+                    break
+                os.write(sys.stdout.fileno(), datos)
+            if sys.stdin in listos:
+                linea = os.read(sys.stdin.fileno(), 4096)
+                if linea:
+                    conexion.sendall(linea)
+                else:
+                    conexion.shutdown(socket.SHUT_WR)
+                    entradas.remove(sys.stdin)
+    except KeyboardInterrupt:
+        print()
+    finally:
+        conexion.close()
+    return 0
+
+
+def main() -> None:
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "fork"):
+        print("El modo demonio necesita un sistema tipo Unix.")
+        sys.exit(1)
+
+    orden = sys.argv[1] if len(sys.argv) > 1 else "aktionsart"
+    if orden == "servir":
+        trabajadores = 0
+        if "--trabajadores" in sys.argv:
+            trabajadores = int(sys.argv[sys.argv.index("--trabajadores") + 1])
+        servir(trabajadores)
+    else:
+        sys.exit(cliente(orden))
+
+
+if __name__ == "__main__":
+    main()
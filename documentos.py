@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Texto corrido -> cláusulas: lo que necesita lotes.py --documento.
+
+1. leer_bloques corta el archivo (en bytes, sin cargarlo entero) en bloques de
+   líneas: un bloque termina en una línea vacía o, si el texto no tiene párrafos
+   separados, en el primer fin de línea después de MAXIMO_BLOQUE bytes. Cada bloque
+   sabe en qué byte del archivo empieza.
+2. El modelo analiza cada bloque y lo divide en oraciones.
+3. dividir_clausulas parte cada oración en cláusulas finitas según las
+   dependencias: la raíz y cada verbo finito (o con auxiliar/cópula finito) que
+   cuelga como conj, ccomp, advcl, acl... Una cláusula es el subárbol de su núcleo
+   sin los subárboles de las cláusulas que contiene, y sin conjunciones ni
+   puntuación en los bordes.
+4. clausula_como_doc arma un Doc con esos tokens (ya analizados) para el extractor
+   del idioma, y cada resultado lleva los bytes [inicio, fin) de la cláusula en el
+   archivo original.
+"""
+import itertools
+from typing import BinaryIO, Iterator, List, Tuple
+
+# Un bloque sin líneas vacías se corta en el primer fin de línea después de estos bytes
+MAXIMO_BLOQUE = 20000
+
+DEPS_CLAUSULA = frozenset([
+    "ROOT", "conj", "ccomp", "advcl", "acl", "acl:relcl", "relcl", "parataxis",
+    "csubj", "csubj:pass", "csubjpass",
+])
+DEPS_AUXILIAR = frozenset(["aux", "aux:pass", "auxpass", "cop"])
+CATEGORIAS_BORDE = frozenset(["CCONJ", "SCONJ", "PUNCT", "SPACE"])
+
+
+# --- BLOQUES DE TEXTO ---
+
+def leer_bloques(f: BinaryIO, inicio: int = 0) -> Iterator[Tuple[str, int, int]]:
+    """Devuelve (texto, byte inicial, byte final) de cada bloque; inicio = byte del archivo donde está f."""
+    posicion = inicio
+    bloque: List[bytes] = []
+    bloque_inicio, tamano = inicio, 0
+    for linea in f:
+        posicion += len(linea)
+        if linea.strip():
+            if not bloque:
+                bloque_inicio = posicion - len(linea)
+            bloque.append(linea)
+            tamano += len(linea)
+            if tamano < MAXIMO_BLOQUE:
+                continue
+        if bloque:
+            yield b"".join(bloque).decode("utf-8", "surrogateescape"), bloque_inicio, bloque_inicio + tamano
+            bloque, tamano = [], 0
+    if bloque:
+        yield b"".join(bloque).decode("utf-8", "surrogateescape"), bloque_inicio, bloque_inicio + tamano
+
+
+def calcular_fragmentos(ruta: str, lineas_por_fragmento: int) -> List[Tuple[int, int, int]]:
+    """
+    Tramos de bloques completos de unas lineas_por_fragmento líneas: (byte inicial,
+    byte final, 0). Los cortes coinciden con los de una lectura de corrido.
+    """
+    fragmentos = []
+    with open(ruta, "rb") as f:
+        inicio, lineas = None, 0
+        for texto, bloque_inicio, bloque_fin in leer_bloques(f):
+            if inicio is None:
+                inicio = bloque_inicio
+            lineas += texto.count("\n") + 1
+            if lineas >= lineas_por_fragmento:
+                fragmentos.append((inicio, bloque_fin, 0))
+                inicio, lineas = None, 0
+        if inicio is not None:
+            fragmentos.append((inicio, f.seek(0, 2), 0))
+    return fragmentos
+
+
+class MapaBytes:
+    """Posición de un carácter del bloque -> posición en bytes dentro del archivo."""
+
+    def __init__(self, texto: str, base: int):
+        self.base = base
+        # Texto ASCII: cada carácter es un byte
+        self._acumulado = None if texto.isascii() else [0, *itertools.accumulate(
+            len(caracter.encode("utf-8", "surrogateescape")) for caracter in texto)]
+
+    def __getitem__(self, caracter: int) -> int:
+        return self.base + (caracter if self._acumulado is None else self._acumulado[caracter])
+
+
+# --- CLÁUSULAS ---
+
+def es_finita(token) -> bool:
+    if "Fin" in token.morph.get("VerbForm"):
+        return True
+    return any(hijo.dep_ in DEPS_AUXILIAR and "Fin" in hijo.morph.get("VerbForm") for hijo in token.children)
+
+
+def es_nucleo_clausula(token) -> bool:
+    # La raíz siempre abre una cláusula (aunque sea una oración sin verbo finito)
+    return token.dep_ == "ROOT" or (token.dep_ in DEPS_CLAUSULA and es_finita(token))
+
+
+def dividir_clausulas(oracion) -> List[Tuple[object, List[object]]]:
+    """(núcleo, tokens) de cada cláusula de la oración, en el orden del texto."""
+    nucleos = [token for token in oracion if es_nucleo_clausula(token)]
+    duenos = {}
+    # Cada token pertenece a la cláusula del núcleo más cercano que lo domina
+    for nucleo in sorted(nucleos, key=lambda token: len(list(token.ancestors))):
+        for token in nucleo.subtree:
+            duenos[token.i] = nucleo.i
+
+    clausulas = []
+    for nucleo in nucleos:
+        tokens = [token for token in nucleo.subtree if duenos.get(token.i) == nucleo.i and token.pos_ != "SPACE"]
+        while tokens and tokens[0].pos_ in CATEGORIAS_BORDE and tokens[0].i != nucleo.i:
+            tokens.pop(0)
+        while tokens and tokens[-1].pos_ in CATEGORIAS_BORDE and tokens[-1].i != nucleo.i:
+            tokens.pop()
+        if tokens:
+            clausulas.append((nucleo, tokens))
+    clausulas.sort(key=lambda clausula: clausula[1][0].i)
+    return clausulas
+
+
+def clausula_como_doc(nucleo, tokens: List[object]):
+    """Un Doc nuevo con los tokens de la cláusula y su análisis; el núcleo queda como raíz."""
+    from spacy.tokens import Doc
+
+    posiciones = {token.i: indice for indice, token in enumerate(tokens)}
+    # Espacio entre tokens que en el original estaban separados (o que no eran contiguos)
+    espacios = [
+        indice + 1 < len(tokens) and (bool(token.whitespace_) or tokens[indice + 1].i != token.i + 1)
+        for indice, token in enumerate(tokens)
+    ]
+    raiz = posiciones[nucleo.i]
+    return Doc(
+        nucleo.doc.vocab,
+        words=[token.text for token in tokens],
+        spaces=espacios,
+        tags=[token.tag_ for token in tokens],
+        pos=[token.pos_ for token in tokens],
+        morphs=[str(token.morph) for token in tokens],
+        lemmas=[token.lemma_ for token in tokens],
+        heads=[raiz if token.i == nucleo.i else posiciones.get(token.head.i, raiz) for token in tokens],
+        deps=["ROOT" if token.i == nucleo.i else token.dep_ for token in tokens],
+    )
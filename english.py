@@ -5,16 +5,17 @@ Aktionsart detector (EN version)
 import locale
 import logging
 import os
-import readline
+import re
 import subprocess
 import time
 import sys
 from dataclasses import dataclass
 from enum import Enum
 from typing import List, Optional, Sequence, Union
-import spacy
-
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+import motor
+import patrones
+from flexion_en import LEXICON_INFLECTION
+from modelos import Anticipador, ModeloPerezoso
 
 # --- EXCEPTION FOR RESTART ---
 class RestartAnalysis(Exception):
@@ -26,10 +27,10 @@ BOLD = '\033[1m'
 RESET = '\033[0m'
 
 # --- SPA_CY SETUP ---
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    nlp = None
+# The model is loaded in a background thread; without it we fall back to manual entry.
+nlp_model = ModeloPerezoso("en_core_web_sm")
+# Parses clauses in the background while the user answers the first tests
+nlp_anticipator = Anticipador(nlp_model.analizar)
 
 # ------------------------- Config -------------------------
 LS_SCRIPT = "ls_en.py" 
@@ -92,126 +93,6 @@ HAVE_PRESENT = {
     '1p': "have", '2p': "have", '3p': "have"
 }
 
-# --- IRREGULAR VERBS DICTIONARY ---
-IRREGULARS = {
-    "be": {"ger": "being", "pp": "been"},
-    "have": {"ger": "having", "pp": "had"},
-    "do": {"ger": "doing", "pp": "done"},
-    "go": {"ger": "going", "pp": "gone"},
-    "say": {"ger": "saying", "pp": "said"},
-    "make": {"ger": "making", "pp": "made"},
-    "get": {"ger": "getting", "pp": "gotten"},
-    "know": {"ger": "knowing", "pp": "known"},
-    "think": {"ger": "thinking", "pp": "thought"},
-    "take": {"ger": "taking", "pp": "taken"},
-    "see": {"ger": "seeing", "pp": "seen"},
-    "come": {"ger": "coming", "pp": "come"},
-    "want": {"ger": "wanting", "pp": "wanted"},
-    "look": {"ger": "looking", "pp": "looked"},
-    "use": {"ger": "using", "pp": "used"},
-    "find": {"ger": "finding", "pp": "found"},
-    "give": {"ger": "giving", "pp": "given"},
-    "tell": {"ger": "telling", "pp": "told"},
-    "work": {"ger": "working", "pp": "worked"},
-    "call": {"ger": "calling", "pp": "called"},
-    "try": {"ger": "trying", "pp": "tried"},
-    "ask": {"ger": "asking", "pp": "asked"},
-    "need": {"ger": "needing", "pp": "needed"},
-    "feel": {"ger": "feeling", "pp": "felt"},
-    "become": {"ger": "becoming", "pp": "become"},
-    "leave": {"ger": "leaving", "pp": "left"},
-    "put": {"ger": "putting", "pp": "put"},
-    "mean": {"ger": "meaning", "pp": "meant"},
-    "keep": {"ger": "keeping", "pp": "kept"},
-    "let": {"ger": "letting", "pp": "let"},
-    "begin": {"ger": "beginning", "pp": "begun"},
-    "seem": {"ger": "seeming", "pp": "seemed"},
-    "help": {"ger": "helping", "pp": "helped"},
-    "talk": {"ger": "talking", "pp": "talked"},
-    "turn": {"ger": "turning", "pp": "turned"},
-    "start": {"ger": "starting", "pp": "started"},
-    "show": {"ger": "showing", "pp": "shown"},
-    "hear": {"ger": "hearing", "pp": "heard"},
-    "play": {"ger": "playing", "pp": "played"},
-    "run": {"ger": "running", "pp": "run"},
-    "move": {"ger": "moving", "pp": "moved"},
-    "live": {"ger": "living", "pp": "lived"},
-    "believe": {"ger": "believing", "pp": "believed"},
-    "bring": {"ger": "bringing", "pp": "brought"},
-    "happen": {"ger": "happening", "pp": "happened"},
-    "write": {"ger": "writing", "pp": "written"},
-    "sit": {"ger": "sitting", "pp": "sat"},
-    "stand": {"ger": "standing", "pp": "stood"},
-    "lose": {"ger": "losing", "pp": "lost"},
-    "pay": {"ger": "paying", "pp": "paid"},
-    "meet": {"ger": "meeting", "pp": "met"},
-    "include": {"ger": "including", "pp": "included"},
-    "continue": {"ger": "continuing", "pp": "continued"},
-    "set": {"ger": "setting", "pp": "set"},
-    "learn": {"ger": "learning", "pp": "learned"},
-    "change": {"ger": "changing", "pp": "changed"},
-    "lead": {"ger": "leading", "pp": "led"},
-    "understand": {"ger": "understanding", "pp": "understood"},
-    "watch": {"ger": "watching", "pp": "watched"},
-    "follow": {"ger": "following", "pp": "followed"},
-    "stop": {"ger": "stopping", "pp": "stopped"},
-    "create": {"ger": "creating", "pp": "created"},
-    "speak": {"ger": "speaking", "pp": "spoken"},
-    "read": {"ger": "reading", "pp": "read"},
-    "allow": {"ger": "allowing", "pp": "allowed"},
-    "add": {"ger": "adding", "pp": "added"},
-    "spend": {"ger": "spending", "pp": "spent"},
-    "grow": {"ger": "growing", "pp": "grown"},
-    "open": {"ger": "opening", "pp": "opened"},
-    "walk": {"ger": "walking", "pp": "walked"},
-    "win": {"ger": "winning", "pp": "won"},
-    "offer": {"ger": "offering", "pp": "offered"},
-    "remember": {"ger": "remembering", "pp": "remembered"},
-    "love": {"ger": "loving", "pp": "loved"},
-    "consider": {"ger": "considering", "pp": "considered"},
-    "appear": {"ger": "appearing", "pp": "appeared"},
-    "buy": {"ger": "buying", "pp": "bought"},
-    "wait": {"ger": "waiting", "pp": "waited"},
-    "serve": {"ger": "serving", "pp": "served"},
-    "die": {"ger": "dying", "pp": "died"},
-    "send": {"ger": "sending", "pp": "sent"},
-    "expect": {"ger": "expecting", "pp": "expected"},
-    "build": {"ger": "building", "pp": "built"},
-    "stay": {"ger": "staying", "pp": "stayed"},
-    "fall": {"ger": "falling", "pp": "fallen"},
-    "cut": {"ger": "cutting", "pp": "cut"},
-    "reach": {"ger": "reaching", "pp": "reached"},
-    "kill": {"ger": "killing", "pp": "killed"},
-    "remain": {"ger": "remaining", "pp": "remained"},
-    "suggest": {"ger": "suggesting", "pp": "suggested"},
-    "raise": {"ger": "raising", "pp": "raised"},
-    "pass": {"ger": "passing", "pp": "passed"},
-    "sell": {"ger": "selling", "pp": "sold"},
-    "require": {"ger": "requiring", "pp": "required"},
-    "report": {"ger": "reporting", "pp": "reported"},
-    "decide": {"ger": "deciding", "pp": "decided"},
-    "pull": {"ger": "pulling", "pp": "pulled"},
-    "break": {"ger": "breaking", "pp": "broken"},
-    "teach": {"ger": "teaching", "pp": "taught"},
-    "eat": {"ger": "eating", "pp": "eaten"},
-    "drive": {"ger": "driving", "pp": "driven"},
-    "drink": {"ger": "drinking", "pp": "drunk"},
-    "sing": {"ger": "singing", "pp": "sung"},
-    "swim": {"ger": "swimming", "pp": "swum"},
-    "fly": {"ger": "flying", "pp": "flown"},
-    "draw": {"ger": "drawing", "pp": "drawn"},
-    "forget": {"ger": "forgetting", "pp": "forgotten"},
-    "hit": {"ger": "hitting", "pp": "hit"},
-    "catch": {"ger": "catching", "pp": "caught"},
-    "sleep": {"ger": "sleeping", "pp": "slept"},
-    "throw": {"ger": "throwing", "pp": "thrown"},
-    "wake": {"ger": "waking", "pp": "woken"},
-    "wear": {"ger": "wearing", "pp": "worn"},
-    "choose": {"ger": "choosing", "pp": "chosen"},
-    "hide": {"ger": "hiding", "pp": "hidden"},
-}
-
-
 def set_english_locale():
     english_locales = ['en_US.UTF-8', 'en_GB.UTF-8', 'en.UTF-8', '']
     for loc in english_locales:
@@ -232,117 +113,42 @@ def restart_message() -> None:
 
 
 def prompt_user(prompt: str) -> str:
-    readline.set_startup_hook(lambda: readline.insert_text(""))
-    try:
-        if "\n" in prompt or len(prompt) > 60:
-            print(prompt, end="", flush=True)
-            user = input().strip()
-        else:
-            user = input(prompt).strip()
-        
-        # --- RESCUE COMMAND ---
-        if user == "...":
-            raise RestartAnalysis()
-            
-        return user.encode('utf-8').decode('utf-8')
-    finally:
-        readline.set_startup_hook()
+    return motor.peticion(PACK, prompt)
 
 
 def yes_no(question: str) -> bool:
-    while True:
-        try:
-            ans = prompt_user(question).lower()
-            if ans in Answer.YES.value:
-                return True
-            elif ans in Answer.NO.value:
-                return False
-            print("\nPlease answer 'yes (y)' or 'no (n)'.")
-        except RestartAnalysis:
-            raise
-        except Exception as e:
-            logging.error(f"Error getting answer: {e}")
+    return motor.respuesta_si_no(PACK, question)
 
 
 def multiple_choice(question: str, options: Sequence[Union[str, Sequence[str]]], suffix: str) -> str:
-    while True:
-        try:
-            ans = prompt_user(f"{question} {suffix}").lower()
-            for opt in options:
-                if isinstance(opt, Sequence) and not isinstance(opt, str):
-                    if ans in opt:
-                        return opt[0]
-                elif ans == opt:
-                    return opt
-            print("\nPlease type a valid option.")
-        except RestartAnalysis:
-            raise
-        except Exception as e:
-            logging.error(f"Error getting answer: {e}")
+    return motor.respuesta_multiple(PACK, question, options, suffix)
 
 
 # --- AUTOMATIC ANALYSIS FUNCTIONS ---
 
 def generate_english_forms(lemma: str):
     """
-    Generates Gerund and Past Participle using dictionary + heuristic rules.
+    Generates Gerund and Past Participle with the inflection engine (see flexion_en.py).
+    Returns ("", "") if the lemma does not look like a verb.
     """
-    lemma = lemma.lower().strip()
-    
-    # 1. Check dictionary
-    if lemma in IRREGULARS:
-        return IRREGULARS[lemma]["ger"], IRREGULARS[lemma]["pp"]
-    
-    # 2. Regular Rules
-    # Gerund
-    if lemma.endswith("ie"):
-        ger = lemma[:-2] + "ying" # die -> dying
-    elif lemma.endswith("e") and not lemma.endswith("ee"):
-        ger = lemma[:-1] + "ing" # make -> making
-    else:
-        # CONSONANT DOUBLING RULE
-        is_cvc = (len(lemma) > 2 
-                  and lemma[-1] not in "aeiouwyx" 
-                  and lemma[-2] in "aeiou" 
-                  and lemma[-3] not in "aeiou")
-        
-        is_unstressed_ending = lemma.endswith(("er", "en", "el", "it")) 
-        
-        if is_cvc and not is_unstressed_ending:
-             ger = lemma + lemma[-1] + "ing"
-        else:
-             ger = lemma + "ing"
-             
-    # Past Participle (Regular)
-    if lemma.endswith("e"):
-        pp = lemma + "d"
-    else:
-        # Same doubling logic
-        is_cvc = (len(lemma) > 2 
-                  and lemma[-1] not in "aeiouwyx" 
-                  and lemma[-2] in "aeiou" 
-                  and lemma[-3] not in "aeiou")
-        
-        is_unstressed_ending = lemma.endswith(("er", "en", "el", "it"))
+    return LEXICON_INFLECTION.actual().non_finite(lemma.lower().strip())
 
-        if is_cvc and not is_unstressed_ending:
-             pp = lemma + lemma[-1] + "ed"
-        else:
-             pp = lemma + "ed"
-             
-    return ger, pp
 
-def detect_person_number(doc, verb_token, idx):
+def repair_lemma(form: str, lemma: str) -> str:
+    """
+    spaCy's lemma, unless the reverse index of flexion_en.py knows the form
+    and gives a single, different lemma ("saw" -> "see", not "saw").
+    """
+    lemmas = {reading.lemma for reading in LEXICON_INFLECTION.actual().readings(form)}
+    if not lemmas or lemma in lemmas or len(lemmas) > 1:
+        return lemma
+    return lemmas.pop()
+
+def detect_person_number(subj_token):
     """
     Deduces Person/Number based on the Subject found by spaCy.
     """
-    subj_token = None
-    for token in doc:
-        if token.head == verb_token and "subj" in token.dep_:
-            subj_token = token
-            break
-            
-    if not subj_token:
+    if subj_token is None:
         return "3s" # Default if no subject found
     
     text = subj_token.text.lower()
@@ -363,40 +169,139 @@ def detect_person_number(doc, verb_token, idx):
     else:
         return "3s"
 
+# --- FAST PATH (no spaCy) ---
+# Short clauses with a single known finite verb ("Peter ran home", "Mary knows English")
+# are read with the reverse index of flexion_en.py. Anything else (no candidate or
+# several, an ambiguous lemma, auxiliaries and modals, long clauses) goes to spaCy.
+# VENDLER_VIA_RAPIDA=0 disables it, as it does the Spanish one (via_rapida.py).
+FAST_PATH = os.environ.get("VENDLER_VIA_RAPIDA", "1") != "0"
+FAST_PATH_MAX_WORDS = 6
+
+WORD = re.compile(r"\w+|[^\w\s]")
+
+SUBJECT_PRONOUNS = {"i": "1s", "you": "2s", "he": "3s", "she": "3s", "it": "3s", "we": "1p", "they": "3p"}
+
+# Modals, infinitive and negation: periphrases and do-support are left to spaCy
+FAST_PATH_STOP = frozenset(["will", "would", "shall", "should", "can", "could", "may", "might", "must",
+                            "to", "not"])
+
+IRREGULAR_PLURALS = frozenset(["people", "children", "men", "women", "police", "feet", "teeth", "mice", "geese"])
+
+
+def nominal_person(words_before: List[str], original_before: List[str]) -> Optional[str]:
+    """3s/3p of a noun subject; None when it cannot be told without a parser (e.g. "James")."""
+    if not words_before:
+        return "3s"
+    if "and" in words_before:
+        return "3p"
+    last = words_before[-1]
+    if last in IRREGULAR_PLURALS:
+        return "3p"
+    if last.endswith("s") and not last.endswith(("ss", "us", "is")):
+        # A capitalized word might be a name
+        return None if original_before[-1][0].isupper() else "3p"
+    return "3s"
+
+
+def fast_analysis(clause: str, data: ClauseData):
+    """
+    Fills data without spaCy. Returns the same as analyze_automatically
+    (Success, Conjugated_Verb, Clean_Lemma) or None if the model is needed.
+    """
+    if not FAST_PATH or "'" in clause or "\u2019" in clause:
+        return None
+    inflector = LEXICON_INFLECTION.actual()
+    no_verbs = inflector.data["no_verbos"]
+    words = [m for m in WORD.finditer(clause) if m.group()[0].isalnum()]
+    if not words or len(words) > FAST_PATH_MAX_WORDS:
+        return None
+    lowered = [m.group().lower() for m in words]
+
+    candidates = []
+    for position, word in enumerate(lowered):
+        if word in FAST_PATH_STOP:
+            return None
+        readings = inflector.readings(word)
+        if readings and all(reading.kind in ("gerund", "participle") for reading in readings):
+            # Progressive, perfect or passive: let spaCy decide
+            return None
+        # A base form is only finite right after I/you/we/they ("they walk home")
+        after_pronoun = position > 0 and SUBJECT_PRONOUNS.get(lowered[position - 1], "3s") != "3s"
+        finite = [reading for reading in readings
+                  if reading.kind in ("3s", "past") or (reading.kind == "base" and after_pronoun)]
+        if finite and word not in no_verbs:
+            candidates.append((position, finite))
+    if len(candidates) != 1:
+        return None
+
+    position, finite = candidates[0]
+    if len({reading.lemma for reading in finite}) != 1:
+        return None
+    lemma = finite[0].lemma
+    kinds = {reading.kind for reading in finite}
+
+    before = lowered[:position]
+    pronoun = next((SUBJECT_PRONOUNS[word] for word in before if word in SUBJECT_PRONOUNS), None)
+    if pronoun is not None:
+        # The form must agree with the pronoun ("he walks", "they walk", any past)
+        if "past" not in kinds and ("3s" in kinds) != (pronoun == "3s"):
+            return None
+        person = pronoun
+    elif "3s" in kinds and "past" not in kinds:
+        person = "3s"
+    else:
+        person = nominal_person(before, [m.group() for m in words[:position]])
+        if person is None:
+            return None
+
+    ger, pp = generate_english_forms(lemma)
+    if not ger or not pp:
+        return None
+
+    verb = words[position]
+    data.infinitive = lemma
+    data.gerund = ger
+    data.participle = pp
+    data.person_number = person
+    data.subject = clause[:verb.start()].strip()
+    data.postverbal = clause[verb.end():].strip()
+    return True, verb.group(), lemma
+
+
 def analyze_automatically(clause, data):
     """
-    Uses spaCy to analyze the clause structure and morphology.
+    Uses spaCy to analyze the clause and extracts its data (see extract_data).
+    «clause» may also come already parsed (e.g. a conllu.OracionConllu): then the model is not used.
     Returns: (Success, Conjugated_Verb, Clean_Lemma)
     """
-    if not nlp: return False, "", ""
-    
-    doc = nlp(clause)
-    verb_token = None
-    
-    # 1. Search for ROOT Verb/Aux
-    for token in doc:
-        if token.dep_ == "ROOT" and token.pos_ in ["VERB", "AUX"]:
-            verb_token = token
-            break
-            
-    # 2. Search for any Verb
-    if not verb_token:
-        for token in doc:
-            if token.pos_ in ["VERB", "AUX"]:
-                verb_token = token
-                break
-                
-    # 3. Aggressive fallback for single words (e.g., "Ran")
-    if not verb_token and len(doc) <= 2:
-        for token in doc:
-             if token.pos_ not in ["DET", "PRON"]:
-                 verb_token = token
-                 break
-                 
-    if not verb_token: return False, "", ""
+    if isinstance(clause, str):
+        # Short clauses with a known verb: no spaCy
+        fast = fast_analysis(clause, data)
+        if fast is not None:
+            return fast
+    doc = nlp_anticipator.obtener(clause) if isinstance(clause, str) else clause
+    if doc is None: return False, "", ""
+    return extract_data(doc, data)
+
+
+def anticipate_analysis(clause: str) -> None:
+    """Starts parsing the clause in the background, unless the fast path handles it."""
+    if fast_analysis(clause, ClauseData()) is None:
+        nlp_anticipator.anticipar(clause)
+
+
+def extract_data(doc, data):
+    """
+    Reads the clause structure and morphology from an already parsed Doc.
+    Returns: (Success, Conjugated_Verb, Clean_Lemma)
+    """
+    # Verb and subject from the compiled patterns (see patrones.py)
+    found = patrones.extraer(doc, "en")
+    if found is None: return False, "", ""
+    verb_token = doc[found.verbo]
     
-    # Get Lemma and Forms
-    lemma = verb_token.lemma_.lower()
+    # Get Lemma (checked against the inflection lexicon) and Forms
+    lemma = repair_lemma(verb_token.text.lower(), verb_token.lemma_.lower())
     
     ger, pp = generate_english_forms(lemma)
     
@@ -407,7 +312,7 @@ def analyze_automatically(clause, data):
     data.participle = pp
     
     # Detect Person/Number
-    data.person_number = detect_person_number(doc, verb_token, verb_token.i)
+    data.person_number = detect_person_number(doc[found.sujeto] if found.sujeto is not None else None)
     
     # Split Sentence
     idx = verb_token.i
@@ -473,19 +378,16 @@ def collect_clause_info(clause: str, data: ClauseData) -> ClauseData:
 
 def build_prog(past: bool, data: ClauseData) -> str:
     be = BE_PAST[data.person_number] if past else BE_PRESENT[data.person_number]
-    parts = [data.subject, f"{be} {data.gerund}", data.postverbal]
-    return " ".join(p for p in parts if p)
+    return motor.unir_perifrasis(data.subject, f"{be} {data.gerund}", data.postverbal)
 
 
 def build_perfect(data: ClauseData) -> str:
     have = HAVE_PRESENT[data.person_number]
-    parts = [data.subject, f"{have} {data.participle}", data.postverbal]
-    return " ".join(p for p in parts if p)
+    return motor.unir_perifrasis(data.subject, f"{have} {data.participle}", data.postverbal)
 
 
 def build_stop(data: ClauseData) -> str:
-    parts = [data.subject or "(subject)", f"stopped {data.gerund}", data.postverbal]
-    return " ".join(p for p in parts if p)
+    return motor.unir_perifrasis(data.subject or "(subject)", f"stopped {data.gerund}", data.postverbal)
 
 
 # ------------------------- Diagnostics -------------------------
@@ -552,32 +454,11 @@ def telicity_test(data: ClauseData) -> bool:
 # ------------------------- Classification -------------------------
 
 def determine_subtype(feats: Features) -> Optional[str]:
-    if feats.stative:
-        return "STATE"
-    elif feats.punctual and feats.telic:
-        return "ACHIEVEMENT"
-    elif feats.punctual and not feats.telic:
-        return "SEMELFACTIVE"
-    elif not feats.punctual and feats.telic and feats.dynamic:
-        return "ACTIVE_ACCOMPLISHMENT"
-    elif not feats.punctual and not feats.telic and feats.dynamic:
-        return "ACTIVITY"
-    elif not feats.punctual and feats.telic and not feats.dynamic:
-        return "ACCOMPLISHMENT"
-    elif not feats.punctual and not feats.telic and not feats.dynamic:
-        return "PROCESS"
-    else:
-        return None
+    return motor.determinar_subtipo(PACK, feats)
 
 
 def determine_aktionsart(feats: Features) -> Optional[Aktionsart]:
-    sub = determine_subtype(feats)
-    if sub is None:
-        return None
-    if feats.causative:
-        return Aktionsart[f"CAUSATIVE_{sub}"]
-    else:
-        return Aktionsart[sub]
+    return motor.determinar_aktionsart(PACK, feats)
 
 
 def verify_adjuncts_cleanup(clause: str) -> str:
@@ -602,48 +483,8 @@ def verify_adjuncts_cleanup(clause: str) -> str:
 # ------------------------- Orchestration -------------------------
 
 def obtain_features(clause: str, data: ClauseData) -> Union[Features, None]:
-    feats = Features()
     data.got_forms = False
-
-    caused = causativity_test(clause)
-    if caused:
-        basic_event = get_basic_event()
-        if basic_event == "0":
-            feats.causative = False
-            print(f"\n{BOLD}Predicate is [-causative]{RESET}")
-        else:
-            feats.causative = True
-            print(f"\n{BOLD}Predicate is [+causative]{RESET}")
-            clause = basic_event
-    else:
-        feats.causative = False
-        print(f"\n{BOLD}Predicate is [-causative]{RESET}")
-
-    time.sleep(0.5)
-    clause = verify_adjuncts_cleanup(clause)
-
-    time.sleep(0.5)
-    collect_clause_info(clause, data)
-
-    time.sleep(0.5)
-    feats.stative = stativity_test(clause)
-    print(f"\n{BOLD}Predicate is [{'+' if feats.stative else '-'}stative]{RESET}")
-    time.sleep(0.5)
-
-    if not feats.stative:
-        feats.punctual = not punctuality_test(data)
-        print(f"\n{BOLD}Predicate is [{'+' if feats.punctual else '-'}punctual]{RESET}")
-        time.sleep(0.5)
-
-        feats.telic = telicity_test(data)
-        print(f"\n{BOLD}Predicate is [{'+' if feats.telic else '-'}telic]{RESET}")
-        time.sleep(0.5)
-
-        feats.dynamic = dynamicity_test(data)
-        print(f"\n{BOLD}Predicate is [{'+' if feats.dynamic else '-'}dynamic]{RESET}")
-        time.sleep(0.5)
-
-    return feats
+    return motor.obtener_rasgos_akt(PACK, clause, data)
 
 
 def show_result(original_clause: str, akt: Aktionsart, feats: Features) -> None:
@@ -684,7 +525,50 @@ def run_ls(akt: Aktionsart, original_clause: str, is_dynamic: bool) -> None:
         print(f"File {LS_SCRIPT} not found in the current directory.")
 
 
-def main() -> None:
+PACK = motor.registrar(motor.PaqueteIdioma(
+    codigo="en",
+    modelo=nlp_model,
+    reinicio=RestartAnalysis,
+    respuestas_si=Answer.YES.value,
+    respuestas_no=Answer.NO.value,
+    textos={
+        "aviso_si_no": "\nPlease answer 'yes (y)' or 'no (n)'.",
+        "aviso_opcion": "\nPlease type a valid option.",
+        "error_respuesta": "Error getting answer",
+        "rasgo": "Predicate is [{rasgo}]",
+    },
+    clase_rasgos=Features,
+    campos_rasgos={"causativo": "causative", "estativo": "stative", "puntual": "punctual",
+                   "telico": "telic", "dinamico": "dynamic"},
+    etiquetas_rasgos={"causativo": "causative", "estativo": "stative", "puntual": "punctual",
+                      "telico": "telic", "dinamico": "dynamic"},
+    clase_aktionsart=Aktionsart,
+    subtipos={"ESTADO": "STATE", "LOGRO": "ACHIEVEMENT", "SEMELFACTIVO": "SEMELFACTIVE",
+              "REALIZACION_ACTIVA": "ACTIVE_ACCOMPLISHMENT", "ACTIVIDAD": "ACTIVITY",
+              "REALIZACION": "ACCOMPLISHMENT", "PROCESO": "PROCESS"},
+    nombre_causativo=lambda sub: f"CAUSATIVE_{sub}",
+    pruebas={
+        "causatividad": causativity_test,
+        "evento_basico": get_basic_event,
+        "limpieza": verify_adjuncts_cleanup,
+        "info_clausula": collect_clause_info,
+        "estatividad": stativity_test,
+        "duratividad": punctuality_test,
+        "telicidad": telicity_test,
+        "dinamicidad": dynamicity_test,
+    },
+    clase_datos=ClauseData,
+    extraer_datos=extract_data,
+    anticipar=anticipate_analysis,
+))
+
+
+def main(profile: Optional[str] = None) -> None:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if profile:
+        nlp_model.cambiar_perfil(profile)
+    nlp_model.precargar()
+    LEXICON_INFLECTION.vigilar()
     set_english_locale()
     clear_console()
     print("\nThis program will help you identify the aktionsart of the main predicate in a clause.")
@@ -716,14 +600,7 @@ def main() -> None:
             show_result(original, akt, feats)
 
             if not yes_no("\nDo you want to identify the aktionsart of another predicate? (y/n): "):
-                print("\nReturning to main menu...")
                 time.sleep(1)
-                try:
-                    subprocess.run([sys.executable, "main.py"], check=True)
-                except FileNotFoundError:
-                    print("Error: main.py not found in the current directory.")
-                except subprocess.CalledProcessError as e:
-                    print(f"Error running main.py: {e}")
                 return
             else:
                 time.sleep(0.5)
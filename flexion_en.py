@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+English inflection from datos/flexion_en.json.
+
+Every verb has five forms: base (infinitive / non-3rd-singular present), 3rd
+singular present, past, gerund and past participle. Irregular verbs take their
+past and participle from «irregulares» (alternatives separated by "/", the first
+one is the preferred form); a verb made of one of «prefijos» plus an irregular
+verb inflects like it (undo -> undid, undone; overtake -> overtook, overtaken),
+except the ones in «sin_prefijo». Everything else follows the spelling rules:
+    • final e is dropped before -ing/-ed (make -> making), but not in -ee, -ye, -oe
+    • -ie -> -ying (die -> dying); consonant + y -> -ied, -ies (try -> tried)
+    • -ic takes a k (panic -> panicking, panicked)
+    • the final consonant doubles in one-syllable CVC verbs (stop -> stopped) and in
+      the verbs stressed on the last syllable listed in «duplican» (prefer,
+      commit); a prefix on one of those verbs keeps the doubling (unplug, outrun)
+
+The Inflector is the snapshot of the lexicon: it keeps the forms already
+computed and the indexes other modules build from it (index), so everything is
+redone when the file is edited. One of them is the reverse index of the forms of
+the verbs in the lexicon: readings(form) gives every (lemma, kind) a word may be.
+When it is compiled (lexico_compilado.py, table «formas_en») it is read from that
+file instead of being built in memory.
+"""
+import re
+import threading
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import lexico_compilado
+from lexicos import LexicoVigilado
+
+KINDS = ("base", "3s", "past", "gerund", "participle")
+
+VOWELS = "aeiou"
+# Endings that take -es in the 3rd singular (pass -> passes, go -> goes)
+SIBILANTS = ("s", "x", "z", "ch", "sh", "o")
+# Final letters that never double (row -> rowed, fix -> fixed, play -> played)
+NO_DOUBLING = VOWELS + "wxy"
+
+SYLLABLE = re.compile(r"[aeiouy]+")
+
+
+class Reading(NamedTuple):
+    lemma: str
+    kind: str   # one of KINDS
+
+
+class VerbForms(NamedTuple):
+    # Each field holds the alternatives of that form, the preferred one first
+    base: Tuple[str, ...]
+    third: Tuple[str, ...]
+    past: Tuple[str, ...]
+    gerund: Tuple[str, ...]
+    participle: Tuple[str, ...]
+
+
+# --- SPELLING RULES ---
+
+def syllables(word: str) -> int:
+    # «qu» counts as a consonant (quit) and an initial y too (yell)
+    return len(SYLLABLE.findall(word.replace("qu", "q").lstrip("y")))
+
+
+def ends_cvc(word: str) -> bool:
+    """Consonant + vowel + consonant at the end (stop, quit), with a final consonant that can double."""
+    word = word.replace("qu", "q")
+    return (len(word) > 2 and word[-1] not in NO_DOUBLING
+            and word[-2] in VOWELS and word[-3] not in VOWELS)
+
+
+def consonant_y(word: str) -> bool:
+    return len(word) > 1 and word[-1] == "y" and word[-2] not in VOWELS
+
+
+def regular_third(lemma: str) -> str:
+    if consonant_y(lemma):
+        return lemma[:-1] + "ies"
+    if lemma.endswith(SIBILANTS):
+        return lemma + "es"
+    return lemma + "s"
+
+
+def regular_suffix(lemma: str, suffix: str, doubles: bool) -> str:
+    """lemma + "ed" or "ing" with the spelling changes of the stem."""
+    if suffix == "ing":
+        if lemma.endswith("ie"):
+            return lemma[:-2] + "ying"
+        if lemma.endswith("e") and not lemma.endswith(("ee", "ye", "oe")):
+            return lemma[:-1] + "ing"
+    else:
+        if lemma.endswith("e"):
+            return lemma + "d"
+        if consonant_y(lemma):
+            return lemma[:-1] + "ied"
+    if lemma.endswith("ic"):
+        return lemma + "k" + suffix
+    if doubles:
+        return lemma + lemma[-1] + suffix
+    return lemma + suffix
+
+
+# --- LEXICON SNAPSHOT ---
+
+# Version of the rules that build the index (part of the compiled table's fingerprint):
+# bump it when a rule change alters the forms or the readings
+INDEX_VERSION = 1
+
+
+def build_form_index(inflector: "Inflector") -> Dict[str, Tuple[Reading, ...]]:
+    """Form -> its readings, for every verb in the lexicon (in order: verb, kind)."""
+    index: Dict[str, List[Reading]] = {}
+    for verb in inflector.verbs:
+        for kind, forms in zip(KINDS, inflector.forms(verb)):
+            for form in forms:
+                readings = index.setdefault(form, [])
+                if Reading(verb, kind) not in readings:
+                    readings.append(Reading(verb, kind))
+    return {form: tuple(readings) for form, readings in index.items()}
+
+
+def form_pairs(data: dict) -> Iterator[Tuple[str, str]]:
+    """(form, readings) of the reverse index of this data, for lexico_compilado.py."""
+    for form, readings in build_form_index(Inflector(data)).items():
+        yield form, "\t".join(" ".join(reading) for reading in readings)
+
+
+def decode_readings(value: str) -> Tuple[Reading, ...]:
+    return tuple(Reading(*reading.split(" ")) for reading in value.split("\t"))
+
+
+class Inflector:
+    """The rules and irregular verbs of datos/flexion_en.json and the forms already computed."""
+
+    def __init__(self, data: dict):
+        self.data = data
+        self.irregulars = {
+            verb: tuple(tuple(form.split("/")) for form in forms.split())
+            for verb, forms in data["irregulares"].items()
+        }
+        self.presents = {verb: tuple(tuple(form.split("/")) for form in forms.split())
+                         for verb, forms in data["presentes"].items()}
+        self.gerunds = dict(data["gerundios"])
+        self.doubling = frozenset(data["duplican"])
+        # The longest prefix wins (under before un)
+        self.prefixes = sorted(data["prefijos"], key=len, reverse=True)
+        self.unprefixed = frozenset(data["sin_prefijo"])
+        self.verbs = tuple(sorted(set(data["verbos"]) | set(self.irregulars) | self.doubling))
+        self._known = frozenset(self.verbs)
+
+        self._forms: Dict[str, Optional[VerbForms]] = {}
+        self._indexes: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._compiled_forms = lexico_compilado.abrir("formas_en", data, decode_readings, INDEX_VERSION)
+
+    def split_prefix(self, lemma: str, known) -> Optional[Tuple[str, str]]:
+        """(prefix, verb) when lemma is a prefix plus a verb in «known»; None otherwise."""
+        if lemma in self.unprefixed:
+            return None
+        for prefix in self.prefixes:
+            if lemma.startswith(prefix) and lemma[len(prefix):] in known:
+                return prefix, lemma[len(prefix):]
+        return None
+
+    def doubles(self, lemma: str) -> bool:
+        if lemma in self.doubling or (ends_cvc(lemma) and syllables(lemma) == 1):
+            return True
+        split = self.split_prefix(lemma, self._known)
+        return split is not None and self.doubles(split[1])
+
+    # --- Forms ---
+
+    def forms(self, lemma: str) -> Optional[VerbForms]:
+        """The five forms of the verb; None if lemma does not look like a verb."""
+        if lemma in self._forms:
+            return self._forms[lemma]
+        forms = self._forms[lemma] = self._inflect(lemma) if lemma.isalpha() else None
+        return forms
+
+    def _inflect(self, lemma: str) -> VerbForms:
+        doubles = self.doubles(lemma)
+        base, third = self.presents.get(lemma, ((lemma,), (regular_third(lemma),)))
+        # The infinitive is also a base form (be: am, are)
+        base = tuple(dict.fromkeys((lemma,) + base))
+        gerund = (self.gerunds.get(lemma) or regular_suffix(lemma, "ing", doubles),)
+
+        past = participle = (regular_suffix(lemma, "ed", doubles),)
+        if lemma in self.irregulars:
+            past, participle = self.irregulars[lemma]
+        else:
+            split = self.split_prefix(lemma, self.irregulars)
+            if split is not None:
+                prefix, verb = split
+                past, participle = (tuple(prefix + form for form in forms) for forms in self.irregulars[verb])
+        return VerbForms(base, third, past, gerund, participle)
+
+    def non_finite(self, lemma: str) -> Tuple[str, str]:
+        """(gerund, past participle); ("", "") if lemma does not look like a verb."""
+        forms = self.forms(lemma)
+        return ("", "") if forms is None else (forms.gerund[0], forms.participle[0])
+
+    def readings(self, form: str) -> Tuple[Reading, ...]:
+        """Every reading of a (lowercase) form of a verb in the lexicon; () if there is none."""
+        if self._compiled_forms is not None:
+            return self._compiled_forms.get(form, ())
+        return self.index("forms", build_form_index).get(form, ())
+
+    def index(self, name: str, build: Callable[["Inflector"], Any]) -> Any:
+        """An index built from this snapshot (only once; rebuilt when the lexicon is reloaded)."""
+        value = self._indexes.get(name)
+        if value is None:
+            with self._lock:
+                value = self._indexes.get(name)
+                if value is None:
+                    value = self._indexes[name] = build(self)
+        return value
+
+
+LEXICON_INFLECTION = LexicoVigilado("flexion_en.json", Inflector)
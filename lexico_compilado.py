@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+Léxicos compilados: tablas clave -> valor en un archivo binario que se abre con mmap.
+
+Los índices grandes (formas conjugadas del español y del inglés, clases de verbos
+de ls.py) se arman en cada proceso como diccionarios de Python. Con
+
+    python lexico_compilado.py
+
+se compilan una vez en datos/compilados/*.vlex: una tabla de cadenas ordenada con
+una tabla hash encima, que se consulta directamente sobre el mapa de memoria, sin
+crear objetos de Python más que para la entrada pedida. Las páginas del archivo las
+comparte el sistema entre todos los procesos que lo abren (demonio.py y sus hijos,
+los trabajadores de lotes.py).
+
+Formato (enteros sin signo de 32 bits, little-endian):
+    cabecera   "VLEX0002", huella, entradas n, casillas m, bytes de claves, bytes de valores
+    m casillas hash: 1 + posición de la clave cuyo CRC32 cae ahí (sondeo lineal), 0 si está libre
+    n + 1 desplazamientos de las claves y n + 1 de los valores
+    las claves en UTF-8, ordenadas por bytes, y los valores en UTF-8 en el mismo orden
+
+La huella es el CRC32 de los datos JSON de los que salió la tabla y de la versión
+del código que la armó (la constante VERSION_INDICE / INDEX_VERSION junto a cada
+constructor, que se sube al cambiar sus reglas): cada instantánea de un léxico
+(lexicos.py) usa el compilado solo si coincide. Si el archivo o las reglas
+cambiaron después de compilar, se sigue usando el índice en memoria hasta que se
+vuelva a compilar. MAGIA cambia cuando cambia el formato del archivo. Los enteros
+se leen sin copiarlos, así que en una máquina big-endian no se usan los compilados;
+tampoco con VENDLER_COMPILADOS=0.
+"""
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+from collections.abc import Mapping
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+from lexicos import RUTA_LEXICOS
+
+USAR_COMPILADOS = os.environ.get("VENDLER_COMPILADOS", "1") != "0"
+
+RUTA_COMPILADOS = os.path.join(RUTA_LEXICOS, "compilados")
+
+MAGIA = b"VLEX0002"
+CABECERA = struct.Struct("<8sIIIII")
+
+
+def huella(datos: dict, version: int) -> int:
+    """
+    CRC32 de la versión del constructor y de los datos en forma canónica (no depende
+    del orden de las claves ni de la sangría del archivo).
+    """
+    return zlib.crc32(json.dumps([version, datos], sort_keys=True, ensure_ascii=False).encode("utf-8"))
+
+
+def casillas(entradas: int) -> int:
+    """Potencia de 2 con al menos el doble de casillas que entradas (sondeos cortos)."""
+    return 1 << max(3, (2 * entradas - 1).bit_length())
+
+
+def ruta_compilado(nombre: str) -> str:
+    return os.path.join(RUTA_COMPILADOS, f"{nombre}.vlex")
+
+
+# --- ESCRITURA ---
+
+def compilar(ruta: str, pares: Iterable[Tuple[str, str]], huella_datos: int) -> int:
+    """
+    Escribe la tabla de los pares (clave, valor); devuelve cuántas entradas tiene.
+    El archivo se reemplaza de una vez: quien ya lo tiene abierto sigue con el viejo
+    (en Windows no se puede reemplazar mientras otro proceso lo tenga abierto: OSError).
+    """
+    entradas = sorted((clave.encode("utf-8"), valor.encode("utf-8")) for clave, valor in pares)
+    claves, valores = bytearray(), bytearray()
+    tramos_claves, tramos_valores = [0], [0]
+    for clave, valor in entradas:
+        claves += clave
+        valores += valor
+        tramos_claves.append(len(claves))
+        tramos_valores.append(len(valores))
+
+    total = casillas(len(entradas))
+    hash_claves = [0] * total
+    for posicion, (clave, _) in enumerate(entradas):
+        casilla = zlib.crc32(clave) & (total - 1)
+        while hash_claves[casilla]:
+            casilla = (casilla + 1) & (total - 1)
+        hash_claves[casilla] = posicion + 1
+
+    os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, "wb") as f:
+        f.write(CABECERA.pack(MAGIA, huella_datos, len(entradas), total, len(claves), len(valores)))
+        f.write(struct.pack(f"<{total}I", *hash_claves))
+        f.write(struct.pack(f"<{len(tramos_claves)}I", *tramos_claves))
+        f.write(struct.pack(f"<{len(tramos_valores)}I", *tramos_valores))
+        f.write(claves)
+        f.write(valores)
+    try:
+        os.replace(temporal, ruta)
+    except OSError as e:
+        os.remove(temporal)
+        raise OSError(f"No se pudo reemplazar {ruta} ({e}). Si otro proceso lo tiene abierto "
+                      f"(demonio.py, lotes.py), ciérralo y vuelve a compilar") from e
+    return len(entradas)
+
+
+# --- LECTURA ---
+
+class TablaCompilada(Mapping):
+    """Tabla de solo lectura sobre el archivo mapeado; cada valor pasa por decodificar al leerse."""
+
+    def __init__(self, ruta: str, decodificar: Callable[[str], Any] = str):
+        if sys.byteorder != "little" or struct.calcsize("I") != 4:
+            raise ValueError("los léxicos compilados solo se leen en máquinas little-endian con enteros de 32 bits")
+        self.ruta = ruta
+        self.decodificar = decodificar
+        with open(ruta, "rb") as f:
+            self._mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mapa) < CABECERA.size:
+            raise ValueError(f"{ruta} no es un léxico compilado")
+        magia, self.huella, self._n, self._m, bytes_claves, bytes_valores = CABECERA.unpack_from(self._mapa)
+        if magia != MAGIA:
+            raise ValueError(f"{ruta} no es un léxico compilado con este formato (se rearma con python lexico_compilado.py)")
+        inicio_tramos = CABECERA.size + 4 * self._m
+        inicio_claves = inicio_tramos + 8 * (self._n + 1)
+        inicio_valores = inicio_claves + bytes_claves
+        if len(self._mapa) != inicio_valores + bytes_valores:
+            raise ValueError(f"{ruta} está incompleto")
+        # Los desplazamientos se leen sobre el mapa como enteros nativos, sin copiarlos
+        vista = memoryview(self._mapa)
+        self._hash = vista[CABECERA.size:inicio_tramos].cast("I")
+        self._tramos_claves = vista[inicio_tramos:inicio_tramos + 4 * (self._n + 1)].cast("I")
+        self._tramos_valores = vista[inicio_tramos + 4 * (self._n + 1):inicio_claves].cast("I")
+        self._claves = inicio_claves
+        self._valores = inicio_valores
+
+    def _clave(self, i: int) -> bytes:
+        return self._mapa[self._claves + self._tramos_claves[i]:self._claves + self._tramos_claves[i + 1]]
+
+    def _valor(self, i: int) -> Any:
+        inicio, fin = self._valores + self._tramos_valores[i], self._valores + self._tramos_valores[i + 1]
+        return self.decodificar(self._mapa[inicio:fin].decode("utf-8"))
+
+    def _buscar(self, clave: str) -> int:
+        """Posición de la clave en la tabla; -1 si no está."""
+        buscada = clave.encode("utf-8", "surrogateescape")
+        mascara = self._m - 1
+        casilla = zlib.crc32(buscada) & mascara
+        while True:
+            posicion = self._hash[casilla]
+            if not posicion:
+                return -1
+            if self._clave(posicion - 1) == buscada:
+                return posicion - 1
+            casilla = (casilla + 1) & mascara
+
+    def get(self, clave, defecto=None):
+        i = self._buscar(clave) if isinstance(clave, str) else -1
+        return defecto if i < 0 else self._valor(i)
+
+    def __getitem__(self, clave):
+        i = self._buscar(clave) if isinstance(clave, str) else -1
+        if i < 0:
+            raise KeyError(clave)
+        return self._valor(i)
+
+    def __contains__(self, clave) -> bool:
+        return isinstance(clave, str) and self._buscar(clave) >= 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._n):
+            yield self._clave(i).decode("utf-8")
+
+
+def abrir(nombre: str, datos: dict, decodificar: Callable[[str], Any], version: int) -> Optional[TablaCompilada]:
+    """El compilado datos/compilados/<nombre>.vlex si se armó con estos datos y esta versión; None si no hay."""
+    ruta = ruta_compilado(nombre)
+    if not USAR_COMPILADOS or not os.path.exists(ruta):
+        return None
+    try:
+        tabla = TablaCompilada(ruta, decodificar)
+    except (OSError, ValueError) as e:
+        logging.warning(f"No se pudo abrir {ruta}; se usa el índice en memoria: {e}")
+        return None
+    if tabla.huella != huella(datos, version):
+        logging.info(f"{ruta} no corresponde a los datos actuales (se rearma con python lexico_compilado.py); "
+                     f"se usa el índice en memoria")
+        return None
+    return tabla
+
+
+# --- COMPILACIÓN DE LOS LÉXICOS ---
+
+def compilables():
+    """(nombre, léxico vigilado, función datos -> pares, versión del constructor) de cada tabla que se compila."""
+    import conjugacion
+    import flexion_en
+    import ls
+
+    return (
+        ("formas_es", conjugacion.LEXICO_CONJUGACION, conjugacion.pares_formas, conjugacion.VERSION_INDICE),
+        ("formas_en", flexion_en.LEXICON_INFLECTION, flexion_en.form_pairs, flexion_en.INDEX_VERSION),
+        ("clases_ls", ls.LEXICO_LS, ls.pares_clases, ls.VERSION_INDICE),
+    )
+
+
+def main() -> None:
+    global USAR_COMPILADOS
+    # Las tablas se arman siempre desde los datos, nunca leyendo un compilado anterior
+    USAR_COMPILADOS = False
+    fallidas = 0
+    for nombre, lexico, pares, version in compilables():
+        inicio = time.perf_counter()
+        with open(lexico.ruta, encoding="utf-8") as f:
+            datos = json.load(f)
+        ruta = ruta_compilado(nombre)
+        try:
+            entradas = compilar(ruta, pares(datos), huella(datos, version))
+        except OSError as e:
+            print(e, file=sys.stderr)
+            fallidas += 1
+            continue
+        print(f"{ruta}: {entradas} entradas, {os.path.getsize(ruta) / 1024:.0f} KiB "
+              f"({time.perf_counter() - inicio:.2f} s)")
+    if fallidas:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    # Como script este archivo es __main__: los constructores importan lexico_compilado,
+    # que es el módulo donde main() tiene que apagar USAR_COMPILADOS
+    import lexico_compilado
+    lexico_compilado.main()
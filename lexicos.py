@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Léxicos cargados desde archivos de datos (carpeta datos/) que se recargan solos.
+
+Cada LexicoVigilado lee su archivo JSON, construye con él una instantánea inmutable
+(listas convertidas en frozenset, diccionarios en MappingProxyType, más los índices
+que necesite quien lo usa) y la entrega con actual(). Un hilo de fondo revisa la
+fecha de modificación del archivo; si cambia, arma la nueva instantánea fuera del
+camino de las consultas y la reemplaza de una sola vez, así que una consulta ve
+siempre el léxico viejo completo o el nuevo completo. Si el archivo editado tiene
+un error, se avisa y se sigue usando la instantánea anterior.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Optional
+
+RUTA_LEXICOS = os.environ.get(
+    "VENDLER_LEXICOS",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "datos")
+)
+
+# Segundos entre revisiones de los archivos
+INTERVALO_REVISION = float(os.environ.get("VENDLER_INTERVALO_LEXICOS", "2"))
+
+
+def congelar(valor: Any) -> Any:
+    """Copia inmutable de lo leído del JSON: listas -> frozenset, diccionarios -> MappingProxyType."""
+    if isinstance(valor, dict):
+        return MappingProxyType({clave: congelar(v) for clave, v in valor.items()})
+    if isinstance(valor, list):
+        return frozenset(congelar(v) for v in valor)
+    return valor
+
+
+class LexicoVigilado:
+    """Un archivo de léxico y la instantánea construida a partir de él."""
+
+    def __init__(self, nombre_archivo: str, construir: Callable[[dict], Any]):
+        self.ruta = os.path.join(RUTA_LEXICOS, nombre_archivo)
+        self.construir = construir
+        self._actual: Any = None
+        self._firma: Optional[tuple] = None
+        self._candado = threading.Lock()
+        self._hilo: Optional[threading.Thread] = None
+        self._pid_hilo: Optional[int] = None
+
+    def _firma_archivo(self) -> Optional[tuple]:
+        try:
+            estado = os.stat(self.ruta)
+        except OSError:
+            return None
+        return (estado.st_mtime_ns, estado.st_size)
+
+    def recargar(self) -> bool:
+        """Lee el archivo y cambia la instantánea. Devuelve False si el archivo no sirve."""
+        with self._candado:
+            firma = self._firma_archivo()
+            try:
+                with open(self.ruta, encoding="utf-8") as f:
+                    nueva = self.construir(json.load(f))
+            except Exception as e:
+                # Cualquier error del constructor (un JSON válido pero con otra forma da
+                # AttributeError, IndexError...): se guarda la firma para avisar una vez por edición
+                if self._actual is None:
+                    raise
+                logging.warning(f"No se pudo recargar {self.ruta}; se mantiene la versión anterior: {e}")
+                self._firma = firma
+                return False
+            self._actual = nueva
+            self._firma = firma
+            return True
+
+    def actual(self) -> Any:
+        """Instantánea vigente (se carga la primera vez que se pide)."""
+        instantanea = self._actual
+        if instantanea is None:
+            self.recargar()
+            instantanea = self._actual
+        return instantanea
+
+    def revisar(self) -> bool:
+        """Recarga si el archivo cambió desde la última lectura."""
+        if self._firma_archivo() != self._firma:
+            return self.recargar()
+        return False
+
+    def vigilar(self) -> None:
+        """Inicia el hilo que revisa el archivo (uno por proceso: los hilos no sobreviven a fork)."""
+        if self._hilo is not None and self._hilo.is_alive() and self._pid_hilo == os.getpid():
+            return
+        if self._pid_hilo is not None and self._pid_hilo != os.getpid():
+            # Hijo creado con fork: el candado pudo quedar tomado por el hilo del padre
+            self._candado = threading.Lock()
+        self.actual()
+        self._pid_hilo = os.getpid()
+        self._hilo = threading.Thread(target=self._bucle_vigilancia, daemon=True)
+        self._hilo.start()
+
+    def _bucle_vigilancia(self) -> None:
+        while True:
+            time.sleep(INTERVALO_REVISION)
+            try:
+                if self.revisar():
+                    logging.info(f"Léxico recargado: {self.ruta}")
+            except Exception as e:
+                logging.warning(f"Error al revisar {self.ruta}: {e}")
@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+"""
+Análisis automático por lotes, sin preguntas (español o inglés).
+
+Lee una cláusula por línea (de un archivo o de la entrada estándar), las analiza
+con nlp.pipe en lotes y escribe una línea JSON por cláusula con los datos que
+obtener_info_clausula / collect_clause_info mostrarían: verbo, infinitivo,
+gerundio, participio, persona/número y lo que va antes y después del verbo.
+
+Con un solo proceso todo se procesa en flujo: solo hay en memoria el tramo que
+se está analizando, así que el consumo no depende del tamaño del corpus. Con
+spaCy >= 3.8 cada tramo se analiza dentro de nlp.memory_zone(), que libera las
+cadenas nuevas del vocabulario al terminar el tramo.
+
+Con --procesos N el archivo de entrada se divide en fragmentos de líneas que
+analizan N procesos a la vez (todos heredan el modelo ya cargado por el padre).
+Cada fragmento terminado queda guardado en la carpeta de fragmentos; si el
+trabajo se interrumpe, al relanzarlo con los mismos argumentos solo se analizan
+los fragmentos que faltan. Al final se unen en el orden de la entrada.
+
+Con --documento la entrada es texto corrido (ej: libros o artículos enteros): se
+divide en oraciones y en cláusulas finitas según las dependencias (ver
+documentos.py), y cada resultado lleva en "inicio" y "fin" los bytes de la
+cláusula en el archivo de entrada en vez del número de línea. Funciona también
+con --procesos: los fragmentos se cortan entre párrafos.
+
+Con --conllu la entrada es un archivo CoNLL-U ya analizado: se usan esos análisis
+(ver conllu.py) y no se carga ningún modelo.
+
+Uso:
+    python lotes.py corpus.txt -o analisis.jsonl
+    python lotes.py --lote 512 < corpus.txt > analisis.jsonl
+    python lotes.py --idioma en clauses.txt -o analysis.jsonl
+    python lotes.py corpus.txt -o analisis.jsonl --procesos 32
+    python lotes.py --conllu corpus.conllu -o analisis.jsonl
+    python lotes.py --documento novela.txt -o analisis.jsonl --procesos 32
+"""
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import time
+from dataclasses import asdict
+from typing import IO, Iterable, Iterator, List, Tuple
+
+import documentos
+import motor
+from trabajadores import congelar_memoria, preparar_carga
+
+# Lotes que se analizan por tramo (dentro de una misma memory_zone)
+LOTES_POR_TRAMO = 20
+
+# Cada cuántas cláusulas se informa el avance por stderr
+AVISO_CADA = 10000
+
+# Bibliotecas numéricas: un hilo por proceso, para que N procesos no compitan por los núcleos
+VARIABLES_HILOS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+
+def leer_clausulas(entrada: Iterable[str], primera_linea: int = 1) -> Iterator[Tuple[str, int]]:
+    """Devuelve (cláusula, número de línea) saltándose las líneas vacías."""
+    for numero, linea in enumerate(entrada, start=primera_linea):
+        clausula = linea.strip()
+        if clausula:
+            yield clausula, numero
+
+
+def resultado_clausula(paquete: motor.PaqueteIdioma, doc, posicion: dict) -> dict:
+    """posicion: de dónde salió la cláusula (ej: {"linea": 12} o {"inicio": 340, "fin": 362})."""
+    datos = paquete.clase_datos()
+    exito, verbo, _ = paquete.extraer_datos(doc, datos)
+    if not exito:
+        # La extracción puede quedar a medias: no se informan datos parciales
+        datos = paquete.clase_datos()
+    resultado = {**posicion, "clausula": doc.text, "exito": exito, "verbo": verbo}
+    # Los campos booleanos (rasgos_obtenidos / got_forms) son del flujo interactivo
+    resultado.update((campo, valor) for campo, valor in asdict(datos).items() if not isinstance(valor, bool))
+    return resultado
+
+
+def analizar_flujo(paquete: motor.PaqueteIdioma, nlp, clausulas: Iterable[Tuple[str, int]],
+                   tamano_lote: int) -> Iterator[dict]:
+    clausulas = iter(clausulas)
+    zona = getattr(nlp, "memory_zone", contextlib.nullcontext)
+    while True:
+        tramo = list(itertools.islice(clausulas, tamano_lote * LOTES_POR_TRAMO))
+        if not tramo:
+            return
+        with zona():
+            for doc, numero in nlp.pipe(tramo, as_tuples=True, batch_size=tamano_lote):
+                yield resultado_clausula(paquete, doc, {"linea": numero})
+
+
+def analizar_documento(paquete: motor.PaqueteIdioma, nlp, bloques: Iterable[Tuple[str, int, int]],
+                       tamano_lote: int) -> Iterator[dict]:
+    """Como analizar_flujo, pero con bloques de texto corrido: un resultado por cláusula finita."""
+    bloques = ((texto, inicio) for texto, inicio, _ in bloques)
+    zona = getattr(nlp, "memory_zone", contextlib.nullcontext)
+    # Los componentes propios (ej: sanación de lemas) trabajan sobre cláusulas, no sobre bloques
+    sin_componentes = list(paquete.modelo.componentes)
+    while True:
+        tramo = list(itertools.islice(bloques, tamano_lote * LOTES_POR_TRAMO))
+        if not tramo:
+            return
+        with zona():
+            for doc, inicio in nlp.pipe(tramo, as_tuples=True, batch_size=tamano_lote, disable=sin_componentes):
+                bytes_de = documentos.MapaBytes(doc.text, inicio)
+                for oracion in doc.sents:
+                    for nucleo, tokens in documentos.dividir_clausulas(oracion):
+                        posicion = {"inicio": bytes_de[tokens[0].idx],
+                                    "fin": bytes_de[tokens[-1].idx + len(tokens[-1].text)]}
+                        clausula = documentos.clausula_como_doc(nucleo, tokens)
+                        yield resultado_clausula(paquete, clausula, posicion)
+
+
+def cargar_modelo(paquete: motor.PaqueteIdioma):
+    nlp = paquete.modelo.obtener()
+    if nlp is None:
+        raise SystemExit(f"No está instalado {paquete.modelo.nombre}: el análisis por lotes lo necesita.")
+    return nlp
+
+
+def procesar(idioma: str, entrada: IO, salida: IO[str], tamano_lote: int, documento: bool = False) -> int:
+    """Con documento=True la entrada es texto corrido, en binario (ver documentos.py)."""
+    paquete = motor.obtener_paquete(idioma)
+    nlp = cargar_modelo(paquete)
+
+    inicio = time.perf_counter()
+    total = 0
+    if documento:
+        resultados = analizar_documento(paquete, nlp, documentos.leer_bloques(entrada), tamano_lote)
+    else:
+        resultados = analizar_flujo(paquete, nlp, leer_clausulas(entrada), tamano_lote)
+    for resultado in resultados:
+        salida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+        total += 1
+        if total % AVISO_CADA == 0:
+            transcurrido = time.perf_counter() - inicio
+            print(f"{total} cláusulas ({total / transcurrido:.0f}/s)", file=sys.stderr)
+    return total
+
+
+def procesar_conllu(idioma: str, entrada: IO[str], salida: IO[str]) -> int:
+    from conllu import leer_conllu
+    paquete = motor.obtener_paquete(idioma)
+    total = 0
+    for oracion, numero in leer_conllu(entrada):
+        salida.write(json.dumps(resultado_clausula(paquete, oracion, {"linea": numero}), ensure_ascii=False) + "\n")
+        total += 1
+    return total
+
+
+# --- FRAGMENTOS EN PARALELO ---
+
+def calcular_fragmentos(ruta: str, lineas_por_fragmento: int) -> List[Tuple[int, int, int]]:
+    """Divide el archivo en tramos de líneas: (byte inicial, byte final, número de la primera línea)."""
+    fragmentos = []
+    with open(ruta, "rb") as f:
+        inicio, primera_linea, lineas = 0, 1, 0
+        for linea in f:
+            lineas += 1
+            if lineas == lineas_por_fragmento:
+                fin = f.tell()
+                fragmentos.append((inicio, fin, primera_linea))
+                inicio, primera_linea, lineas = fin, primera_linea + lineas, 0
+        if lineas:
+            fragmentos.append((inicio, f.tell(), primera_linea))
+    return fragmentos
+
+
+def ruta_fragmento(carpeta: str, indice: int) -> str:
+    return os.path.join(carpeta, f"fragmento_{indice:06d}.jsonl")
+
+
+def procesar_fragmento(tarea: tuple) -> Tuple[int, int]:
+    """Se ejecuta en un proceso de la piscina. El archivo del fragmento aparece solo si se terminó."""
+    idioma, ruta, indice, inicio, fin, primera_linea, carpeta, tamano_lote, documento = tarea
+    paquete = motor.obtener_paquete(idioma)
+    nlp = cargar_modelo(paquete)
+
+    with open(ruta, "rb") as f:
+        f.seek(inicio)
+        contenido = f.read(fin - inicio)
+    if documento:
+        bloques = documentos.leer_bloques(io.BytesIO(contenido), inicio)
+        resultados = analizar_documento(paquete, nlp, bloques, tamano_lote)
+    else:
+        lineas = contenido.decode("utf-8").split("\n")
+        resultados = analizar_flujo(paquete, nlp, leer_clausulas(lineas, primera_linea), tamano_lote)
+
+    destino = ruta_fragmento(carpeta, indice)
+    temporal = f"{destino}.{os.getpid()}.tmp"
+    total = 0
+    with open(temporal, "w", encoding="utf-8") as salida:
+        for resultado in resultados:
+            salida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+            total += 1
+    os.replace(temporal, destino)
+    return indice, total
+
+
+def preparar_carpeta(carpeta: str, manifiesto: dict) -> None:
+    """Crea la carpeta de fragmentos o comprueba que la existente es de este mismo trabajo."""
+    ruta_manifiesto = os.path.join(carpeta, "progreso.json")
+    if os.path.exists(ruta_manifiesto):
+        with open(ruta_manifiesto, encoding="utf-8") as f:
+            anterior = json.load(f)
+        if anterior != manifiesto:
+            raise SystemExit(
+                f"La carpeta {carpeta} tiene fragmentos de otro trabajo (otra entrada, idioma o tamaño "
+                "de fragmento). Bórrala o indica otra con --fragmentos."
+            )
+        return
+    os.makedirs(carpeta, exist_ok=True)
+    with open(ruta_manifiesto, "w", encoding="utf-8") as f:
+        json.dump(manifiesto, f, indent=2)
+
+
+def unir_fragmentos(carpeta: str, cantidad: int, salida: str) -> None:
+    temporal = f"{salida}.tmp"
+    with open(temporal, "wb") as destino:
+        for indice in range(cantidad):
+            with open(ruta_fragmento(carpeta, indice), "rb") as origen:
+                shutil.copyfileobj(origen, destino)
+    os.replace(temporal, salida)
+
+
+def procesar_en_paralelo(idioma: str, entrada: str, salida: str, procesos: int,
+                         lineas_por_fragmento: int, tamano_lote: int, carpeta: str, documento: bool = False) -> int:
+    estado = os.stat(entrada)
+    manifiesto = {
+        "entrada": os.path.abspath(entrada), "tamano": estado.st_size, "modificado": estado.st_mtime_ns,
+        "idioma": idioma, "lineas_por_fragmento": lineas_por_fragmento, "documento": documento,
+    }
+    preparar_carpeta(carpeta, manifiesto)
+
+    # En un documento los fragmentos se cortan entre bloques, igual que al leerlo de corrido
+    fragmentos = (documentos.calcular_fragmentos if documento else calcular_fragmentos)(entrada, lineas_por_fragmento)
+    pendientes = [
+        (idioma, entrada, indice, inicio, fin, primera_linea, carpeta, tamano_lote, documento)
+        for indice, (inicio, fin, primera_linea) in enumerate(fragmentos)
+        if not os.path.exists(ruta_fragmento(carpeta, indice))
+    ]
+    hechos = len(fragmentos) - len(pendientes)
+    if hechos:
+        print(f"Se retoma el trabajo: {hechos} de {len(fragmentos)} fragmentos ya estaban listos.", file=sys.stderr)
+
+    if pendientes:
+        # El modelo se carga una vez en el padre; con fork los procesos lo heredan ya cargado
+        preparar_carga()
+        cargar_modelo(motor.obtener_paquete(idioma))
+        congelar_memoria()
+        metodos = multiprocessing.get_all_start_methods()
+        contexto = multiprocessing.get_context("fork" if "fork" in metodos else None)
+
+        inicio = time.perf_counter()
+        total = 0
+        with contexto.Pool(procesos) as piscina:
+            for listos, (_, cantidad) in enumerate(piscina.imap_unordered(procesar_fragmento, pendientes), start=1):
+                total += cantidad
+                transcurrido = time.perf_counter() - inicio
+                print(f"Fragmentos: {hechos + listos}/{len(fragmentos)} "
+                      f"({total / transcurrido:.0f} cláusulas/s)", file=sys.stderr)
+
+    unir_fragmentos(carpeta, len(fragmentos), salida)
+    shutil.rmtree(carpeta)
+    with open(salida, "rb") as f:
+        return sum(1 for _ in f)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("entrada", nargs="?", default="-", help="archivo con una cláusula por línea (- = stdin)")
+    parser.add_argument("-o", "--salida", default="-", help="archivo JSONL de salida (- = stdout)")
+    parser.add_argument("--idioma", choices=sorted(motor.MODULOS_IDIOMA), default="es")
+    parser.add_argument("--lote", type=int, default=256, help="cláusulas por lote de nlp.pipe")
+    parser.add_argument("--procesos", type=int, default=1, help="procesos en paralelo (0 = uno por núcleo)")
+    parser.add_argument("--lineas-fragmento", type=int, default=5000, help="líneas por fragmento (con --procesos)")
+    parser.add_argument("--fragmentos", help="carpeta de fragmentos (por defecto: <salida>.fragmentos)")
+    parser.add_argument("--conllu", action="store_true", help="la entrada ya viene analizada en CoNLL-U")
+    parser.add_argument("--documento", action="store_true",
+                        help="la entrada es texto corrido: se divide en oraciones y cláusulas")
+    args = parser.parse_args()
+    if args.conllu and args.documento:
+        parser.error("--conllu y --documento no se pueden combinar")
+
+    procesos = args.procesos or os.cpu_count() or 1
+    inicio = time.perf_counter()
+    if procesos > 1:
+        if args.conllu:
+            parser.error("--conllu no necesita --procesos: no hay análisis que repartir")
+        if args.entrada == "-" or args.salida == "-":
+            parser.error("con --procesos hacen falta un archivo de entrada y uno de salida (-o)")
+        for variable in VARIABLES_HILOS:
+            os.environ.setdefault(variable, "1")
+        total = procesar_en_paralelo(
+            args.idioma, args.entrada, args.salida, procesos, args.lineas_fragmento, args.lote,
+            args.fragmentos or f"{args.salida}.fragmentos", args.documento,
+        )
+    else:
+        with contextlib.ExitStack() as pila:
+            if args.documento:
+                entrada = sys.stdin.buffer if args.entrada == "-" else pila.enter_context(open(args.entrada, "rb"))
+            else:
+                entrada = sys.stdin if args.entrada == "-" else pila.enter_context(open(args.entrada, encoding="utf-8"))
+            salida = sys.stdout if args.salida == "-" else pila.enter_context(open(args.salida, "w", encoding="utf-8"))
+            if args.conllu:
+                total = procesar_conllu(args.idioma, entrada, salida)
+            else:
+                total = procesar(args.idioma, entrada, salida, args.lote, args.documento)
+    print(f"Listo: {total} cláusulas en {time.perf_counter() - inicio:.1f} s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,16 @@
 import locale
 import logging
 import os
-import readline
 import subprocess
 import sys
 import time
 import typing
 import re
-from deep_translator import GoogleTranslator
+from types import MappingProxyType
+
+import lexico_compilado
+from cache import CacheSegmentada
+from lexicos import LexicoVigilado, congelar
 
 class ReiniciarAnalisis(Exception):
     """Excepción para abortar el análisis actual y volver al inicio."""
@@ -25,10 +28,11 @@ RRG_KEYWORDS = {
     "move.down.from.reference.point", "not"
 }
 
-# Caché para no consultar a Google repetidamente por la misma palabra
-CACHE_TRADUCCION = {}
+# Caché para no consultar a Google repetidamente por la misma palabra (compartida entre hilos)
+CACHE_TRADUCCION = CacheSegmentada()
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Formas verbales ya conocidas (cuando se llega desde aktionsart.py), para sugerirlas en las preguntas
+SUGERENCIAS = {"infinitivo": "", "participio": ""}
 
 class Operador(typing.NamedTuple):
     codigo: str
@@ -80,154 +84,91 @@ MODIFICADORES_AKT = {
     "semelfactivo causativo": "SEML"
 }
 
-VERBOS_MOVIMIENTO = {
-    "move.away.from.reference.point": [
-        "ir", "irse", "salir", "partir", "marchar", "escapar", "huir",
-        "largarse", "migrar", "retirarse", "alejarse", "ausentarse",
-        "desaparecer", "desvanecerse", "desplazarse", "evadirse", "esfumarse",
-        "fugarse", "trasladarse", "mudarse", "perderse", "marcharse", "venir",
-        "arrancar", "arrancarse", "cambiarse", "saltar"
-    ],
-    "move.up.from.reference.point": [
-        "subir", "subirse", "ascender", "escalar", "trepar", "elevarse",
-        "remontar"
-    ],
-    "move.down.from.reference.point":
-    ["bajar", "bajarse", "caer", "caerse", "descender"]
-}
+# --- LÉXICOS DE VERBOS (datos/verbos_ls.json, se recargan al editarse) ---
+NOMBRES_LEXICO = (
+    "VERBOS_MOVIMIENTO", "VERBOS_METEOROLOGICOS", "VERBOS_TRANSFERENCIA", "VERBOS_DICCION",
+    "VERBOS_TRI_NEG", "VERBOS_POSESION", "VERBOS_EXISTENCIA", "VERBOS_PERCEPCION",
+    "VERBOS_PERCEPCION_IMPERSONAL"
+)
+
+
+class LexicoLS(typing.NamedTuple):
+    verbos_movimiento: typing.Mapping[str, typing.FrozenSet[str]]
+    verbos_meteorologicos: typing.FrozenSet[str]
+    verbos_transferencia: typing.Mapping[str, typing.FrozenSet[str]]
+    verbos_diccion: typing.Mapping[str, typing.Any]
+    verbos_tri_neg: typing.Mapping[str, typing.FrozenSet[str]]
+    verbos_posesion: typing.Mapping[str, typing.FrozenSet[str]]
+    verbos_existencia: typing.FrozenSet[str]
+    verbos_percepcion: typing.Mapping[str, str]
+    verbos_percepcion_impersonal: typing.Mapping[str, str]
+    # Índice inverso de todos los léxicos: verbo -> sus clases («transferencia:sacar»,
+    # «meteorologicos»...), de mayor a menor prioridad según PRIORIDAD_CLASES
+    clases: typing.Mapping[str, typing.Tuple[str, ...]]
+
+    def tiene(self, verbo: str, clase: str) -> bool:
+        return clase in self.clases.get(verbo, ())
+
+    def categoria(self, verbo: str, lexico: str) -> typing.Optional[str]:
+        """Categoría de mayor prioridad del verbo en un léxico («diccion» -> «preguntar»); None si no está."""
+        prefijo = lexico + ":"
+        for clase in self.clases.get(verbo, ()):
+            if clase.startswith(prefijo):
+                return clase[len(prefijo):]
+        return None
 
-VERBOS_METEOROLOGICOS = [
-    "llover", "nevar", "granizar", "tronar", "relampaguear", "diluviar",
-    "lloviznar", "escampar", "helar", "deshelar", "ventear", "anochecer",
-    "amanecer", "atardecer", "oscurecer", "aclarar", "nublar", "despejar",
-    "chispear", "orbayar", "orvallar", "chaparrear", "gotear", "garuar",
-    "chirimirear", "temblar", "nortear", "terremotear"
-]
 
-VERBOS_TRANSFERENCIA = {
-    "sacar": [
-        "sacar", "retirar", "tomar", "agarrar", "coger", "quitar", "apartar",
-        "desalojar", "separar", "desplazar", "exiliar", "remover", "descolgar",
-        "extraer", "rescatar", "liberar", "arrancar", "sustraer", "arrebatar",
-        "despojar", "confiscar", "desposeer", "usurpar", "desapropiar",
-        "decomisar", "expropiar", "robar", "hurtar", "birlar", "enajenar",
-        "pedir", "solicitar", "demandar", "exigir", "comprar", "cobrar",
-        "exigir", "facturar", "reclamar", "perceptuar", "expulsar", "desalojar",
-        "lanzar", "arrojar", "eliminar", "desterrar", "extraditar", "ahuyentar",
-        "desarraigar", "destituir", "desprender", "erradicar", "vaciar", "drenar",
-        "salvar"
-    ],
-    "dar_poner": [
-        "acercar", "acreditar", "adicionar", "adscribir", "agregar", "alcanzar",
-        "añadir", "aplicar", "arrimar", "asignar", "atribuir", "cargar", "ceder", "colocar",
-        "conceder", "conferir", "consignar", "cubrir", "dar", "delegar", "desparramar",
-        "destinar", "distribuir", "donar", "dotar", "echar", "encomendar", "endilgar",
-        "entregar", "enviar", "esparcir", "estipular", "expandir", "extender",
-        "facilitar", "fijar", "imputar", "incorporar", "instituir", "legar", "llevar",
-        "mandar", "nombrar", "obsequiar", "ofrecer", "otorgar", "pasar", "poner",
-        "prescribir", "prestar", "proporcionar", "reconocer", "repartir", "señalar",
-        "suministrar", "traer", "transferir", "trasferir", "traspasar", "untar",
-        "vender", "verter", "vertir"
-    ]
-}
+def nombre_clase(nombre_lexico: str) -> str:
+    """VERBOS_TRI_NEG -> tri_neg"""
+    return nombre_lexico[len("VERBOS_"):].lower()
 
-VERBOS_DICCION = {
-    "preguntar": [
-        "averiguar", "consultar", "cuestionar", "demandar", "indagar",
-        "inquirir", "interpelar", "interrogar", "pedir", "preguntar",
-        "recabar", "requerir", "sondear"
-    ],
-    "conversar": [
-        "charlar", "chismear", "chismorrear", "comentar", "conferenciar",
-        "conferir", "conversar", "cotillear", "cotorrear", "cuchichear",
-        "departir", "dialogar", "discutir", "gritar", "gritarse",
-        "hablar", "interlocutar", "parlar", "parlotear", "platicar",
-        "tratar"
-    ],
-    "agradecer": {
-        "adular": "adulación", "advertir": "advertencia", "agradecer": "agradecimiento",
-        "alardear": "alarde", "amenazar": "amenaza", "brindar": "brindis",
-        "criticar": "crítica", "disculpar": "disculpa", "elogiar": "elogio",
-        "encomiar": "encomio", "exhortar": "exhortación", "felicitar": "felicitación",
-        "halagar": "halago", "implorar": "imploración", "insultar": "insulto",
-        "jurar": "juramento", "lamentar": "lamento", "lisonjear": "lisonja",
-        "pedir": "petición", "perdonar": "perdón", "protestar": "protesta",
-        "regañar": "regaño", "replicar": "réplica", "rogar": "ruego",
-        "saludar": "saludo", "suplicar": "súplica"
-    },
-    "bendecir": {
-        "aconsejar": "consejo", "argumentar": "argumento", "bendecir": "bendición",
-        "debatir": "debate", "maldecir": "maldición", "mentir": "mentira",
-        "prometer": "promesa"
-    }
-}
 
-VERBOS_TRI_NEG = {
-    "desatribuir": [
-        "desatribuir", "desasignar", "quitar", "retirar", "denegar",
-        "rechazar", "rehusar", "desconocer", "ignorar", "negar", "revocar",
-        "desacreditar", "desautorizar", "invalidar", "desadscribir",
-        "desvincular", "separar"
-    ],
-    "ocultar": [
-        "ocultar", "esconder", "encubrir", "disimular", "camuflar", "velar",
-        "callar", "silenciar", "omitir", "reservar", "retener", "hurtar",
-        "guardar", "escamotear", "suprimir", "enmascarar", "tapar"
-    ]
-}
+# Versión de cómo se arma el índice (entra en la huella de los compilados): se sube al cambiarlo
+VERSION_INDICE = 1
 
-VERBOS_POSESION = {
-    "tener": [
-        "acoger", "albergar", "alojar", "contener", "conservar", "custodiar",
-        "cuidar", "demostrar", "denotar", "desplegar", "evidenciar", "exhibir",
-        "gestionar", "guardar", "hospedar", "incluir", "lucir", "manifestar",
-        "mantener", "mostrar", "ofrecer", "ostentar", "portar", "poseer",
-        "presentar", "proteger", "reflejar", "resguardar", "revelar",
-        "sostener", "soportar", "tener", "vigilar"
-    ],
-    "obtener": [
-        "obtener", "conseguir", "lograr", "adquirir", "alcanzar", "recibir",
-        "ganar", "captar", "capturar", "atrapar"
-    ],
-    "perder": ["perder", "extraviar", "traspapelar", "egraviar"]
-}
 
-VERBOS_EXISTENCIA = [
-    "conservada", "conservado", "conservadas", "conservados",
-    "existida", "existido", "existidas", "existidos",
-    "habida", "habido", "habidas", "habidos",
-    "perdurada", "perdurado", "perduradas", "perdurados",
-    "permanecida", "permanecido", "permanecidas", "permanecidos",
-    "persistida", "persistido", "persistidas", "persistidos",
-    "quedada", "quedado", "quedadas", "quedados",
-    "resistida", "resistido", "resistidas", "resistidos",
-    "restada", "restado", "restadas", "restados",
-    "sida", "sido", "sidas", "sidos",
-    "sobrevivida", "sobrevivido", "sobrevividas", "sobrevividos",
-    "subsistida", "subsistido", "subsistidas", "subsistidos"
-]
+def construir_indice_clases(datos: dict) -> typing.Mapping[str, typing.Tuple[str, ...]]:
+    prioridad = {clase: posicion for posicion, clase in enumerate(datos["PRIORIDAD_CLASES"])}
+    clases: typing.Dict[str, typing.Set[str]] = {}
+    for nombre in NOMBRES_LEXICO:
+        lexico, contenido = nombre_clase(nombre), datos[nombre]
+        # Léxicos con categorías ({"sacar": [...], ...}) o una sola clase (lista o verbo -> valor)
+        if isinstance(contenido, dict) and all(isinstance(v, (list, dict)) for v in contenido.values()):
+            grupos = {f"{lexico}:{categoria}": verbos for categoria, verbos in contenido.items()}
+        else:
+            grupos = {lexico: contenido}
+        for clase, verbos in grupos.items():
+            if clase not in prioridad:
+                raise KeyError(f"La clase «{clase}» no está en PRIORIDAD_CLASES")
+            for verbo in verbos:
+                clases.setdefault(verbo, set()).add(clase)
+    return MappingProxyType({
+        verbo: tuple(sorted(clases_verbo, key=prioridad.__getitem__)) for verbo, clases_verbo in clases.items()
+    })
 
-VERBOS_PERCEPCION = {
-    "ver": "see", "observar": "see", "mirar": "see", "contemplar": "see",
-    "vislumbrar": "see", "divisar": "see", "atisbar": "see", "escudriñar": "see",
-    "distinguir": "see", "enfocar": "see", "ojear": "see", "cachar": "see",
-    "otear": "see", "escanear": "see", "acechar": "see",
-    "oír": "hear", "escuchar": "hear", "atender": "hear", "auscultar": "hear",
-    "tocar": "feel", "palpar": "feel", "rozar": "feel", "acariciar": "feel",
-    "manosear": "feel",
-    "probar": "taste", "saborear": "taste", "degustar": "taste", "paladear": "taste",
-    "catar": "taste", "gustar": "taste",
-    "oler": "smell", "aspirar": "smell", "olisquear": "smell", "olfatear": "smell",
-    "husmear": "smell", "inhalar": "smell", "olorosar": "smell"
-}
 
-VERBOS_PERCEPCION_IMPERSONAL = {
-    "saber": "taste", "sabido": "taste", "sabida": "taste", "sabidos": "taste", "sabidas": "taste",
-    "oler": "smell", "olido": "smell", "olida": "smell", "olidos": "smell", "olidas": "smell",
-    "sonar": "hear", "sonado": "hear", "sonada": "hear", "sonados": "hear", "sonadas": "hear",
-    "ver": "see", "verse": "see", "visto": "see", "vista": "see", "vistos": "see", "vistas": "see",
-    "sentir": "feel", "sentirse": "feel", "sentido": "feel", "sentida": "feel", "sentidos": "feel", "sentidas": "feel"
-}
+def pares_clases(datos: dict) -> typing.Iterator[typing.Tuple[str, str]]:
+    """(verbo, clases) del índice de estos datos, para lexico_compilado.py."""
+    for verbo, clases in construir_indice_clases(datos).items():
+        yield verbo, "\t".join(clases)
+
+
+def construir_lexico_ls(datos: dict) -> LexicoLS:
+    # El índice compilado (lexico_compilado.py), si se armó con estos datos
+    clases = lexico_compilado.abrir("clases_ls", datos, lambda valor: tuple(valor.split("\t")), VERSION_INDICE)
+    if clases is None:
+        clases = construir_indice_clases(datos)
+    return LexicoLS(*(congelar(datos[nombre]) for nombre in NOMBRES_LEXICO), clases)
+
+
+LEXICO_LS = LexicoVigilado("verbos_ls.json", construir_lexico_ls)
+
+
+def __getattr__(nombre):
+    # Compatibilidad: ls.VERBOS_MOVIMIENTO, etc. devuelven la versión vigente del léxico
+    if nombre in NOMBRES_LEXICO:
+        return getattr(LEXICO_LS.actual(), nombre.lower())
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
 
 
 def set_spanish_locale():
@@ -244,8 +185,9 @@ def limpiar_consola():
     os.system('cls' if os.name == 'nt' else 'clear')
 
 
-def peticion(prompt: str) -> str:
-    readline.set_startup_hook(lambda: readline.insert_text(""))
+def peticion(prompt: str, sugerencia: str = "") -> str:
+    import readline
+    readline.set_startup_hook(lambda: readline.insert_text(sugerencia))
     try:
         if "\n" in prompt or len(prompt) > 60:
             print(prompt, end="", flush=True)
@@ -258,10 +200,18 @@ def peticion(prompt: str) -> str:
             raise ReiniciarAnalisis()
             
         return user.encode('utf-8').decode('utf-8')
+    except EOFError:
+        # Sin más entrada (Ctrl-D o cliente del demonio desconectado): se termina el programa
+        raise SystemExit(0)
     finally:
         readline.set_startup_hook()
 
 
+def pedir_infinitivo(prompt: str = "Escribe el infinitivo del verbo: ") -> str:
+    """Pide el infinitivo, ofreciendo como sugerencia el que ya obtuvo aktionsart.py (si lo hay)."""
+    return peticion(prompt, SUGERENCIAS["infinitivo"])
+
+
 def input_si_no(prompt: str) -> bool:
     validas = {'sí': True, 'si': True, 's': True, 'no': False, 'n': False}
     while True:
@@ -271,13 +221,6 @@ def input_si_no(prompt: str) -> bool:
         print("Por favor, responde «sí (s)» o «no (n)».")
 
 
-def buscar_verbo(verbo, diccionario):
-    for categoria, verbos in diccionario.items():
-        if verbo in verbos:
-            return categoria
-    return None
-
-
 def añadir_operadores(estructura_logica):
     # Definición de Estilos ANSI 
     ITALICA = "\033[3m"
@@ -380,10 +323,11 @@ def aplicar_DO(oracion_original, x, estructura_logica, es_dinamico, AKT):
 
 
 def verificar_percepcion(pred):
+    lex = LEXICO_LS.actual()
     if input_si_no(f"¿«{pred[0].upper() + pred[1:]}» indica un tipo de percepción sensorial? (s/n): "):
         pred_lower = pred.lower()
-        if pred_lower in VERBOS_PERCEPCION:
-            nuevo_pred = VERBOS_PERCEPCION[pred_lower]
+        if pred_lower in lex.verbos_percepcion:
+            nuevo_pred = lex.verbos_percepcion[pred_lower]
         else:
             sentidos = {"1": "see", "2": "hear", "3": "smell", "4": "taste", "5": "feel"}
             while True:
@@ -423,9 +367,9 @@ def obtener_predicado(AKT, y, es_dinamico):
     if AKT in ["actividad causativa", "realización activa causativa"] or (AKT in ["logro causativo", "semelfactivo causativo"] and es_dinamico):
         return "" #Se tratan de manera específica en generar_estructura_logica
     elif (AKT in ["actividad", "realización activa"]) or (AKT in ["logro", "semelfactivo"] and es_dinamico) or (y != "Ø" and "causativ" not in AKT):
-        pred = peticion("Escribe el infinitivo del verbo: ")
+        pred = pedir_infinitivo()
     else:
-        pred = peticion("Escribe el verbo en su forma de participio (o el adjetivo relacionado) \no, si se trata de un verbo (seudo)copulativo, escribe el atributo: ")
+        pred = peticion("Escribe el verbo en su forma de participio (o el adjetivo relacionado) \no, si se trata de un verbo (seudo)copulativo, escribe el atributo: ", SUGERENCIAS["participio"])
     return pred.lower().replace(" ", ".")
 
 
@@ -500,7 +444,7 @@ def manejar_creacion(x, y, z, pred, es_causativa):
 def manejar_consumo(x, y, z, pred, es_causativa):
     if es_causativa:
         # Pedir el verbo original de la oración para decidir el flujo
-        verbo_original = peticion("Escribe el infinitivo del verbo de la oración original (ej: «alimentar»): ").lower().replace(" ", ".")       
+        verbo_original = pedir_infinitivo("Escribe el infinitivo del verbo de la oración original (ej: «alimentar»): ").lower().replace(" ", ".")       
         # Caso especial para verbos tipo "alimentar"
         if verbo_original in ["alimentar", "nutrir", "cebar", "hidratar", "saciar", "empachar"]:
             pred = peticion(f"Escribe en infinitivo la actividad realizada por «{y}» (ej: «comer»): ").lower().replace(" ", ".")
@@ -542,7 +486,8 @@ def manejar_otros(x, y, z, pred, es_causativa, oracion_original):
             return f"do' ({x}, [{pred}' ({x})]) ∧ PROC {participio}' ({x}) ∧ FIN {participio}' ({x})"
 
 def manejar_desplazamiento(AKT, x, y, z, pred, locus, es_causativa, oracion_original):
-    categoria_movimiento = buscar_verbo(pred, VERBOS_MOVIMIENTO)
+    lex = LEXICO_LS.actual()
+    categoria_movimiento = lex.categoria(pred, "movimiento")
     if categoria_movimiento:
         pred = categoria_movimiento
 
@@ -564,13 +509,13 @@ def manejar_desplazamiento(AKT, x, y, z, pred, locus, es_causativa, oracion_orig
 def verbos_doler_gustar(AKT, x, y, z, operador, es_dinamico, oracion_original): #A [OI] le [VERBO] [SUJETO]
     if "causativ" not in AKT and AKT != "realización activa" and x != "Ø" and y == "Ø" and z != "Ø":
         if input_si_no(f"¿«{x[0].upper() + x[1:]}» está situado en alguna parte de «{z}»? (s/n): "):
-            pred = peticion("Escribe el infinitivo del verbo: ").lower().replace(" ", ".")
+            pred = pedir_infinitivo().lower().replace(" ", ".")
             if es_dinamico:
                 return f"{operador + ' ' if operador else ''}do' ({x}, [{pred}' ({x})]) ∧ have.as.part' ({z}, {x})"
             else:
                 return f"{operador + ' ' if operador else ''}{pred}' ({x}) ∧ have.as.part' ({z}, {x})"
         elif input_si_no(f"¿«{oracion_original[0].upper() + oracion_original[1:]}» tiene una estructura parecida a «A {z} le [verbo] {x}»? (s/n): "):
-            pred = peticion("Escribe el infinitivo del verbo: ").lower().replace(" ", ".")
+            pred = pedir_infinitivo().lower().replace(" ", ".")
             if es_dinamico:
                 return f"{operador + ' ' if operador else ''}do' ({x}, [{pred}' ({x}, {z})]) [MR1]"
             else:
@@ -588,7 +533,7 @@ def hacer_meteorologico(x, y, oracion_original, operador, es_dinamico):#Hace fr
 
 def casos_impersonales(x, y, z, operador, es_dinamico): #A alguien le va bien / A alguien le basta/sobra con algo
     if not es_dinamico and x == "Ø" and y == "Ø" and z != "Ø":
-        verbo = peticion("Escribe el infinitivo del verbo: ")
+        verbo = pedir_infinitivo()
         verbo = verbo.lower().replace(" ", ".")
         if verbo in ["ir", "irme", "irte", "irle", "irnos", "iros", "irles"]:
             pred = peticion("Escribe el adverbio o equivalente (ej: «bien»): ").lower().replace(" ", ".")
@@ -601,7 +546,7 @@ def casos_impersonales(x, y, z, operador, es_dinamico): #A alguien le va bien /
 def casos_locativo_dativos(AKT, x, y, z, operador, es_dinamico): #Pepe se le aproximó a Ana
     if "causativ" not in AKT and AKT != "estado" and x != "Ø" and y == "Ø" and z != "Ø" and input_si_no(f"¿«{z[0].upper() + z[1:]}» señala el destino de un desplazamiento por parte de «{x}»? (s/n): "):
         if AKT == "realización activa":
-            pred = peticion("Escribe el infinitivo del verbo: ").lower().replace(" ", ".")
+            pred = pedir_infinitivo().lower().replace(" ", ".")
             return f"do' ({x}, [{pred}' ({x})]) ∧ PROC covering.path.distance' ({x}) ∧ FIN be-LOC' ({z}, {x})"
         elif es_dinamico:
             return f"{operador + ' ' if operador else ''}do' ({x}, [be-LOC' ({z}, {x})])"
@@ -612,7 +557,7 @@ def casos_locativo_dativos(AKT, x, y, z, operador, es_dinamico): #Pepe se le apr
 def verbos_OI(AKT, x, y, z, operador): #Verbos triargumentales con complemento indirecto
     if z == "Ø":
         return None
-    pred = peticion("Escribe el infinitivo del verbo: ").lower().replace(" ", ".")
+    pred = pedir_infinitivo().lower().replace(" ", ".")
     
     # Caso especial: realización activa causativa triargumental (ej: "enseñar francés a alguien")
     if AKT == "realización activa causativa":
@@ -632,56 +577,64 @@ def verbos_OI(AKT, x, y, z, operador): #Verbos triargumentales con complemento i
     return manejar_otros_verbos(AKT, x, y, z, pred, operador)
 
 def manejar_realizacion_activa_diccion(x, y, z, pred):
+    lex = LEXICO_LS.actual()
     if not input_si_no(f"¿Es «{pred}» un verbo de dicción? (s/n): "):
         return None
     
     # SANITIZACIÓN + SOMETHING
     y_clean = "something" if y in ["Ø", "0"] else y.replace(" ", ".")
     z_clean = z.replace(" ", ".")
+    categoria = lex.categoria(pred, "diccion")
     
-    if pred in VERBOS_DICCION["preguntar"]:
+    if categoria == "preguntar":
         return f"[do' ({x}, [express.question' ({x}, pregunta)]) ∧ PROC being.created' (pregunta) ∧ FIN exist' (pregunta)] PURP [do' ({z}, [express.something' ({z}, {y})])]"
-    elif pred in VERBOS_DICCION["agradecer"]:
-        arg_incorporado = VERBOS_DICCION["agradecer"][pred]
+    elif categoria == "agradecer":
+        arg_incorporado = lex.verbos_diccion["agradecer"][pred]
         return f"[do' ({x}, [express.{arg_incorporado}' ({x}, {y})]) ∧ PROC being.created' ({arg_incorporado}) ∧ FIN exist' ({arg_incorporado})] PURP [know' ({z}, {arg_incorporado} por {y})]"
-    elif pred in VERBOS_DICCION["bendecir"]:
-        arg_incorporado = VERBOS_DICCION["bendecir"][pred]
+    elif categoria == "bendecir":
+        arg_incorporado = lex.verbos_diccion["bendecir"][pred]
         return f"[do' ({x}, [express.{arg_incorporado}' ({x}, {y})]) ∧ PROC being.created' ({arg_incorporado}) ∧ FIN exist' ({arg_incorporado})] PURP [know' ({z}, {arg_incorporado} de {y})]"
     else:
         return f"[do' ({x}, [express.something' ({x}, {y})]) ∧ PROC being.created' ({y}) ∧ FIN exist' ({y})] PURP [know' ({z}, {y})]"
 
 def manejar_verbos_transferencia(x, y, z, pred, operador, AKT): # Añadimos AKT en los argumentos
-    if pred in VERBOS_TRANSFERENCIA["sacar"]:
+    lex = LEXICO_LS.actual()
+    transferencia = lex.categoria(pred, "transferencia")
+    if transferencia == "sacar":
         
         if pred == "arrancar" and "causativ" not in AKT:
             return None
 
         return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}NOT have' ({z}, {y})] PURP [have' ({x}, {y})]"
     
-    elif (pred in VERBOS_TRANSFERENCIA["dar_poner"] or input_si_no(f"¿El significado típico de «{pred}» es la transferencia de un objeto físico? (s/n): ")) or (pred == "pegar" and y!= "Ø"):
+    elif (transferencia == "dar_poner" or input_si_no(f"¿El significado típico de «{pred}» es la transferencia de un objeto físico? (s/n): ")) or (pred == "pegar" and y!= "Ø"):
         return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}have' ({z}, {y})]"
     return None
 
 def manejar_verbo_diccion(x, y, z, pred, operador):
+    lex = LEXICO_LS.actual()
     # SANITIZACIÓN + SOMETHING
     y_clean = "something" if y in ["Ø", "0"] else y.replace(" ", ".")
     z_clean = z.replace(" ", ".")
+    categoria = lex.categoria(pred, "diccion")
 
-    if pred in VERBOS_DICCION["preguntar"]:
+    if categoria == "preguntar":
         return f"[{operador + ' ' if operador else ''}do' ({x}, [express.question' ({x})])] PURP [do' ({z}, [express.{y_clean}' ({z}, {y})])]"
-    elif pred in VERBOS_DICCION["agradecer"]:
-        arg_incorporado = VERBOS_DICCION["agradecer"][pred]
+    elif categoria == "agradecer":
+        arg_incorporado = lex.verbos_diccion["agradecer"][pred]
         return f"[{operador + ' ' if operador else ''}do' ({x}, [express.{arg_incorporado}' ({x}, {y})])] PURP [know' ({z}, {arg_incorporado} por {y})]"
-    elif pred in VERBOS_DICCION["bendecir"]:
-        arg_incorporado = VERBOS_DICCION["bendecir"][pred]
+    elif categoria == "bendecir":
+        arg_incorporado = lex.verbos_diccion["bendecir"][pred]
         return f"[{operador + ' ' if operador else ''}do' ({x}, [express.{arg_incorporado}' ({x}, {y})])] PURP [know' ({z}, {arg_incorporado} de {y})]"
     else:
         return f"[{operador + ' ' if operador else ''}do' ({x}, [express.something' ({x}, {y})])] PURP [know' ({z}, {y})]"
 
 def manejar_otros_verbos(AKT, x, y, z, pred, operador):
-    if pred in VERBOS_TRI_NEG["desatribuir"]:
+    lex = LEXICO_LS.actual()
+    tri_neg = lex.categoria(pred, "tri_neg")
+    if tri_neg == "desatribuir":
         return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}NOT have' ({z}, {y})]"
-    elif pred in VERBOS_TRI_NEG["ocultar"]:
+    elif tri_neg == "ocultar":
         return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}NOT know' ({z}, {y})]"
     elif input_si_no(f"¿Es «{pred}» un verbo como «enseñar» o «mostrar»? (s/n): "):
         return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}know' ({z}, {y})]"
@@ -725,16 +678,17 @@ def informacion_mente(AKT, x, y, operador, es_dinamico, oracion_original):
     return None
 
 def complemento_regimen(AKT, x, y, operador, es_dinamico, oracion_original):
+    lex = LEXICO_LS.actual()
     if AKT in ["estado", "actividad", "proceso", "logro", "realización", "semelfactivo"] and y == "Ø" and input_si_no(f"¿Alguno de los constituyentes de «{oracion_original}» es un complemento de régimen\n(ej: «de defectos» en «la obra carece de defectos»)? (s/n): "):
         
-        entrada_verbo = peticion("Escribe el infinitivo del verbo: ").lower().strip()
+        entrada_verbo = pedir_infinitivo().lower().strip()
         
         # --- FILTRO DE SEGURIDAD PARA VERBOS RECÍPROCOS ---
         verbo_aislado = entrada_verbo.split()[0]
         
         # Si el verbo está en la lista de dicción recíproca (conversar, discutir, hablar...),
         # ABORTAMOS esta función para que lo maneje 'predicados_especiales' más adelante.
-        categoria = buscar_verbo(verbo_aislado, VERBOS_DICCION)
+        categoria = lex.categoria(verbo_aislado, "diccion")
         if categoria == "conversar":
             return None
         # --------------------------------------------------
@@ -750,7 +704,26 @@ def complemento_regimen(AKT, x, y, operador, es_dinamico, oracion_original):
         return estructura_logica
     return None
 
+# Aktionsart en que un verbo de movimiento lleva a «x» de un lugar o a un lugar (irse)
+AKT_DESPLAZAMIENTO = ("actividad", "logro", "realización", "proceso", "semelfactivo")
+
+def clase_locativa(lex, pred, AKT) -> str:
+    """
+    La clase de mayor prioridad del verbo (PRIORIDAD_CLASES, entre todos sus léxicos) que
+    tiene un caso locativo propio; "" si ninguna. Así decide la prioridad y no el orden de
+    los casos: «arrancar» es de «sacar» antes que de movimiento, salvo sin causa (el tren arrancó).
+    """
+    for clase in lex.clases.get(pred, ()):
+        if clase == "posesion:tener":
+            return clase
+        if clase.startswith("movimiento:") and AKT in AKT_DESPLAZAMIENTO:
+            return clase
+        if clase == "transferencia:sacar" and not (pred in ("arrancar", "retirar") and "causativ" not in AKT):
+            return clase
+    return ""
+
 def casos_locativos(estructura_logica, AKT, x, y, z, operador, es_dinamico, oracion_original):
+    lex = LEXICO_LS.actual()
     locus = "Ø"
 
     args_presentes = [f"«{arg}»" for arg in [x, y] if arg != "Ø"]
@@ -759,7 +732,8 @@ def casos_locativos(estructura_logica, AKT, x, y, z, operador, es_dinamico, orac
     if input_si_no(f"Considera la cláusula «{oracion_original}». \n¿Alguno de sus constituyentes argumentales (no periféricos) indica la ubicación, \nel destino o el punto de partida de {texto_participantes}? (s/n): "):
         locus = peticion("Escribe la información del lugar, sin preposición: ")
 
-        pred = peticion("Escribe el infinitivo del verbo: ").lower().replace(" ", ".")
+        pred = pedir_infinitivo().lower().replace(" ", ".")
+        clase = clase_locativa(lex, pred, AKT)
         
         # verbo "haber" con locativo
         if pred == "haber":
@@ -771,7 +745,7 @@ def casos_locativos(estructura_logica, AKT, x, y, z, operador, es_dinamico, orac
                 return f"be-LOC' ({locus}, Ø) [MR1]", locus
             
         # verbo "tener" con locativo
-        elif pred in VERBOS_POSESION["tener"]:
+        elif clase == "posesion:tener":
             if input_si_no(f"¿«{y[0].upper() + y[1:]}» está situado en alguna parte de «{x}»? (s/n): "):
                 return f"have.as.part' ({x}, {y}) ∧ be-LOC' ({locus}, {y})", locus
             elif pred in ["tener", "poseer", "ostentar", "lucir"] and input_si_no(f"¿«{y[0].upper() + y[1:]}» indica una relación de parentesco? (s/n): "):
@@ -780,7 +754,7 @@ def casos_locativos(estructura_logica, AKT, x, y, z, operador, es_dinamico, orac
                 return f"{pred}' ({x}, {y}) ∧ be-LOC' ({locus}, {y})", locus
         
         # verbos tipo "irse" (MOVIMIENTO)
-        elif AKT in ("actividad", "logro", "realización", "proceso", "semelfactivo") and (buscar_verbo(pred, VERBOS_MOVIMIENTO) or input_si_no(f"¿Como resultado del evento, «{x}» dejó de estar o llegó a estar en «{locus}»? (s/n): ")):
+        elif clase.startswith("movimiento:") or (not clase and AKT in AKT_DESPLAZAMIENTO and input_si_no(f"¿Como resultado del evento, «{x}» dejó de estar o llegó a estar en «{locus}»? (s/n): ")):
             if es_dinamico:
                 lugar_tipo = peticion(f"¿«{locus[0].upper() + locus[1:]}» es (1) la procedencia o (2) el destino? Escribe 1 o 2: ")
                 if lugar_tipo == "1":
@@ -795,7 +769,7 @@ def casos_locativos(estructura_logica, AKT, x, y, z, operador, es_dinamico, orac
                     return f"{operador + ' ' if operador else ''}be-LOC' ({locus}, {x})", locus
         
         # verbos tipo "echar"
-        elif AKT in ("logro causativo", "realización causativa", "proceso causativo", "semelfactivo causativo") and input_si_no(f"¿Como resultado del evento, «{y}» dejó de estar o llegó a estar en «{locus}»? (s/n): "):
+        elif not clase and AKT in ("logro causativo", "realización causativa", "proceso causativo", "semelfactivo causativo") and input_si_no(f"¿Como resultado del evento, «{y}» dejó de estar o llegó a estar en «{locus}»? (s/n): "):
             if es_dinamico:
                 lugar_tipo = peticion(f"¿«{locus[0].upper() + locus[1:]}» es (1) la procedencia o (2) el destino? Escribe 1 o 2: ")
                 if lugar_tipo == "1":
@@ -810,7 +784,7 @@ def casos_locativos(estructura_logica, AKT, x, y, z, operador, es_dinamico, orac
                     return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}be-LOC' ({locus}, {y})]", locus
         
         # verbos tipo "sacar" (TRANSFERENCIA)
-        elif pred in VERBOS_TRANSFERENCIA["sacar"] and not ((pred == "arrancar" or pred == "retirar") and "causativ" not in AKT):
+        elif clase == "transferencia:sacar":
             return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}NOT be-LOC' ({locus}, {y})]", locus
         
         # "olvidar" algo en un lugar
@@ -827,17 +801,18 @@ def casos_locativos(estructura_logica, AKT, x, y, z, operador, es_dinamico, orac
 
 
 def predicados_especiales(AKT, x, y, z, pred, operador, es_dinamico, oracion_original):
+    lex = LEXICO_LS.actual()
     # casos como "algo huele mal"
-    if pred in VERBOS_PERCEPCION_IMPERSONAL and not es_dinamico and y == "Ø":
-        verbo_infinitivo = VERBOS_PERCEPCION_IMPERSONAL[pred]
+    if lex.tiene(pred, "percepcion_impersonal") and not es_dinamico and y == "Ø":
+        verbo_infinitivo = lex.verbos_percepcion_impersonal[pred]
         cualidad = peticion(f"Escribe la cualidad percibida en «{oracion_original}» (ej: «mal», «raro», «a chocolate»): ").lower().replace(" ", ".")
         return f"{operador + ' ' if operador else ''}{verbo_infinitivo}.{cualidad}' ({x})", False
     
     # verbos meteorológicos propios
-    if x == "Ø" and pred in VERBOS_METEOROLOGICOS:
+    if x == "Ø" and lex.tiene(pred, "meteorologicos"):
         return f"{operador + ' ' if operador else ''}do' ([{pred}'])", False
     
-    if pred in VERBOS_DICCION["conversar"] and input_si_no(f"¿Hay un interlocutor en «{oracion_original}»? (s/n): "):
+    if lex.tiene(pred, "diccion:conversar") and input_si_no(f"¿Hay un interlocutor en «{oracion_original}»? (s/n): "):
         z = peticion("Escribe quién es el interlocutor: ")
         
         # SANITIZACIÓN
@@ -861,14 +836,15 @@ def predicados_especiales(AKT, x, y, z, pred, operador, es_dinamico, oracion_ori
             return f"{operador + ' ' if operador else ''}NOT know' ({x}, {y})", False
     
     # verbos como "perder"
-    if pred in VERBOS_POSESION["perder"]:
+    posesion = lex.categoria(pred, "posesion")
+    if posesion == "perder":
         if es_dinamico:
             return f"{operador + ' ' if operador else ''}do' ({x}, [NOT have' ({x}, {y})])", False
         else:
             return f"{operador + ' ' if operador else ''}NOT have' ({x}, {y})", False
     
     # verbos como "obtener"
-    if pred in VERBOS_POSESION["obtener"] and y != "Ø":
+    if posesion == "obtener" and y != "Ø":
         if es_dinamico:
             return f"{operador + ' ' if operador else ''}do' ({x}, [INGR have' ({x}, {y})])", False
         else:
@@ -880,13 +856,13 @@ def predicados_especiales(AKT, x, y, z, pred, operador, es_dinamico, oracion_ori
         if pred in ["ignorar", "desconocer"]:
             return f"NOT know' ({x}, {y})", False
         #verbos de existencia con sujeto
-        elif pred in VERBOS_EXISTENCIA and y == "Ø":
+        elif lex.tiene(pred, "existencia") and y == "Ø":
             return f"exist' ({x})", False
         #verbos de existencia sin sujeto ("haber")
         elif pred == "haber":
             return f"exist' ({y}) [MR0]", False
         #posesión alienable, inalienable y de parentesco
-        elif pred in VERBOS_POSESION["tener"] and y != "Ø":
+        elif posesion == "tener" and y != "Ø":
             if input_si_no(f"¿«{y[0].upper() + y[1:]}» es una parte constituyente de «{x}»? (s/n): "):
                 return f"have.as.part' ({x}, {y})", False
             elif pred in ["tener", "poseer", "ostentar", "lucir"] and input_si_no(f"¿«{y[0].upper() + y[1:]}» indica una relación de parentesco? (s/n): "):
@@ -904,6 +880,9 @@ def traducir_ls_a_ingles(ls_string):
     if not ls_string:
         return ls_string
 
+    # Se importa aquí porque deep_translator tarda en cargar y solo se usa al final del análisis
+    from deep_translator import GoogleTranslator
+
     # Códigos ANSI para formato en terminal
     NEGRITA = "\033[1m"
     RESET = "\033[0m"
@@ -947,16 +926,19 @@ def traducir_ls_a_ingles(ls_string):
         # 3. Si no, intentar traducción normal
         else:
             texto_limpio = constante.replace(".", " ")
-            if texto_limpio in CACHE_TRADUCCION:
-                palabra_final = CACHE_TRADUCCION[texto_limpio]
-            else:
+
+            def consultar():
                 try:
                     traduccion = translator.translate(texto_limpio)
                     if traduccion:
-                        palabra_final = traduccion.lower().strip().replace(" ", ".")
-                        CACHE_TRADUCCION[texto_limpio] = palabra_final
+                        return traduccion.lower().strip().replace(" ", ".")
                 except Exception:
-                    pass 
+                    pass
+                return None
+
+            traducida = CACHE_TRADUCCION.obtener_o_calcular(texto_limpio, consultar)
+            if traducida:
+                palabra_final = traducida
 
         return f"{NEGRITA}{palabra_final}'{RESET}"
 
@@ -964,7 +946,13 @@ def traducir_ls_a_ingles(ls_string):
     ls_traducida = re.sub(patron, reemplazar_match, ls_string)
     return ls_traducida
 
-def main():
+def main(aktionsart=None, oracion_original: str = "", rasgos=None, datos_clausula=None):
+    """
+    Punto de entrada. Cuando se llama desde aktionsart.py recibe el Aktionsart, los RasgosPred
+    y los DatosClause ya obtenidos, de modo que no hay que volver a preguntarlos.
+    """
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    LEXICO_LS.vigilar()
     set_spanish_locale()
     limpiar_consola()
     print("""
@@ -979,7 +967,16 @@ típica, y puede dar resultados inexactos en construcciones que las alteran.
     
     while True:
         try:
-            if len(sys.argv) > 3:
+            SUGERENCIAS["infinitivo"] = SUGERENCIAS["participio"] = ""
+            if aktionsart is not None:
+                AKT = aktionsart.value
+                es_dinamico = rasgos.dinamico and not rasgos.estativo
+                if datos_clausula is not None:
+                    SUGERENCIAS["infinitivo"] = datos_clausula.infinitivo
+                    SUGERENCIAS["participio"] = datos_clausula.participio
+                print(f"El aktionsart que obtuviste en «{oracion_original}» fue: {AKT.upper()}")
+                aktionsart = None
+            elif len(sys.argv) > 3:
                 AKT = sys.argv[1]
                 oracion_original = sys.argv[2]
                 flag = sys.argv[3]
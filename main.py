@@ -1,22 +1,28 @@
+import importlib
 import os
-import sys
-import subprocess
 
 # 1. ANCLA: Obligar a Python a trabajar en la carpeta donde está este archivo
 # Esto soluciona el error "No such file or directory"
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
-# 2. CONFIGURACIÓN: Textos originales y archivos asociados
+# 2. CONFIGURACIÓN: Textos originales y módulos asociados
 PROGRAMAS = {
-    "1": ("Identificar el aktionsart de un predicado (y, opcionalmente, obtener su estructura lógica)", "aktionsart.py"),
-    "2": ("Obtener la estructura lógica de una cláusula (si ya conoces el aktionsart de su predicado)", "ls.py"),
-    "3": ("English version (only for Aktionsart detection)", "english.py"),
-    "4": ("Mostrar información sobre el programa", "info.py")
+    "1": ("Identificar el aktionsart de un predicado (y, opcionalmente, obtener su estructura lógica)", "aktionsart"),
+    "2": ("Obtener la estructura lógica de una cláusula (si ya conoces el aktionsart de su predicado)", "ls"),
+    "3": ("English version (only for Aktionsart detection)", "english"),
+    "4": ("Mostrar información sobre el programa", "info")
 }
 
+# Módulos que ya piden Enter antes de volver al menú (no se pausa dos veces)
+PAUSAN_SOLOS = {"info"}
+
 def limpiar():
     os.system('cls' if os.name == 'nt' else 'clear')
 
+def cargar_programa(nombre_modulo):
+    """Importa el módulo una sola vez; las siguientes llamadas lo reutilizan (con sus modelos ya cargados)."""
+    return importlib.import_module(nombre_modulo)
+
 def main():
     while True:
         limpiar()
@@ -26,25 +32,46 @@ def main():
             print(f"{key}. {desc}")
         print("5. Salir")
 
-        opcion = input("\nPor favor, selecciona una opción (1-5): ")
+        try:
+            opcion = input("\nPor favor, selecciona una opción (1-5): ")
+        except EOFError:
+            # Ctrl-D en el menú: como salir
+            print()
+            opcion = "5"
 
         if opcion == "5":
             print("\n¡Gracias por usar Vendler! Si tienes comentarios, críticas o preguntas, escribe a cgonzalv@uc.cl")
             break
         
         if opcion in PROGRAMAS:
-            archivo_py = PROGRAMAS[opcion][1]
+            nombre_modulo = PROGRAMAS[opcion][1]
+            pausar = nombre_modulo not in PAUSAN_SOLOS
             try:
                 print(f"\nEjecutando la opción elegida...\n")
-                # Ejecutar usando el mismo Python del sistema (-u para salida inmediata)
-                subprocess.run([sys.executable, "-u", archivo_py], check=True)
+                # Se ejecuta dentro del mismo proceso: el modelo de spaCy y las cachés quedan en memoria
+                cargar_programa(nombre_modulo).main()
+            except KeyboardInterrupt:
+                print("\n\nOpción interrumpida.")
+                pausar = True
+            except SystemExit:
+                # Ctrl-D en una pregunta: motor.peticion y ls.peticion terminan el programa, no el menú
+                print("\n\nOpción terminada.")
+                pausar = False
             except Exception as e:
                 print(f"\nERROR: {e}")
+                pausar = True
             
             # Pausa de seguridad para leer resultados antes de borrar pantalla
-            input("\nPresiona [Enter] para volver al menú principal...")
+            if pausar:
+                try:
+                    input("\nPresiona [Enter] para volver al menú principal...")
+                except EOFError:
+                    pass
         else:
-            input("\nOpción no válida. Por favor, intenta de nuevo.")
+            try:
+                input("\nOpción no válida. Por favor, intenta de nuevo.")
+            except EOFError:
+                pass
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+"""
+Carga perezosa de los modelos de spaCy.
+
+El modelo se empieza a cargar en un hilo de fondo apenas se pide con
+precargar(), de modo que el usuario puede ir respondiendo las primeras
+preguntas mientras tanto. Solo obtener() bloquea, y únicamente si la carga
+aún no ha terminado.
+
+Un objeto Language de spaCy no debe usarse desde varios hilos a la vez, así que
+el análisis se hace con analizar(): cada llamada toma una copia libre del modelo
+y la devuelve al terminar. Con una sola copia (por defecto) los análisis quedan
+en fila; VENDLER_ANALIZADORES=N carga N copias para analizar N cláusulas a la vez.
+
+Los análisis se guardan (Doc serializado) en CACHE_ANALISIS: una LRU en memoria y
+un archivo SQLite, con clave = modelo, versión, perfil y texto normalizado. Una
+cláusula ya vista, en esta sesión o en otra, no vuelve a pasar por el parser.
+
+Se pueden agregar componentes propios al final del pipeline (ej: sanacion.py); sus
+nombres entran en la clave de la caché. Las extensiones que llenan no se guardan con
+el Doc (dependen de léxicos que se recargan y de reglas que cambian): al restaurarlo
+se vuelven a correr los componentes, o, si el modelo aún no cargó, las calcula quien
+las lee (sanacion.leer).
+
+Anticipador analiza en segundo plano las cláusulas que probablemente se pedirán
+(ej: la que el usuario acaba de escribir, mientras responde las primeras pruebas).
+
+Cascada encadena modelos de distinto tamaño (ej: es_core_news_sm -> md -> lg): el
+grande solo analiza lo que el chico resolvió con poca confianza.
+
+Uso como script (informe de tiempos por componente):
+    python modelos.py es_core_news_sm analisis "Pedro corrió" "María sabe inglés"
+    python modelos.py cache            # entradas en la caché de análisis en disco
+    python modelos.py cache vaciar     # la vacía
+"""
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from cache import AlmacenSQLite, CacheDosNiveles, CacheLRU
+
+# --- PERFILES DE PIPELINE ---
+# El análisis automático solo lee categoría (pos_), dependencias (dep_), lemas y
+# morfología, así que el reconocimiento de entidades (NER) sobra.
+PERFILES = {
+    "completo": (),
+    "analisis": ("ner",),
+}
+
+PERFIL_POR_DEFECTO = os.environ.get("VENDLER_PERFIL", "analisis")
+
+# Copias del modelo disponibles para analizar en paralelo (cada una ocupa su propia memoria)
+COPIAS_POR_DEFECTO = int(os.environ.get("VENDLER_ANALIZADORES", "1"))
+
+# --- CACHÉ DE ANÁLISIS ---
+# VENDLER_CACHE="" deja solo la caché en memoria
+RUTA_CACHE = os.environ.get(
+    "VENDLER_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "vendler", "analisis.sqlite3")
+)
+MAXIMO_CACHE_MEMORIA = int(os.environ.get("VENDLER_CACHE_MEMORIA", "512"))
+MAXIMO_CACHE_DISCO = int(os.environ.get("VENDLER_CACHE_DISCO", "20000"))
+# Los Doc restaurados de la caché comparten un Vocab propio, que crece con cada uno:
+# se reemplaza por uno vacío cada tantas restauraciones (los Doc ya entregados siguen con el suyo)
+RESTAURACIONES_POR_VOCAB = int(os.environ.get("VENDLER_RESTAURACIONES_VOCAB", "1000"))
+
+CACHE_ANALISIS = CacheDosNiveles(
+    CacheLRU(MAXIMO_CACHE_MEMORIA),
+    AlmacenSQLite(RUTA_CACHE, MAXIMO_CACHE_DISCO) if RUTA_CACHE else None,
+)
+
+TEXTOS_MUESTRA = [
+    "Pedro corrió hasta su casa", "María sabe inglés", "El gato rompió el jarrón",
+    "Ana le dio un libro a Pepe", "Peter ran home", "Mary knows English",
+]
+
+
+def normalizar_texto(texto: str) -> str:
+    return " ".join(texto.split())
+
+
+def version_paquete(nombre: str) -> Optional[str]:
+    """Versión instalada del paquete del modelo, sin importar spaCy (None si no está instalado)."""
+    from importlib import metadata
+    try:
+        return metadata.version(nombre)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+class ModeloPerezoso:
+    """Envoltorio de un modelo de spaCy que se carga una sola vez, en segundo plano."""
+
+    def __init__(self, nombre: str, perfil: Optional[str] = None, copias: Optional[int] = None,
+                 componentes: Optional[Dict[str, Callable[[Any], None]]] = None):
+        self.nombre = nombre
+        # nombre del componente -> función que lo agrega a un pipeline cargado
+        self.componentes = dict(componentes or {})
+        self.perfil = perfil or PERFIL_POR_DEFECTO
+        self.copias = max(1, copias or COPIAS_POR_DEFECTO)
+        self._modelo = None
+        self._libres: queue.Queue = queue.Queue()
+        self._hilo = None
+        self._lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._vocab_cache = None
+        self._restauraciones = 0
+        self._lock_cache = threading.Lock()
+
+    def _cargar(self) -> None:
+        try:
+            import spacy
+            self._modelo = self._cargar_copia(spacy)
+            self._libres.put(self._modelo)
+            for _ in range(self.copias - 1):
+                self._libres.put(self._cargar_copia(spacy))
+        except (ImportError, OSError) as e:
+            # Sin modelo el programa sigue funcionando en modo manual
+            logging.debug(f"No se pudo cargar {self.nombre}: {e}")
+            self._modelo = None
+
+    def _cargar_copia(self, spacy):
+        nlp = spacy.load(self.nombre, exclude=list(PERFILES[self.perfil]))
+        for agregar in self.componentes.values():
+            agregar(nlp)
+        return nlp
+
+    def precargar(self) -> None:
+        """Inicia la carga en un hilo de fondo (si no se ha iniciado ya)."""
+        with self._lock:
+            if self._hilo is None:
+                self._hilo = threading.Thread(target=self._cargar, name=f"carga-{self.nombre}", daemon=True)
+                self._hilo.start()
+
+    def obtener(self):
+        """Devuelve el modelo (o None si no está instalado), esperando a que termine la carga."""
+        self.precargar()
+        self._hilo.join()
+        return self._modelo
+
+    def version(self) -> Optional[str]:
+        if self._version is None:
+            self._version = version_paquete(self.nombre)
+        return self._version
+
+    def clave_cache(self, texto: str) -> str:
+        perfil = "+".join([self.perfil, *self.componentes])
+        return f"{self.nombre}=={self.version()}/{perfil}\t{normalizar_texto(texto)}"
+
+    def _restaurar(self, datos: bytes):
+        """Reconstruye un Doc guardado en la caché, sin esperar a que el modelo termine de cargar."""
+        from spacy.tokens import Doc
+        from spacy.vocab import Vocab
+        with self._lock_cache:
+            if self._vocab_cache is None or self._restauraciones >= RESTAURACIONES_POR_VOCAB:
+                self._vocab_cache = Vocab()
+                self._restauraciones = 0
+            self._restauraciones += 1
+            # user_data: las entradas viejas de la caché traen las extensiones de entonces
+            doc = Doc(self._vocab_cache).from_bytes(datos, exclude=["user_data"])
+        if self._modelo is not None:
+            for nombre in self.componentes:
+                doc = self._modelo.get_pipe(nombre)(doc)
+        return doc
+
+    def analizar(self, texto: str):
+        """
+        Analiza el texto con una copia libre del modelo (seguro entre hilos), o lo toma
+        de CACHE_ANALISIS si ya se analizó antes. None si no hay modelo.
+        """
+        usar_cache = self.version() is not None
+        if usar_cache:
+            clave = self.clave_cache(texto)
+            guardado = CACHE_ANALISIS.obtener(clave)
+            if guardado is not None:
+                return self._restaurar(guardado)
+
+        if self.obtener() is None:
+            return None
+        nlp = self._libres.get()
+        try:
+            doc = nlp(texto)
+        finally:
+            self._libres.put(nlp)
+
+        if usar_cache:
+            CACHE_ANALISIS.guardar(clave, doc.to_bytes(exclude=["tensor", "user_data"]))
+        return doc
+
+    def cargado(self) -> bool:
+        return self._hilo is not None and not self._hilo.is_alive()
+
+    def cambiar_perfil(self, perfil: str) -> None:
+        """Cambia el perfil de pipeline; si ya había un modelo cargado con otro perfil, se descarta."""
+        if perfil not in PERFILES:
+            raise ValueError(f"Perfil desconocido: «{perfil}». Opciones: {', '.join(PERFILES)}.")
+        with self._lock:
+            if perfil == self.perfil:
+                return
+            if self._hilo is not None:
+                self._hilo.join()
+            self.perfil = perfil
+            self._modelo = None
+            self._libres = queue.Queue()
+            self._hilo = None
+
+
+class Cascada:
+    """
+    Varios modelos, del más liviano al más pesado. Cada texto se analiza con el primero;
+    solo si el resultado no alcanza la confianza suficiente se vuelve a analizar con el
+    siguiente. Los modelos que no están instalados se saltan (y los grandes solo se
+    cargan la primera vez que hacen falta). Si ninguno alcanza, se devuelve el análisis
+    con más confianza (el del nivel más liviano si empatan).
+    """
+
+    def __init__(self, niveles: Sequence[ModeloPerezoso], confianza: Callable[[Any], int], suficiente: int = 2):
+        self.niveles = list(niveles)
+        self.confianza = confianza
+        self.suficiente = suficiente
+        self._contadores = {nivel.nombre: {"consultas": 0, "aceptadas": 0, "segundos": 0.0} for nivel in self.niveles}
+        self._candado = threading.Lock()
+
+    def disponibles(self) -> List[ModeloPerezoso]:
+        return [nivel for nivel in self.niveles if nivel.version() is not None]
+
+    def _contar(self, nombre: str, segundos: float, aceptada: bool) -> None:
+        with self._candado:
+            contador = self._contadores[nombre]
+            contador["consultas"] += 1
+            contador["aceptadas"] += aceptada
+            contador["segundos"] += segundos
+
+    def analizar(self, texto: str):
+        """El Doc del primer nivel que alcanza la confianza suficiente. None si no hay ningún modelo."""
+        mejor, mejor_confianza = None, -1
+        for nivel in self.disponibles():
+            inicio = time.perf_counter()
+            doc = nivel.analizar(texto)
+            if doc is None:
+                continue
+            confianza = self.confianza(doc)
+            self._contar(nivel.nombre, time.perf_counter() - inicio, confianza >= self.suficiente)
+            if confianza > mejor_confianza:
+                mejor, mejor_confianza = doc, confianza
+            if confianza >= self.suficiente:
+                break
+        return mejor
+
+    def estadisticas(self) -> Dict[str, Dict[str, float]]:
+        """Por nivel: consultas, aceptadas, tasa de aceptación y latencia media (ms)."""
+        with self._candado:
+            datos = {nombre: dict(contador) for nombre, contador in self._contadores.items()}
+        for contador in datos.values():
+            consultas = contador["consultas"]
+            contador["tasa_aceptadas"] = contador["aceptadas"] / consultas if consultas else 0.0
+            contador["ms_promedio"] = contador.pop("segundos") * 1000 / consultas if consultas else 0.0
+        return datos
+
+
+class Anticipador:
+    """
+    Análisis especulativos: anticipar(texto) lo empieza a analizar en un hilo de fondo
+    mientras el usuario sigue respondiendo, y obtener(texto) recoge ese resultado
+    (esperando si aún no termina) o, si el texto no se anticipó, lo analiza en el acto.
+    Las especulaciones que nadie recoge se descartan: se guardan solo las últimas.
+    El hilo de fondo se crea en cada proceso al primer uso (no sobrevive a un fork).
+    """
+
+    def __init__(self, analizar: Callable[[str], Any], maximo: int = 4):
+        self.analizar = analizar
+        self.maximo = maximo
+        self._pendientes: "OrderedDict[str, Future]" = OrderedDict()
+        self._ejecutor: Optional[ThreadPoolExecutor] = None
+        self._pid: Optional[int] = None
+        self._candado = threading.Lock()
+
+    def anticipar(self, texto: str) -> None:
+        clave = normalizar_texto(texto)
+        if not clave:
+            return
+        with self._candado:
+            if self._pid != os.getpid():
+                self._ejecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="anticipo")
+                self._pendientes = OrderedDict()
+                self._pid = os.getpid()
+            if clave in self._pendientes:
+                return
+            self._pendientes[clave] = self._ejecutor.submit(self.analizar, texto)
+            while len(self._pendientes) > self.maximo:
+                # Si aún no empezó, se cancela; si ya empezó, su resultado se pierde
+                self._pendientes.popitem(last=False)[1].cancel()
+
+    def obtener(self, texto: str):
+        with self._candado:
+            futuro = self._pendientes.pop(normalizar_texto(texto), None) if self._pid == os.getpid() else None
+        if futuro is not None and not futuro.cancelled():
+            try:
+                return futuro.result()
+            except Exception as e:
+                logging.debug(f"Falló el análisis anticipado de «{texto}»: {e}")
+        return self.analizar(texto)
+
+
+def medir_componentes(nombre: str, textos: Iterable[str]) -> Dict[str, float]:
+    """Carga el pipeline completo y mide cuánto tarda cada componente (en segundos) sobre los textos."""
+    import spacy
+    nlp = spacy.load(nombre)
+    tiempos = {nombre_comp: 0.0 for nombre_comp in nlp.pipe_names}
+    for texto in textos:
+        doc = nlp.make_doc(texto)
+        for nombre_comp, componente in nlp.pipeline:
+            inicio = time.perf_counter()
+            doc = componente(doc)
+            tiempos[nombre_comp] += time.perf_counter() - inicio
+    return tiempos
+
+
+def informe_perfil(nombre: str, perfil: str, textos: Iterable[str]) -> None:
+    """Imprime el tiempo de cada componente y cuánto se ahorra con el perfil elegido."""
+    textos = list(textos)
+    tiempos = medir_componentes(nombre, textos)
+    excluidos = set(PERFILES[perfil])
+    total = sum(tiempos.values()) or 1e-9
+    ahorro = sum(t for comp, t in tiempos.items() if comp in excluidos)
+
+    print(f"\nModelo: {nombre} | perfil: {perfil} | textos: {len(textos)}")
+    print("-" * 50)
+    for comp, t in tiempos.items():
+        marca = "  (excluido)" if comp in excluidos else ""
+        print(f"• {comp:<16} {t * 1000:8.2f} ms  {t / total:6.1%}{marca}")
+    print("-" * 50)
+    print(f"Tiempo ahorrado por el perfil: {ahorro * 1000:.2f} ms ({ahorro / total:.1%})")
+
+
+def informe_cache(vaciar: bool = False) -> None:
+    disco = CACHE_ANALISIS.disco
+    if disco is None:
+        print("La caché de análisis en disco está desactivada (VENDLER_CACHE vacío).")
+        return
+    if vaciar:
+        CACHE_ANALISIS.limpiar()
+        print(f"Caché vaciada: {disco.ruta}")
+        return
+    print(f"Caché de análisis: {disco.ruta}")
+    print(f"• Entradas: {len(disco)} (máximo {disco.maximo})")
+
+
+def main() -> None:
+    if len(sys.argv) > 1 and sys.argv[1] == "cache":
+        informe_cache(vaciar=sys.argv[2:3] == ["vaciar"])
+        return
+    nombre = sys.argv[1] if len(sys.argv) > 1 else "es_core_news_sm"
+    perfil = sys.argv[2] if len(sys.argv) > 2 else PERFIL_POR_DEFECTO
+    textos = sys.argv[3:] or TEXTOS_MUESTRA
+    if perfil not in PERFILES:
+        print(f"Perfil desconocido: «{perfil}». Opciones: {', '.join(PERFILES)}.")
+        return
+    informe_perfil(nombre, perfil, textos)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+Motor de detección del aktionsart, común al español (aktionsart.py) y al inglés (english.py).
+
+Cada idioma aporta un PaqueteIdioma: su modelo de spaCy, los textos de las preguntas
+y las funciones que arman las perífrasis de las pruebas (cada una con los
+paradigmas de auxiliares de su idioma).
+El flujo de pruebas, la clasificación y las funciones para preguntar al usuario
+están aquí una sola vez, de modo que un mismo proceso puede atender sesiones en
+los dos idiomas con ambos modelos cargados.
+"""
+import importlib
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence, Union
+
+from modelos import ModeloPerezoso
+
+NEGRITA = '\033[1m'
+RESET = '\033[0m'
+
+# Rasgos que maneja el motor, en el orden en que se muestran
+RASGOS = ("causativo", "estativo", "puntual", "telico", "dinamico")
+
+# Módulo que define (y registra) el paquete de cada idioma
+MODULOS_IDIOMA = {"es": "aktionsart", "en": "english"}
+
+PAQUETES: Dict[str, "PaqueteIdioma"] = {}
+
+
+@dataclass
+class PaqueteIdioma:
+    codigo: str
+    modelo: ModeloPerezoso
+    reinicio: type                          # excepción que se lanza al escribir «...»
+    respuestas_si: Sequence[str]
+    respuestas_no: Sequence[str]
+    textos: Dict[str, str]                  # avisos y plantillas de la interfaz
+    clase_rasgos: type                      # dataclass con los rasgos del predicado
+    campos_rasgos: Dict[str, str]           # rasgo del motor -> atributo de clase_rasgos
+    etiquetas_rasgos: Dict[str, str]        # rasgo del motor -> nombre que se muestra
+    clase_aktionsart: type                  # Enum con las clases aspectuales
+    subtipos: Dict[str, str]                # subtipo del motor -> miembro del Enum
+    nombre_causativo: Callable[[str], str]  # miembro no causativo -> miembro causativo
+    pruebas: Dict[str, Callable]            # pasos del flujo (ver obtener_rasgos_akt)
+    clase_datos: type                       # dataclass con los datos de la cláusula
+    extraer_datos: Callable                 # (Doc, datos) -> (éxito, verbo, infinitivo)
+    anticipar: Optional[Callable[[str], None]] = None  # empieza a analizar una cláusula en segundo plano
+
+
+def registrar(paquete: PaqueteIdioma) -> PaqueteIdioma:
+    PAQUETES[paquete.codigo] = paquete
+    return paquete
+
+
+def obtener_paquete(codigo: str) -> PaqueteIdioma:
+    """Devuelve el paquete de un idioma, importando su módulo la primera vez."""
+    if codigo not in PAQUETES:
+        importlib.import_module(MODULOS_IDIOMA[codigo])
+    return PAQUETES[codigo]
+
+
+def precargar_modelos(codigos: Optional[Sequence[str]] = None) -> None:
+    """Empieza a cargar en segundo plano los modelos de los idiomas indicados (todos, por defecto)."""
+    for codigo in codigos or MODULOS_IDIOMA:
+        obtener_paquete(codigo).modelo.precargar()
+
+
+# --- PREGUNTAS AL USUARIO ---
+
+def peticion(paquete: PaqueteIdioma, prompt: str, sugerencia: str = "") -> str:
+    import readline
+    readline.set_startup_hook(lambda: readline.insert_text(sugerencia))
+    try:
+        if "\n" in prompt or len(prompt) > 60:
+            print(prompt, end="", flush=True)
+            user = input().strip()
+        else:
+            user = input(prompt).strip()
+
+        # --- COMANDO DE RESCATE ---
+        if user == "...":
+            raise paquete.reinicio()
+
+        return user.encode('utf-8').decode('utf-8')
+    except EOFError:
+        # Sin más entrada (Ctrl-D o cliente del demonio desconectado): se termina el programa
+        raise SystemExit(0)
+    finally:
+        readline.set_startup_hook()
+
+
+def respuesta_si_no(paquete: PaqueteIdioma, pregunta: str) -> bool:
+    while True:
+        try:
+            respuesta = peticion(paquete, pregunta).lower()
+            if respuesta in paquete.respuestas_si:
+                return True
+            elif respuesta in paquete.respuestas_no:
+                return False
+            print(paquete.textos["aviso_si_no"])
+        except paquete.reinicio:
+            raise
+        except Exception as e:
+            logging.error(f"{paquete.textos['error_respuesta']}: {e}")
+
+
+def respuesta_multiple(paquete: PaqueteIdioma, pregunta: str, opciones: Sequence[Union[str, Sequence[str]]], prompt: str) -> str:
+    while True:
+        try:
+            respuesta = peticion(paquete, f"{pregunta} {prompt}").lower()
+            for opcion in opciones:
+                if isinstance(opcion, Sequence) and not isinstance(opcion, str):
+                    if respuesta in opcion:
+                        return opcion[0]
+                elif respuesta == opcion:
+                    return opcion
+            print(paquete.textos["aviso_opcion"])
+        except paquete.reinicio:
+            raise
+        except Exception as e:
+            logging.error(f"{paquete.textos['error_respuesta']}: {e}")
+
+
+# --- PERÍFRASIS ---
+
+def unir_perifrasis(*partes: str) -> str:
+    """Une las partes no vacías de una perífrasis (antes del verbo, auxiliar + forma, después)."""
+    return " ".join(parte for parte in partes if parte)
+
+
+# --- CLASIFICACIÓN ---
+
+def leer_rasgo(paquete: PaqueteIdioma, rasgos, rasgo: str) -> bool:
+    return getattr(rasgos, paquete.campos_rasgos[rasgo])
+
+
+def fijar_rasgo(paquete: PaqueteIdioma, rasgos, rasgo: str, valor: bool) -> None:
+    """Guarda el rasgo y lo anuncia (ej: «El predicado es [+estativo]»)."""
+    setattr(rasgos, paquete.campos_rasgos[rasgo], valor)
+    etiqueta = f"{'+' if valor else '-'}{paquete.etiquetas_rasgos[rasgo]}"
+    print(f"\n{NEGRITA}{paquete.textos['rasgo'].format(rasgo=etiqueta)}{RESET}")
+
+
+def subtipo_neutro(estativo: bool, puntual: bool, telico: bool, dinamico: bool) -> Optional[str]:
+    if estativo:
+        return "ESTADO"
+    elif puntual and telico:
+        return "LOGRO"
+    elif puntual and not telico:
+        return "SEMELFACTIVO"
+    elif not puntual and telico and dinamico:
+        return "REALIZACION_ACTIVA"
+    elif not puntual and not telico and dinamico:
+        return "ACTIVIDAD"
+    elif not puntual and telico and not dinamico:
+        return "REALIZACION"
+    elif not puntual and not telico and not dinamico:
+        return "PROCESO"
+    else:
+        return None
+
+
+def determinar_subtipo(paquete: PaqueteIdioma, rasgos) -> Optional[str]:
+    """Devuelve el nombre (en el Enum del idioma) de la clase aspectual sin causatividad."""
+    subtipo = subtipo_neutro(*(leer_rasgo(paquete, rasgos, r) for r in RASGOS[1:]))
+    return None if subtipo is None else paquete.subtipos[subtipo]
+
+
+def determinar_aktionsart(paquete: PaqueteIdioma, rasgos):
+    subtipo = determinar_subtipo(paquete, rasgos)
+    if subtipo is None:
+        return None
+    if leer_rasgo(paquete, rasgos, "causativo"):
+        return paquete.clase_aktionsart[paquete.nombre_causativo(subtipo)]
+    return paquete.clase_aktionsart[subtipo]
+
+
+# --- FLUJO DE PRUEBAS ---
+
+def obtener_rasgos_akt(paquete: PaqueteIdioma, oracion: str, datos_clausula):
+    """
+    Aplica las pruebas del paquete en orden: causatividad (y evento básico), limpieza de
+    adjuntos, análisis de la cláusula, estatividad y, si no es estado, puntualidad,
+    telicidad y dinamicidad.
+    """
+    pruebas = paquete.pruebas
+    rasgos = paquete.clase_rasgos()
+    # Cada versión de la cláusula se empieza a analizar apenas se conoce; el análisis
+    # del paso 3 recoge la que corresponda y las demás se descartan
+    anticipar = paquete.anticipar or (lambda _: None)
+    anticipar(oracion)
+
+    # 1. Prueba de Causatividad
+    causativo = False
+    if pruebas["causatividad"](oracion):
+        evento_basico = pruebas["evento_basico"]()
+        if evento_basico != "0":
+            causativo = True
+            oracion = evento_basico
+            anticipar(oracion)
+    fijar_rasgo(paquete, rasgos, "causativo", causativo)
+    time.sleep(0.5)
+
+    # 2. Limpieza de la cláusula
+    oracion = pruebas["limpieza"](oracion)
+    anticipar(oracion)
+    time.sleep(0.5)
+
+    # 3. Análisis de información de la cláusula
+    pruebas["info_clausula"](oracion, datos_clausula)
+    time.sleep(0.5)
+
+    # 4. Bloque de pruebas semánticas
+    estativo = pruebas["estatividad"](oracion)
+    fijar_rasgo(paquete, rasgos, "estativo", estativo)
+    time.sleep(0.5)
+
+    if not estativo:
+        fijar_rasgo(paquete, rasgos, "puntual", not pruebas["duratividad"](datos_clausula))
+        time.sleep(0.5)
+
+        fijar_rasgo(paquete, rasgos, "telico", pruebas["telicidad"](datos_clausula))
+        time.sleep(0.5)
+
+        fijar_rasgo(paquete, rasgos, "dinamico", pruebas["dinamicidad"](datos_clausula))
+        time.sleep(0.5)
+
+    return rasgos
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Extracción del verbo y sus argumentos con patrones compilados de spaCy.
+
+Un Matcher busca de una vez los candidatos a verbo (las tres pasadas que hacían
+los analizadores: raíz verbal, cualquier verbo, raíz en cláusulas muy cortas) y
+los clíticos antepuestos; un DependencyMatcher busca los dependientes del verbo
+(sujeto, objeto, objeto indirecto). Los patrones se compilan una sola vez por
+idioma, la primera vez que se usan, y sirven para cualquier Doc (también para los
+restaurados de la caché, que tienen su propio Vocab).
+
+extraer_con_bucles aplica las mismas reglas recorriendo la cláusula en Python
+(los argumentos salen de los hijos del verbo); sirve también para lo que no es un Doc de spaCy
+(ej: una conllu.OracionConllu). Ambos caminos devuelven la misma Extraccion
+(benchmarks/patrones_extraccion.py lo comprueba y los compara en tiempo).
+"""
+import os
+import threading
+from typing import Dict, NamedTuple, Optional, Tuple
+
+# En cláusulas cortas el recorrido en Python es más rápido que los matchers (ver el
+# benchmark), así que los patrones compilados se usan solo con VENDLER_PATRONES=1
+USAR_PATRONES = os.environ.get("VENDLER_PATRONES", "0") == "1"
+
+CATEGORIAS_VERBO = ["VERB", "AUX"]
+
+
+class ReglasIdioma(NamedTuple):
+    # Pasada 3: en cláusulas de hasta tantos tokens, el verbo puede ser otra categoría
+    maximo_agresivo: int
+    agresivo_solo_raiz: bool
+    excluidas_agresivo: Tuple[str, ...]
+    cliticos: Tuple[str, ...]
+    maximo_cliticos: int
+    deps_objeto: Tuple[str, ...]
+    deps_indirecto: Tuple[str, ...]
+
+
+REGLAS = {
+    "es": ReglasIdioma(
+        maximo_agresivo=4, agresivo_solo_raiz=True, excluidas_agresivo=("PRON", "DET", "ADP", "CCONJ"),
+        cliticos=("me", "te", "se", "nos", "os", "le", "les", "lo", "los", "la", "las"), maximo_cliticos=4,
+        deps_objeto=("obj",), deps_indirecto=("iobj",),
+    ),
+    "en": ReglasIdioma(
+        maximo_agresivo=2, agresivo_solo_raiz=False, excluidas_agresivo=("DET", "PRON"),
+        cliticos=(), maximo_cliticos=0,
+        deps_objeto=("dobj", "obj"), deps_indirecto=("dative", "iobj"),
+    ),
+}
+
+# Prioridad de cada pasada de búsqueda del verbo (menor gana)
+PASADAS = ("VERBO_RAIZ", "VERBO", "AGRESIVO")
+
+
+class Extraccion(NamedTuple):
+    verbo: int
+    # Clíticos antepuestos: tokens [inicio, fin) (vacío si inicio == fin)
+    cliticos: Tuple[int, int]
+    sujeto: Optional[int]
+    objeto: Optional[int]
+    indirecto: Optional[int]
+
+    def texto_cliticos(self, doc) -> str:
+        return "".join(doc[i].text.lower() for i in range(*self.cliticos))
+
+    def tramos(self, doc) -> Dict[str, object]:
+        """Los tramos del Doc: verbo, clíticos y cada argumento con todos sus dependientes."""
+        tramos = {"verbo": doc[self.verbo:self.verbo + 1], "cliticos": doc[self.cliticos[0]:self.cliticos[1]]}
+        for nombre in ("sujeto", "objeto", "indirecto"):
+            indice = getattr(self, nombre)
+            if indice is None:
+                tramos[nombre] = None
+            elif hasattr(doc[indice], "left_edge"):
+                tramos[nombre] = doc[doc[indice].left_edge.i:doc[indice].right_edge.i + 1]
+            else:
+                tramos[nombre] = doc[indice:indice + 1]
+        return tramos
+
+
+# --- PATRONES COMPILADOS ---
+
+class Patrones:
+    def __init__(self, vocab, reglas: ReglasIdioma):
+        from spacy.matcher import DependencyMatcher, Matcher
+
+        self.reglas = reglas
+        self.matcher = Matcher(vocab)
+        self.matcher.add("VERBO_RAIZ", [[{"DEP": "ROOT", "POS": {"IN": CATEGORIAS_VERBO}}]])
+        self.matcher.add("VERBO", [[{"POS": {"IN": CATEGORIAS_VERBO}}]])
+        agresivo = {"POS": {"NOT_IN": list(reglas.excluidas_agresivo)}}
+        if reglas.agresivo_solo_raiz:
+            agresivo["DEP"] = "ROOT"
+        self.matcher.add("AGRESIVO", [[agresivo]])
+        if reglas.cliticos:
+            # Solo la categoría: LOWER no está en los Doc restaurados de la caché (su Vocab no
+            # calcula atributos léxicos), así que la forma se filtra en buscar_verbo
+            self.matcher.add("CLITICO", [[{"POS": "PRON"}]])
+        self.ids = {vocab.strings[nombre]: nombre for nombre in (*PASADAS, "CLITICO")}
+
+        self.dependencias = DependencyMatcher(vocab)
+        for nombre, deps in (("sujeto", {"REGEX": "subj"}), ("objeto", {"IN": list(reglas.deps_objeto)}),
+                             ("indirecto", {"IN": list(reglas.deps_indirecto)})):
+            self.dependencias.add(nombre.upper(), [[
+                {"RIGHT_ID": "verbo", "RIGHT_ATTRS": {}},
+                {"LEFT_ID": "verbo", "REL_OP": ">", "RIGHT_ID": nombre, "RIGHT_ATTRS": {"DEP": deps}},
+            ]])
+            self.ids[vocab.strings[nombre.upper()]] = nombre
+
+    def buscar_verbo(self, doc) -> Tuple[Optional[int], set]:
+        """Índice del verbo según la primera pasada que encuentre algo, y los índices de clíticos."""
+        primeros: Dict[str, int] = {}
+        cliticos = set()
+        for id_patron, inicio, _ in self.matcher(doc):
+            nombre = self.ids[id_patron]
+            if nombre == "CLITICO":
+                if doc[inicio].text.lower() in self.reglas.cliticos:
+                    cliticos.add(inicio)
+            elif nombre not in primeros or inicio < primeros[nombre]:
+                primeros[nombre] = inicio
+        for pasada in PASADAS:
+            if pasada in primeros and (pasada != "AGRESIVO" or len(doc) <= self.reglas.maximo_agresivo):
+                return primeros[pasada], cliticos
+        return None, cliticos
+
+    def extraer(self, doc) -> Optional[Extraccion]:
+        verbo, cliticos = self.buscar_verbo(doc)
+        if verbo is None:
+            return None
+        inicio = verbo
+        while inicio > 0 and verbo - inicio < self.reglas.maximo_cliticos and inicio - 1 in cliticos:
+            inicio -= 1
+
+        argumentos: Dict[str, int] = {}
+        for id_patron, (ancla, dependiente) in self.dependencias(doc):
+            nombre = self.ids[id_patron]
+            if ancla == verbo and dependiente != verbo and dependiente < argumentos.get(nombre, len(doc)):
+                argumentos[nombre] = dependiente
+        return Extraccion(verbo, (inicio, verbo), argumentos.get("sujeto"),
+                          argumentos.get("objeto"), argumentos.get("indirecto"))
+
+
+_compilados: Dict[str, Patrones] = {}
+_candado = threading.Lock()
+
+
+def patrones(idioma: str, vocab) -> Patrones:
+    """Los patrones del idioma, compilados la primera vez (sirven para cualquier Vocab)."""
+    compilados = _compilados.get(idioma)
+    if compilados is None:
+        with _candado:
+            compilados = _compilados.get(idioma)
+            if compilados is None:
+                compilados = _compilados[idioma] = Patrones(vocab, REGLAS[idioma])
+    return compilados
+
+
+# --- RECORRIDO A MANO ---
+
+def buscar_verbo(doc, reglas: ReglasIdioma) -> Optional[int]:
+    for token in doc:
+        if token.dep_ == "ROOT" and token.pos_ in CATEGORIAS_VERBO:
+            return token.i
+    for token in doc:
+        if token.pos_ in CATEGORIAS_VERBO:
+            return token.i
+    if len(doc) <= reglas.maximo_agresivo:
+        for token in doc:
+            if (token.dep_ == "ROOT" or not reglas.agresivo_solo_raiz) and token.pos_ not in reglas.excluidas_agresivo:
+                return token.i
+    return None
+
+
+def extraer_con_bucles(doc, idioma: str) -> Optional[Extraccion]:
+    """Las mismas reglas recorriendo la cláusula en Python."""
+    reglas = REGLAS[idioma]
+    verbo = buscar_verbo(doc, reglas)
+    if verbo is None:
+        return None
+
+    inicio = verbo
+    while (inicio > 0 and verbo - inicio < reglas.maximo_cliticos
+           and doc[inicio - 1].pos_ == "PRON" and doc[inicio - 1].text.lower() in reglas.cliticos):
+        inicio -= 1
+
+    # Los Doc de spaCy dan los hijos del verbo en orden; una OracionConllu se recorre entera
+    hijos = doc[verbo].children if hasattr(doc[verbo], "children") else (
+        token for token in doc if token.head.i == verbo)
+    sujeto = objeto = indirecto = None
+    for token in hijos:
+        dep = token.dep_
+        if token.i == verbo:
+            continue
+        if "subj" in dep:
+            sujeto = token.i if sujeto is None else sujeto
+        elif dep in reglas.deps_objeto:
+            objeto = token.i if objeto is None else objeto
+        elif dep in reglas.deps_indirecto:
+            indirecto = token.i if indirecto is None else indirecto
+    return Extraccion(verbo, (inicio, verbo), sujeto, objeto, indirecto)
+
+
+def extraer(doc, idioma: str) -> Optional[Extraccion]:
+    """Verbo, clíticos y argumentos de la cláusula. None si no se encuentra un verbo."""
+    if USAR_PATRONES and hasattr(doc, "vocab"):
+        return patrones(idioma, doc.vocab).extraer(doc)
+    return extraer_con_bucles(doc, idioma)
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Sanación de lemas del verbo principal, como componente de spaCy.
+
+El modelo pequeño de español suele fallar con los pretéritos fuertes
+(estuvisteis -> «estuvistir») y con algunas formas de vosotros. Aquí se elige el
+verbo de la cláusula (con los patrones de patrones.py), se corrige su lema, se juntan los clíticos que lo preceden
+y se deduce la persona.
+
+Lema y persona salen de una sola consulta al índice inverso de conjugacion.py
+(forma -> todas sus lecturas (infinitivo, persona, tiempo)). Si la forma tiene
+varios infinitivos (fue: ser/ir) decide spaCy; si tiene varias personas
+(cantaba: 1s/3s), el pronombre sujeto o la morfología de spaCy, siempre dentro
+de esas lecturas. Las formas de verbos que no están en el léxico usan las
+reglas por terminación de abajo.
+
+Como componente del pipeline («sanacion_lemas») deja el resultado en extensiones,
+de modo que se calcula dentro de nlp.pipe (por lotes); en la caché de modelos.py no se
+guarda, sino que se recalcula con el léxico vigente al restaurar el Doc:
+    doc._.verbo_sanado        índice del verbo (-1 si no hay verbo)
+    token._.lema_sano         lema corregido
+    token._.cliticos          clíticos antepuestos, juntos (ej: "se", "melo")
+    token._.persona_numero    "1s" ... "3p"
+
+leer(doc) devuelve el VerboSanado desde las extensiones si el componente ya pasó,
+o lo calcula en el momento (ej: oraciones CoNLL-U o modelos sin el componente).
+"""
+import threading
+from typing import NamedTuple, Optional, Tuple
+
+import conjugacion
+import patrones
+
+NOMBRE_COMPONENTE = "sanacion_lemas"
+
+# Formas que no están en el índice. Terminación -> (letras a quitar, terminación del
+# infinitivo), cuando el lema de spaCy no es un infinitivo
+TERMINACIONES_LEMA = (
+    # Singular
+    ("é", 1, "ar"), ("aste", 4, "ar"), ("ó", 1, "ar"), ("í", 1, "er"), ("iste", 4, "er"),
+    # Plural
+    ("amos", 4, "ar"), ("aron", 4, "ar"), ("imos", 4, "er"), ("ieron", 5, "er"),
+    # Vosotros
+    ("asteis", 6, "ar"), ("isteis", 6, "er"),
+)
+
+TERMINACIONES_PERSONA = (
+    (("é", "í"), "1s"),
+    (("aste", "iste", "as", "es"), "2s"),
+    (("ó",), "3s"),
+    (("amos", "emos", "imos"), "1p"),
+    (("asteis", "isteis", "áis", "éis", "ís"), "2p"),
+    (("aron", "ieron", "an", "en"), "3p"),
+)
+
+PRONOMBRES_SUJETO = (
+    (("yo",), "1s"), (("tú", "vos"), "2s"), (("nosotros",), "1p"),
+    (("vosotros",), "2p"), (("ellos", "ellas"), "3p"),
+)
+
+PERSONA_MORFOLOGIA = {
+    ("1", "Sing"): "1s", ("2", "Sing"): "2s", ("3", "Sing"): "3s",
+    ("1", "Plur"): "1p", ("2", "Plur"): "2p", ("3", "Plur"): "3p",
+}
+
+
+class VerboSanado(NamedTuple):
+    indice: int
+    lema: str
+    cliticos: str
+    persona_numero: str
+
+
+# --- REGLAS ---
+
+def sanar_lema(texto_verbo: str, lema: str, lecturas: Tuple[conjugacion.Lectura, ...] = ()) -> str:
+    infinitivos = {lectura.infinitivo for lectura in lecturas}
+    if lema in infinitivos:
+        return lema
+    if len(infinitivos) == 1:
+        return lecturas[0].infinitivo
+    if lema.endswith(("ar", "er", "ir", "ír")):
+        return lema
+    for terminacion, quitar, final in TERMINACIONES_LEMA:
+        if texto_verbo.endswith(terminacion):
+            return texto_verbo[:-quitar] + final
+    return lema
+
+
+def detectar_persona(doc, verbo, lecturas: Tuple[conjugacion.Lectura, ...] = ()) -> str:
+    """Persona del verbo; con lecturas (las del lema elegido), una de las suyas."""
+    personas = list(dict.fromkeys(lectura.persona for lectura in lecturas if lectura.persona))
+    if len(personas) == 1:
+        return personas[0]
+    if not personas:
+        texto_verbo = verbo.text.lower()
+        for terminaciones, persona in TERMINACIONES_PERSONA:
+            if texto_verbo.endswith(terminaciones):
+                return persona
+    palabras_sujeto = doc[:verbo.i].text.lower().split()
+    for pronombres, persona in PRONOMBRES_SUJETO:
+        if any(pronombre in palabras_sujeto for pronombre in pronombres) and (not personas or persona in personas):
+            return persona
+    morfologia = verbo.morph.to_dict()
+    persona = PERSONA_MORFOLOGIA.get((morfologia.get("Person", "3"), morfologia.get("Number", "Sing")), "3s")
+    if personas and persona not in personas:
+        # La morfología contradice la forma: tercera persona si es posible (cantaba), si no la primera lectura
+        persona = "3s" if "3s" in personas else personas[0]
+    return persona
+
+
+def sanar(doc) -> Optional[VerboSanado]:
+    """Aplica las reglas a un Doc (o algo que se recorra igual). None si no hay verbo."""
+    extraccion = patrones.extraer(doc, "es")
+    if extraccion is None:
+        return None
+    verbo = doc[extraccion.verbo]
+    texto_verbo = verbo.text.lower()
+    lecturas = conjugacion.LEXICO_CONJUGACION.actual().lecturas(texto_verbo)
+    lema = sanar_lema(texto_verbo, verbo.lemma_.lower(), lecturas)
+    return VerboSanado(
+        extraccion.verbo,
+        lema,
+        extraccion.texto_cliticos(doc),
+        detectar_persona(doc, verbo, tuple(lectura for lectura in lecturas if lectura.infinitivo == lema)),
+    )
+
+
+# --- COMPONENTE DE SPACY ---
+
+def componente(doc):
+    """El componente: calcula una vez y guarda el resultado en las extensiones."""
+    resultado = sanar(doc)
+    if resultado is None:
+        doc._.verbo_sanado = -1
+        return doc
+    verbo = doc[resultado.indice]
+    verbo._.lema_sano = resultado.lema
+    verbo._.cliticos = resultado.cliticos
+    verbo._.persona_numero = resultado.persona_numero
+    doc._.verbo_sanado = resultado.indice
+    return doc
+
+
+_registrado = False
+_candado = threading.Lock()
+
+
+def registrar() -> None:
+    """Registra las extensiones y el componente (una sola vez; importa spaCy)."""
+    global _registrado
+    if _registrado:
+        return
+    with _candado:
+        if _registrado:
+            return
+        from spacy.language import Language
+        from spacy.tokens import Doc, Token
+
+        Doc.set_extension("verbo_sanado", default=None, force=True)
+        Token.set_extension("lema_sano", default=None, force=True)
+        Token.set_extension("cliticos", default="", force=True)
+        Token.set_extension("persona_numero", default=None, force=True)
+        Language.component(NOMBRE_COMPONENTE, func=componente)
+        _registrado = True
+
+
+def agregar(nlp) -> None:
+    """Agrega el componente al final del pipeline (después del lematizador)."""
+    registrar()
+    if NOMBRE_COMPONENTE not in nlp.pipe_names:
+        nlp.add_pipe(NOMBRE_COMPONENTE, last=True)
+
+
+def leer(doc) -> Optional[VerboSanado]:
+    """El resultado del componente si ya pasó por este Doc; si no, se calcula ahora."""
+    if not hasattr(doc, "_"):
+        # No es un Doc de spaCy (ej: conllu.OracionConllu)
+        return sanar(doc)
+    # Un Doc restaurado de la caché antes de que cargue el modelo no las trae: se calculan aquí
+    registrar()
+    indice = doc._.verbo_sanado
+    if indice is None:
+        return sanar(doc)
+    if indice < 0:
+        return None
+    verbo = doc[indice]
+    return VerboSanado(indice, verbo._.lema_sano, verbo._.cliticos, verbo._.persona_numero)
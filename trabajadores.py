@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Procesos trabajadores que comparten la memoria del proceso padre (pre-fork).
+
+El padre carga una sola vez los modelos de spaCy y los léxicos, congela el
+recolector de basura (gc.freeze) y luego crea los trabajadores con fork. Como
+los objetos congelados ya no se recorren ni se modifican al recolectar, sus
+páginas siguen compartidas (copy-on-write) entre todos los hijos.
+"""
+import gc
+import logging
+import os
+import signal
+from typing import Callable, Dict, List
+
+
+def preparar_carga() -> None:
+    """Llamar antes de cargar modelos y léxicos: evita recolecciones que ensucien páginas a medio cargar."""
+    gc.disable()
+
+
+def congelar_memoria() -> None:
+    """Llamar justo antes de hacer fork: lo cargado hasta aquí queda fuera del recolector."""
+    gc.collect()
+    gc.freeze()
+
+
+def memoria_proceso(pid: int) -> Dict[str, int]:
+    """
+    Memoria de un proceso en kB, leída de /proc (solo Linux).
+    rss: residente total; pss: parte proporcional de las páginas compartidas;
+    compartida / privada: páginas compartidas con otros procesos o exclusivas de este.
+    """
+    memoria = {"rss": 0, "pss": 0, "compartida": 0, "privada": 0}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for linea in f:
+                campo, _, resto = linea.partition(":")
+                valor = resto.split()
+                if not valor or not valor[0].isdigit():
+                    continue
+                kb = int(valor[0])
+                if campo == "Rss":
+                    memoria["rss"] = kb
+                elif campo == "Pss":
+                    memoria["pss"] = kb
+                elif campo in ("Shared_Clean", "Shared_Dirty"):
+                    memoria["compartida"] += kb
+                elif campo in ("Private_Clean", "Private_Dirty"):
+                    memoria["privada"] += kb
+    except OSError:
+        pass
+    return memoria
+
+
+def informe_memoria(pids: List[int]) -> str:
+    lineas = [f"{'PID':>8} {'RSS':>10} {'PSS':>10} {'compartida':>12} {'privada':>10}"]
+    for pid in pids:
+        m = memoria_proceso(pid)
+        lineas.append(f"{pid:>8} {m['rss'] / 1024:8.1f}MB {m['pss'] / 1024:8.1f}MB "
+                      f"{m['compartida'] / 1024:10.1f}MB {m['privada'] / 1024:8.1f}MB")
+    return "\n".join(lineas)
+
+
+class PiscinaPrefork:
+    """Mantiene «cantidad» hijos ejecutando «trabajo»; si alguno termina, se crea otro."""
+
+    def __init__(self, cantidad: int, trabajo: Callable[[], None]):
+        self.cantidad = cantidad
+        self.trabajo = trabajo
+        self.pids: List[int] = []
+        self._activa = False
+
+    def _crear_trabajador(self) -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            signal.signal(signal.SIGUSR1, signal.SIG_DFL)
+            gc.enable()
+            codigo = 0
+            try:
+                self.trabajo()
+            except KeyboardInterrupt:
+                pass
+            except Exception as e:
+                logging.error(f"Trabajador {os.getpid()} terminó con error: {e}")
+                codigo = 1
+            finally:
+                os._exit(codigo)
+        self.pids.append(pid)
+
+    def iniciar(self) -> None:
+        congelar_memoria()
+        self._activa = True
+        for _ in range(self.cantidad):
+            self._crear_trabajador()
+
+    def vigilar(self) -> None:
+        """Bloquea mientras la piscina esté activa, reponiendo los trabajadores que mueran."""
+        while self._activa:
+            try:
+                pid, _ = os.wait()
+            except ChildProcessError:
+                break
+            except InterruptedError:
+                continue
+            if pid in self.pids:
+                self.pids.remove(pid)
+                if self._activa:
+                    logging.warning(f"El trabajador {pid} terminó; se crea uno nuevo.")
+                    self._crear_trabajador()
+
+    def detener(self) -> None:
+        self._activa = False
+        for pid in self.pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in self.pids:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        self.pids = []
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Vía rápida sin spaCy para cláusulas cortas en español ("Pedro corrió", "María sabe inglés").
+
+Del índice inverso de conjugacion.py (en memoria o compilado) se toman las
+lecturas de indicativo de cada palabra (presente, pretérito, imperfecto, futuro
+y condicional) -> (infinitivo, persona/número). La cláusula se separa en palabras con una expresión
+regular; si exactamente una palabra es una forma finita conocida y su lectura no
+es ambigua, se llenan los DatosClause como lo haría aktionsart.extraer_datos.
+En cualquier otro caso (ninguna o varias formas, lectura ambigua, perífrasis con
+infinitivo, gerundio o participio, cláusula larga) se devuelve None y se usa spaCy.
+
+Con VENDLER_VIA_RAPIDA=0 se desactiva.
+"""
+import os
+import re
+from typing import FrozenSet, List, NamedTuple, Optional, Tuple
+
+import conjugacion
+
+ACTIVA = os.environ.get("VENDLER_VIA_RAPIDA", "1") != "0"
+
+# Las cláusulas más largas suelen traer subordinadas o perífrasis: mejor spaCy
+MAXIMO_PALABRAS = 6
+
+CLITICOS = {"me", "te", "se", "nos", "os", "le", "les", "lo", "los", "la", "las"}
+
+PRONOMBRES_SUJETO = {
+    "yo": "1s", "tú": "2s", "vos": "2s", "él": "3s", "ella": "3s", "usted": "3s",
+    "nosotros": "1p", "nosotras": "1p", "vosotros": "2p", "vosotras": "2p",
+    "ellos": "3p", "ellas": "3p", "ustedes": "3p",
+}
+
+PALABRA = re.compile(r"\w+|[^\w\s]")
+
+
+class TablaFlexion(NamedTuple):
+    no_finitas: FrozenSet[str]    # infinitivos, gerundios y participios conocidos
+    no_verbos: FrozenSet[str]     # palabras que casi nunca son el verbo de la cláusula
+
+
+# --- TABLA ---
+
+def no_finitas_regulares(infinitivo: str) -> List[str]:
+    raiz = infinitivo[:-2]
+    if infinitivo.endswith("ar"):
+        return [infinitivo, raiz + "ando", raiz + "ado"]
+    return [infinitivo, raiz + "iendo", raiz + "yendo", raiz + "ido", raiz + "ído"]
+
+
+def construir_tabla(conjugador: conjugacion.Conjugador) -> TablaFlexion:
+    no_finitas = set()
+    for verbo in conjugador.verbos:
+        no_finitas.update(no_finitas_regulares(verbo))
+        no_finitas.update(conjugador.formas_no_finitas(verbo))
+
+    return TablaFlexion(
+        no_finitas=frozenset(no_finitas),
+        no_verbos=frozenset(conjugador.datos["no_verbos"]),
+    )
+
+
+def tabla() -> TablaFlexion:
+    """La tabla de la instantánea vigente de conjugacion.LEXICO_CONJUGACION."""
+    return conjugacion.LEXICO_CONJUGACION.actual().indice("via_rapida", construir_tabla)
+
+
+def lecturas_indicativas(conjugador: conjugacion.Conjugador, palabra: str) -> Tuple[Tuple[str, str], ...]:
+    """((infinitivo, persona), ...) de la palabra como forma de indicativo; () si no lo es."""
+    return tuple(dict.fromkeys(
+        (lectura.infinitivo, lectura.persona) for lectura in conjugador.lecturas(palabra)
+        if lectura.tiempo in conjugacion.TIEMPOS_INDICATIVO))
+
+
+# --- ANÁLISIS ---
+
+def elegir_lectura(lecturas: Tuple[Tuple[str, str], ...], palabras_antes: List[str]) -> Optional[Tuple[str, str]]:
+    """Resuelve las lecturas de una forma; None si sigue siendo ambigua."""
+    if len(lecturas) == 1:
+        return lecturas[0]
+    if len({verbo for verbo, _ in lecturas}) > 1:
+        return None
+    # Mismo verbo, varias personas (cantaba: 1s/3s): decide el sujeto
+    personas = {persona for _, persona in lecturas}
+    for palabra in palabras_antes:
+        if palabra in PRONOMBRES_SUJETO:
+            persona = PRONOMBRES_SUJETO[palabra]
+            return (lecturas[0][0], persona) if persona in personas else None
+    sujeto_nominal = [p for p in palabras_antes if p not in CLITICOS]
+    if sujeto_nominal:
+        terceras = [lectura for lectura in lecturas if lectura[1].startswith("3")]
+        if len(terceras) == 1:
+            return terceras[0]
+    return None
+
+
+def analizar(oracion: str, datos_clausula, generar_formas) -> Optional[Tuple[bool, str, str]]:
+    """
+    Llena datos_clausula sin spaCy. Devuelve lo mismo que analizar_automaticamente
+    (éxito, verbo, infinitivo) o None si hay que usar el modelo.
+    generar_formas es aktionsart.generar_formas_verbales (infinitivo -> gerundio, participio).
+    """
+    if not ACTIVA:
+        return None
+    conjugador = conjugacion.LEXICO_CONJUGACION.actual()
+    tabla_flexion = conjugador.indice("via_rapida", construir_tabla)
+    tokens = list(PALABRA.finditer(oracion))
+    palabras = [t for t in tokens if t.group()[0].isalnum() or t.group()[0] == "_"]
+    if not palabras or len(palabras) > MAXIMO_PALABRAS:
+        return None
+
+    candidatos = []
+    for posicion, token in enumerate(palabras):
+        palabra = token.group().lower()
+        lecturas = lecturas_indicativas(conjugador, palabra)
+        # Una forma finita real no se descarta por coincidir con una no finita (ej: «ido»)
+        if not lecturas and palabra in tabla_flexion.no_finitas:
+            # Perífrasis o formas no finitas: que decida spaCy
+            return None
+        if lecturas and palabra not in tabla_flexion.no_verbos:
+            candidatos.append((posicion, lecturas))
+    if len(candidatos) != 1:
+        return None
+
+    posicion, lecturas = candidatos[0]
+    verbo = palabras[posicion]
+    antes = [p.group().lower() for p in palabras[:posicion]]
+    lectura = elegir_lectura(lecturas, antes)
+    if lectura is None:
+        return None
+    infinitivo, persona = lectura
+
+    gerundio, participio = generar_formas(infinitivo)
+    if not gerundio or not participio:
+        return None
+
+    cliticos = []
+    for palabra in reversed(antes[-4:]):
+        if palabra not in CLITICOS:
+            break
+        cliticos.insert(0, palabra)
+
+    datos_clausula.infinitivo = infinitivo + "".join(cliticos)
+    datos_clausula.gerundio = gerundio
+    datos_clausula.participio = participio
+    datos_clausula.persona_numero = persona
+    datos_clausula.sujeto = oracion[:verbo.start()].strip()
+    datos_clausula.complementos = oracion[verbo.end():].strip()
+    return True, verbo.group(), infinitivo